@@ -2,14 +2,16 @@
 
 import abc
 import hashlib
+import heapq
 import logging  # active only in rank 0 (init)
 import os
 import weakref
 from collections import defaultdict
 from contextlib import contextmanager
-from io import StringIO
+from itertools import pairwise
 from pathlib import Path
 
+import libsonata
 import numpy as np
 
 from .connection_manager import ConnectionManagerBase
@@ -23,6 +25,7 @@ from .core import (
 )
 from .core.configuration import (
     ConfigurationError,
+    CpuAssignEngine,
     GlobalConfig,
     LoadBalanceMode,
     LogLevel,
@@ -32,6 +35,7 @@ from .core.configuration import (
 from .core.nodeset import SelectionNodeSet
 from .io import cell_readers
 from .metype import Cell_V6, EmptyCell, PointCell
+from .morphio_wrapper import MorphologyCache, MorphologyReadAhead
 from .target_manager import TargetSpec
 from .utils import compat
 from .utils.logging import log_verbose
@@ -270,7 +274,14 @@ class CellManagerBase(_CellManager):
         self._local_nodes.clear_cell_info()
 
     @mpi_no_errors
-    def _instantiate_cells(self, cell_type=None, **_opts):
+    def _instantiate_cells(self, cell_type=None, morphology_files=None, **_opts):
+        """Instantiates the local cells
+
+        Args:
+            cell_type: The class of the cells
+            morphology_files: The morphology file of each cell, in order, to be read ahead
+                (See MorphologyReadAhead)
+        """
         cell_type = cell_type or self.CellType
         if SimConfig.crash_test_mode:
             cell_type = PointCell
@@ -288,9 +299,15 @@ class CellManagerBase(_CellManager):
                 self._local_nodes.iter_cell_info(), len(self._local_nodes)
             )
 
-        for gid, cell_info in gid_info_iter:
-            cell = cell_type(gid, cell_info, self._circuit_conf)
-            self._store_cell(gid + cell_offset, cell)
+        # Cells sharing a morphology reuse it. Dropped once all cells are built
+        with (
+            MorphologyCache.enabled(SimConfig.morphology_cache * 1024**2),
+            MorphologyReadAhead(morphology_files, SimConfig.morphology_prefetch) as read_ahead,
+        ):
+            for i, (gid, cell_info) in enumerate(gid_info_iter):
+                read_ahead.advance(i)
+                cell = cell_type(gid, cell_info, self._circuit_conf)
+                self._store_cell(gid + cell_offset, cell)
 
     @mpi_no_errors
     def _instantiate_cells_dry(self, cell_type, skip_metypes, **_opts):
@@ -557,7 +574,13 @@ class CellDistributor(CellManagerBase):
             "Loading '%s' morphologies from: %s", cell_type.morpho_extension, conf.MorphologyPath
         )
         if dry_run_stats_obj is None:
-            super()._instantiate_cells(cell_type, **opts)
+            morphology_files = None
+            if SimConfig.morphology_prefetch and not SimConfig.crash_test_mode:
+                morphology_files = [
+                    cell_type.morphology_file(meinfo, conf)
+                    for _, meinfo in self._local_nodes.iter_cell_info()
+                ]
+            super()._instantiate_cells(cell_type, morphology_files=morphology_files, **opts)
         else:
             cur_metypes_mem = dry_run_stats_obj.metype_memory
             memory_dict = self._instantiate_cells_dry(cell_type, cur_metypes_mem, **opts)
@@ -578,7 +601,11 @@ class LoadBalance:
     NOTE: Given the heavy costs of computing load balance, some state files are created
     which allow the balance info to be reused. These are
 
-     - cx_{TARGET}.dat: File with complexity information for the cells of a given target
+     - cx_{TARGET}.{COLUMN}.npy: Binary complexity information for the cells of a given
+       target. Columns are the cell gids, their complexities, the multisplit data of all
+       cells (concatenated) and its offsets per cell, the latter marking the data complete.
+     - cx_{TARGET}.dat: The same complexity information in text, as read by Neuron tools.
+       Exported from the binary files when needed.
      - cx_{TARGET}.{CPU_COUNT}.dat: The file assigning cells/pieces to individual CPUs ranks.
 
     For more information refer to the developer documentation.
@@ -595,6 +622,8 @@ class LoadBalance:
     _circuit_lb_dir_tpl = "_loadbal_%s.%s"  # Placeholders are (file_src_hash, population)
     _cx_filename_tpl = "cx_%s#.dat"  # use # to well delimiter the target name
     _cpu_assign_filename_tpl = "cx_%s#.%s.dat"  # prefix must be same (imposed by Neuron)
+    _cx_data_filename_tpl = "cx_%s#.%s.npy"  # Placeholders are (target, column)
+    _cx_data_columns = ("gids", "complexities", "ms", "offsets")
 
     def __init__(self, balance_mode, nodes_path, pop, target_manager, target_cpu_count=None):
         """Creates a new Load Balance object, associated with a given node file"""
@@ -603,6 +632,7 @@ class LoadBalance:
         self._target_manager = target_manager
         self._valid_loadbalance = set()
         self.population = pop or ""
+        self._nodes_path = nodes_path
         self._lb_dir, self._cx_targets = self._get_circuit_loadbal_dir(nodes_path, self.population)
         log_verbose("Found existing targets with loadbal: %s", self._cx_targets)
 
@@ -620,12 +650,17 @@ class LoadBalance:
 
     @classmethod
     def _get_lbdir_targets(cls, lb_dir: Path) -> list:
-        """Inspects the load-balance folder and detects which targets are load balanced"""
-        prefix, suffix = cls._cx_filename_tpl.split("%s")
-        return {
-            fname.name[len(prefix) : -len(suffix)]
-            for fname in lb_dir.glob(cls._cx_filename_tpl.replace("%s", "*"))
-        }
+        """Inspects the load-balance folder and detects which targets are load balanced.
+        Targets may have binary complexity files or only (previously generated) text ones.
+        """
+        targets = set()
+        for filename_tpl in (cls._cx_filename_tpl, cls._cx_data_filename_tpl % ("%s", "offsets")):
+            prefix, suffix = filename_tpl.split("%s")
+            targets.update(
+                fname.name[len(prefix) : -len(suffix)]
+                for fname in lb_dir.glob(filename_tpl.replace("%s", "*"))
+            )
+        return targets
 
     @run_only_rank0
     def valid_load_distribution(self, target_spec: TargetSpec) -> bool:
@@ -665,6 +700,12 @@ class LoadBalance:
             self._cpu_assign(target_name)
             self._valid_loadbalance.add(target_name)
             return True
+
+        # Otherwise reuse the complexities of any target, estimating those of the new cells
+        if SimConfig.lb_estimate_cx and self._estimate_cell_complexity(target_spec):
+            self._cpu_assign(target_name)
+            self._valid_loadbalance.add(target_name)
+            return True
         return False
 
     # -
@@ -680,33 +721,108 @@ class LoadBalance:
 
         logging.info("Attempt reusing cx files from other targets...")
         target_gids = self._target_manager.get_target(target_spec).gids(raw_gids=True)
-        cx_other = {}
 
         for previous_target in self._cx_targets:
             log_verbose("Trying previous cx file on target %s", previous_target)
-            ref_filename = self._cx_filename(previous_target)
-            if self._cx_contains_gids(ref_filename, target_gids, cx_other):
+            rows = self._cx_gid_rows(previous_target, target_gids)
+            if rows is not None:
                 break  # done!
             log_verbose("  - Target is not a superset. Ignoring.")
         else:
             logging.info(" => Did not find any suitable target")
             return False
 
-        new_cx_filename = self._cx_filename(target_spec.simple_name)
+        new_target = target_spec.simple_name
         logging.info(
             "Target %s is a subset of the target %s. Generating %s",
             target_spec.name,
             previous_target,
-            new_cx_filename,
+            self._cx_data_filename(new_target, "*"),
         )
 
-        # Write the new cx file since Neuron needs it to do CPU assignment
-        with open(new_cx_filename, "w", encoding="utf-8") as newfile:
-            self._write_msdat_dict(newfile, cx_other, target_gids)
+        ms_sizes, ms_data = self._select_ms(self._load_cx_data(previous_target), rows)
+        self._cx_filename(new_target).unlink(missing_ok=True)  # stale text export
+        self._write_cx_data(new_target, ms_sizes, ms_data)
         # register
         self._cx_targets.add(target_spec.simple_name)
         return True
 
+    # -
+    def _estimate_cell_complexity(self, target_spec: TargetSpec) -> bool:
+        """Derive the complexities of a target from all the cx files of the circuit, whatever
+        the targets (and CPU count) they were computed for.
+        Complexities of cells missing from all of them are estimated as the mean of the cells
+        of the same metype (or all cells if there are none). These cells are not split.
+        """
+        cx_datas = [self._load_cx_data(name) for name in sorted(self._cx_targets)]
+        cx_datas = [cx_data for cx_data in cx_datas if cx_data is not None]
+        if not cx_datas:
+            logging.info(" => No cell complexities to estimate from")
+            return False
+
+        logging.info("Estimating cell complexities from all cx files...")
+        target_gids = self._target_manager.get_target(target_spec).gids(raw_gids=True)
+        target_gids = np.asarray(target_gids, dtype="int64")
+        # Pool the multisplit data of all the cx files. Gids may repeat, first ones are used
+        pool = {
+            name: np.concatenate([cx_data[name] for cx_data in cx_datas])
+            for name in ("gids", "complexities", "ms")
+        }
+        pool_sizes = np.concatenate([np.diff(cx_data["offsets"]) for cx_data in cx_datas])
+        known_gids, known_rows = np.unique(pool["gids"], return_index=True)
+        missing_gids = np.setdiff1d(target_gids, known_gids)
+
+        if len(missing_gids):
+            logging.info(
+                " => Estimating the complexity of %d out of %d cells",
+                len(missing_gids),
+                len(target_gids),
+            )
+            missing_cx = self._estimate_metype_complexity(
+                known_gids, pool["complexities"][known_rows], missing_gids
+            )
+            # Add them to the pool as whole cells: gid, complexity and no pieces
+            missing_ms = np.column_stack([missing_gids, missing_cx, np.zeros_like(missing_cx)])
+            pool["gids"] = np.concatenate([pool["gids"], missing_gids])
+            pool["ms"] = np.concatenate([pool["ms"], missing_ms.ravel()])
+            pool_sizes = np.concatenate([pool_sizes, np.full(len(missing_gids), 3)])
+            known_gids, known_rows = np.unique(pool["gids"], return_index=True)
+
+        pool["offsets"] = np.cumsum([0, *pool_sizes])
+        rows = known_rows[np.searchsorted(known_gids, target_gids)]
+        ms_sizes, ms_data = self._select_ms(pool, rows)
+        self._cx_filename(target_spec.simple_name).unlink(missing_ok=True)  # stale text export
+        self._write_cx_data(target_spec.simple_name, ms_sizes, ms_data)
+        self._cx_targets.add(target_spec.simple_name)
+        return True
+
+    def _estimate_metype_complexity(self, known_gids, known_cx, gids):
+        """Estimates the complexity of the given gids as the mean of the known cells with the
+        same metype (mtype and etype, as available), or of all known cells otherwise
+        """
+        storage = libsonata.NodeStorage(self._nodes_path)
+        population = storage.open_population(
+            self.population or next(iter(storage.population_names))
+        )
+        all_gids = np.concatenate([known_gids, gids])
+        selection = libsonata.Selection(all_gids)
+        attr_codes = [
+            np.unique(population.get_attribute(attr_name, selection), return_inverse=True)[1]
+            for attr_name in ("mtype", "etype")
+            if attr_name in population.attribute_names
+        ]
+        metypes = np.zeros(len(all_gids), dtype="int64")
+        if attr_codes:
+            metype_codes = np.column_stack([codes.reshape(-1) for codes in attr_codes])
+            metypes = np.unique(metype_codes, axis=0, return_inverse=True)[1].reshape(-1)
+        known_metypes, metypes = metypes[: len(known_gids)], metypes[len(known_gids) :]
+        metype_sum = np.bincount(known_metypes, known_cx, minlength=metypes.max(initial=0) + 1)
+        metype_count = np.bincount(known_metypes, minlength=len(metype_sum))
+        mean_cx = known_cx.mean() if len(known_cx) else 1.0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            estimates = metype_sum[metypes] / metype_count[metypes]
+        return np.where(metype_count[metypes] > 0, estimates, mean_cx)
+
     # -
     def _cx_valid(self, target_spec) -> bool:
         """Determine if valid complexity files exist for the provided circuit and
@@ -718,7 +834,6 @@ class LoadBalance:
             return False
 
         target_name = target_spec.simple_name
-        cx_filename = self._cx_filename(target_name)
 
         if target_name not in self._cx_targets:
             logging.info(" => No Cx files available for requested target")
@@ -726,25 +841,62 @@ class LoadBalance:
 
         if target_spec:  # target provided, otherwise everything
             target_gids = self._target_manager.get_target(target_spec).gids(raw_gids=True)
-            if not self._cx_contains_gids(cx_filename, target_gids):
-                logging.warning(" => %s invalid: changed target definition!", cx_filename)
+            if self._cx_gid_rows(target_name, target_gids) is None:
+                logging.warning(
+                    " => %s invalid: changed target definition!",
+                    self._cx_data_filename(target_name, "*"),
+                )
                 return False
         return True
 
-    @classmethod
-    def _cx_contains_gids(cls, cxpath, target_gids, out_cx=None) -> bool:
-        """Checks a cx file contains complexities for given gids"""
-        if not cxpath.is_file():
-            log_verbose("  - cxpath doesnt exist: %s", cxpath)
-            return False
-        with open(cxpath, encoding="utf-8") as f:
-            cx_saved = cls._read_msdat(f)
-        if not set(cx_saved.keys()) >= set(target_gids):
-            log_verbose("  - Not all GIDs in target %s %s", set(cx_saved.keys()), set(target_gids))
-            return False
-        if out_cx is not None:
-            out_cx.update(cx_saved)
-        return True
+    def _cx_gid_rows(self, target_name, target_gids):
+        """Finds the rows of the given gids in the complexity data of a target.
+
+        Returns: The array of rows, or None if the data is missing or lacks some gids
+        """
+        cx_data = self._load_cx_data(target_name)
+        if cx_data is None:
+            return None
+        target_gids = np.asarray(target_gids, dtype="int64")
+        cx_gids = cx_data["gids"]
+        sort_idx = np.argsort(cx_gids, kind="stable")
+        found_idx = np.searchsorted(cx_gids, target_gids, sorter=sort_idx)
+        rows = sort_idx[np.minimum(found_idx, len(cx_gids) - 1)] if len(cx_gids) else found_idx
+        if len(target_gids) and not (len(cx_gids) and np.all(cx_gids[rows] == target_gids)):
+            log_verbose("  - Not all GIDs in target")
+            return None
+        return rows
+
+    @staticmethod
+    def _select_ms(cx_data, rows):
+        """Selects the multisplit data of the cells in the given rows of complexity data
+
+        Returns: A tuple with the multisplit data size of each cell and all their data
+        """
+        offsets = cx_data["offsets"]
+        ms_sizes = offsets[rows + 1] - offsets[rows]
+        range_starts = np.repeat(offsets[rows] - (np.cumsum(ms_sizes) - ms_sizes), ms_sizes)
+        return ms_sizes, cx_data["ms"][np.arange(ms_sizes.sum()) + range_starts]
+
+    def _load_cx_data(self, target_name):
+        """Memory-maps the binary complexity data of a target.
+        Complexity files in text (previous format) are converted once.
+
+        Returns: A dict with the data columns, or None if there is no complexity data
+        """
+        if not self._cx_data_filename(target_name, "offsets").is_file():
+            cx_filename = self._cx_filename(target_name)
+            if not cx_filename.is_file():
+                log_verbose("  - cx files dont exist: %s", self._cx_data_filename(target_name, "*"))
+                return None
+            logging.info("Converting complexity file %s", cx_filename)
+            cx_values = cx_filename.read_text(encoding="utf-8").split()[2:]  # skip header
+            ms_data = np.array(cx_values, dtype="float64")
+            self._write_cx_data(target_name, self._ms_sizes(ms_data), ms_data)
+        return {
+            name: np.load(self._cx_data_filename(target_name, name), mmap_mode="r")
+            for name in self._cx_data_columns
+        }
 
     @contextmanager
     def generate_load_balance(self, target_spec, cell_distributor):
@@ -787,18 +939,13 @@ class LoadBalance:
         for cell in cell_distributor.cells:
             mcomplex.cell_complexity(cell.CellRef)
             mcomplex.multisplit(cell.raw_gid, lcx, tmp)
-            ms_list.append(tmp.c())
+            ms_list.append(tmp.as_numpy().copy())
 
-        # To output build independently the contents of the file then append
-        ostring = StringIO()
-        for ms in ms_list:
-            self._write_msdat(ostring, ms)
-
-        all_ranks_cx = MPI.py_gather(ostring.getvalue(), 0)
+        # Ranks write their own cells to the binary files, no gathering
         if MPI.rank == 0:
-            with open(out_filename, "w", encoding="utf-8") as fp:
-                fp.write(f"1\n{cell_distributor.total_cells}\n")
-                fp.writelines(all_ranks_cx)
+            out_filename.unlink(missing_ok=True)  # stale text export
+        ms_data = np.concatenate(ms_list) if ms_list else np.empty(0)
+        self._write_cx_data(target_str, [len(ms) for ms in ms_list], ms_data, collective=True)
 
         # register
         self._cx_targets.add(target_str)
@@ -832,72 +979,237 @@ class LoadBalance:
 
     @run_only_rank0
     def _cpu_assign(self, target_name):
-        """Assigns cells to 'prospective_hosts' cpus using mymetis3.
+        """Assigns cells to 'prospective_hosts' cpus using mymetis3 or the LPT engine.
         Results are written to file. basename.<NCPU>.dat
         """
-        logging.info("Assigning Cells <-> %d CPUs [mymetis3]", self.target_cpu_count)
+        engine = SimConfig.lb_cpu_assign
+        logging.info("Assigning Cells <-> %d CPUs [%s]", self.target_cpu_count, engine.to_string())
+        if not self._cx_filename(target_name).is_file():
+            self._export_msdat(target_name)  # BalanceInfo always reads the text cx file
+        if engine == CpuAssignEngine.LPT:
+            self._cpu_assign_lpt(target_name)
+            return
         base_filename = self._cx_filename(target_name, basename_str=True)
         Nd.mymetis3(base_filename, self.target_cpu_count)
 
+    def _cpu_assign_lpt(self, target_name):
+        """Assigns cells/pieces to CPUs with the least processing time heuristic, in NumPy.
+        Equivalent to mymetis3, writing the same CPU assignment file, but reading the binary
+        complexity data.
+        """
+        nhost = self.target_cpu_count
+        cx_data = self._load_cx_data(target_name)
+        cell_rows, subtree_ids, weights = self._cx_pieces(cx_data)
+        hosts = self._lpt(weights, nhost)
+
+        host_cx = np.bincount(hosts, weights, minlength=nhost)
+        mean_cx = weights.sum() / nhost
+        max_host = int(np.argmax(host_cx)) if nhost else 0
+        logging.info(
+            "LB Info: %d cells, %d pieces. Max host cx=%.3f (host %d), Mean=%.3f."
+            " Imbalance (max/mean)=%.3f",
+            len(cx_data["gids"]),
+            len(weights),
+            host_cx[max_host],
+            max_host,
+            mean_cx,
+            host_cx[max_host] / mean_cx if mean_cx else 1.0,
+        )
+
+        # msgid encodes the gid in the piece gids, see mymetis3 (binfo.hoc)
+        max_gid = int(cx_data["gids"].max()) if len(cx_data["gids"]) else -1
+        msgid = 10
+        while msgid <= max_gid:
+            msgid *= 10
+        msgid = max(msgid, 10_000_000)  # there may be unused gids
+
+        piece_order = np.argsort(hosts, kind="stable")  # keeps the cells order per host
+        host_starts = np.cumsum([0, *np.bincount(hosts, minlength=nhost)]).tolist()
+        piece_items = [
+            f"  {row} {gid} {subtree_id}"
+            for row, gid, subtree_id in zip(
+                cell_rows[piece_order].tolist(),
+                cx_data["gids"][cell_rows[piece_order]].tolist(),
+                subtree_ids[piece_order].tolist(),
+                strict=True,
+            )
+        ]
+        with open(self._cpu_assign_filename(target_name), "w", encoding="utf-8") as fp:
+            fp.write(f"msgid {msgid}\nnhost {nhost}\n")
+            fp.writelines(
+                f"{host} {end - start}{''.join(piece_items[start:end])}\n"
+                for host, (start, end) in enumerate(pairwise(host_starts))
+            )
+
+    @staticmethod
+    def _cx_pieces(cx_data):
+        """Lists the pieces to be assigned to CPUs: whole cells or, if split, their subtrees.
+
+        Returns: A tuple with, per piece, the cell row, the subtree index and the complexity
+        """
+        ms_data = cx_data["ms"]
+        cell_starts = cx_data["offsets"][:-1]
+        # Cells with a single subtree (or none) are not split. Only split cells are walked
+        sid_counts = ms_data[cell_starts + 2]
+        single_sid = np.flatnonzero(sid_counts == 1)
+        whole = sid_counts == 0
+        whole[single_sid] = ms_data[cell_starts[single_sid] + 3] == 1
+        cell_rows = [np.flatnonzero(whole)]
+        subtree_ids = [np.zeros(len(cell_rows[0]), dtype="int64")]
+        weights = [np.asarray(cx_data["complexities"][whole], dtype="float64")]
+
+        for row in np.flatnonzero(~whole).tolist():
+            ms = ms_data[cell_starts[row] : cx_data["offsets"][row + 1]].tolist()
+            piece_cx = []
+            i = 3
+            for _ in range(int(ms[2])):
+                subtree_count = int(ms[i])
+                i += 1
+                for _ in range(subtree_count):
+                    piece_cx.append(ms[i])
+                    i += 2 + int(ms[i + 1])  # complexity, children count and children
+            if len(piece_cx) <= 1:  # as in Neuron, a single piece is the whole cell
+                piece_cx = [ms[1]]
+            cell_rows.append(np.full(len(piece_cx), row))
+            subtree_ids.append(np.arange(len(piece_cx)))
+            weights.append(np.array(piece_cx))
+
+        cell_rows = np.concatenate(cell_rows)
+        subtree_ids = np.concatenate(subtree_ids)
+        order = np.lexsort((subtree_ids, cell_rows))  # pieces in the order of the cells
+        return cell_rows[order], subtree_ids[order], np.concatenate(weights)[order]
+
+    @staticmethod
+    def _lpt(weights, nhost):
+        """Least processing time: assigns pieces, heaviest first, to the least loaded host.
+        Ties go to the first such piece and host, as in Neuron's BalanceInfo.lpt
+
+        Returns: The host of each piece
+        """
+        hosts = np.empty(len(weights), dtype="int64")
+        host_loads = [(0.0, host) for host in range(nhost)]  # a heap, already sorted
+        weights_list = weights.tolist()
+        for i in np.argsort(weights, kind="stable")[::-1].tolist():
+            load, host = host_loads[0]
+            heapq.heapreplace(host_loads, (load + weights_list[i], host))
+            hosts[i] = host
+        return hosts
+
+    def _write_cx_data(self, target_name, ms_sizes, ms_data, collective=False):
+        """Writes the binary complexity files of a target, given the multisplit data of its cells.
+
+        If collective, all ranks write their cells, in rank order. Otherwise the caller writes
+        all the data. The offsets file goes last: it marks the data complete.
+        Ranks write their exact byte ranges and sync them before the barrier (not via mmap,
+        whose page-sized writebacks would clobber neighbor ranks on parallel file systems).
+        """
+        local_sizes = (len(ms_sizes), len(ms_data))
+        all_sizes = np.array(MPI.py_allgather(local_sizes) if collective else [local_sizes])
+        rank = MPI.rank if collective else 0
+        cell_start, data_start = all_sizes[:rank].sum(axis=0, dtype="int64").tolist()
+        total_cells, total_data = all_sizes.sum(axis=0, dtype="int64").tolist()
+        offsets = np.cumsum([0, *ms_sizes], dtype="int64")
+        # column -> (dtype, total size, local start, local values). Multisplit data of a cell
+        # starts with its gid and complexity
+        columns = {
+            "gids": ("int64", total_cells, cell_start, ms_data[offsets[:-1]]),
+            "complexities": ("float64", total_cells, cell_start, ms_data[offsets[:-1] + 1]),
+            "ms": ("float64", total_data, data_start, ms_data),
+            "offsets": ("int64", total_cells + 1, cell_start + 1, offsets[1:] + data_start),
+        }
+        filenames = {name: self._cx_data_filename(target_name, name) for name in columns}
+        filenames["offsets"] = filenames["offsets"].with_suffix(".tmp")
+
+        data_offsets = None  # column -> file offset of the data, after the npy header
+        if rank == 0:
+            data_offsets = {}
+            for name, (dtype, size, _, _) in columns.items():
+                out = np.lib.format.open_memmap(filenames[name], "w+", dtype=dtype, shape=(size,))
+                data_offsets[name] = out.offset
+                del out
+        if collective:
+            data_offsets = MPI.py_broadcast(data_offsets, 0)
+        if len(ms_sizes):
+            for name, (dtype, _, start, values) in columns.items():
+                data = np.ascontiguousarray(values, dtype=dtype)
+                self._pwrite_synced(
+                    filenames[name], data, data_offsets[name] + start * data.itemsize
+                )
+        if collective:
+            MPI.barrier()
+        if rank == 0:
+            os.replace(filenames["offsets"], self._cx_data_filename(target_name, "offsets"))
+
+    @staticmethod
+    def _pwrite_synced(filename, data, offset):
+        """Writes an array at the given offset of an existing file, and syncs it to disk"""
+        fd = os.open(filename, os.O_WRONLY)
+        try:
+            buffer = memoryview(data).cast("B")
+            while buffer:
+                written = os.pwrite(fd, buffer, offset)
+                buffer = buffer[written:]
+                offset += written
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _ms_sizes(ms_data):
+        """Finds the size of the multisplit data of each cell in the data of all cells"""
+        ms_sizes = []
+        i = 0
+        while i < len(ms_data):
+            start = i
+            piece_count = int(ms_data[i + 2])
+            i += 3
+            for _ in range(piece_count):
+                subtree_count = int(ms_data[i])
+                i += 1
+                for _ in range(subtree_count):
+                    i += 2 + int(ms_data[i + 1])  # complexity, children count and children
+            ms_sizes.append(i - start)
+        return ms_sizes
+
+    def _export_msdat(self, target_name):
+        """Exports the binary complexity data of a target to a text cx file"""
+        cx_data = self._load_cx_data(target_name)
+        offsets = cx_data["offsets"].tolist()
+        ms_data = cx_data["ms"]
+        log_verbose("Exporting complexity file %s", self._cx_filename(target_name))
+        with open(self._cx_filename(target_name), "w", encoding="utf-8") as fp:
+            fp.write(f"1\n{len(offsets) - 1}\n")
+            for start, end in pairwise(offsets):
+                self._write_msdat(fp, ms_data[start:end].tolist())
+
     @staticmethod
     def _write_msdat(fp, ms):
-        """Writes load balancing info to an output stream"""
-        fp.write(str(int(ms.x[0])))  # gid
-        fp.write(f" {ms.x[1]:g}")  # total complexity of cell
-        piece_count = int(ms.x[2])
+        """Writes load balancing info of a cell (a multisplit vector) to an output stream"""
+        fp.write(str(int(ms[0])))  # gid
+        fp.write(f" {ms[1]:g}")  # total complexity of cell
+        piece_count = int(ms[2])
         fp.write(f" {piece_count}\n")
         i = 2
 
         for _ in range(piece_count):
             i += 1
-            subtree_count = int(ms.x[i])
+            subtree_count = int(ms[i])
             fp.write(f"  {subtree_count}\n")
             for _ in range(subtree_count):
                 i += 1
-                cx = ms.x[i]  # subtree complexity
+                cx = ms[i]  # subtree complexity
                 i += 1
-                children_count = int(ms.x[i])
+                children_count = int(ms[i])
                 fp.write(f"   {cx:g} {children_count}\n")
                 if children_count > 0:
                     fp.write("    ")
                 for _ in range(children_count):
                     i += 1
-                    elem_id = int(ms.x[i])  # at next child
+                    elem_id = int(ms[i])  # at next child
                     fp.write(f" {elem_id}")
                 if children_count > 0:
                     fp.write("\n")
 
-    @staticmethod
-    def _read_msdat(fp):
-        """Read load balancing info from an input stream"""
-        cx_saved = {}  # dict with key = gid, value = line content
-        piece_count = 0
-        gid = None
-        next(fp)  # first line has 1. skip
-        next(fp)  # ncells. skip
-
-        for line in fp:
-            if piece_count == 0:
-                gid, _cx, piece_count = [int(float(x)) for x in line.split()]
-                cx_saved[gid] = [line]
-            else:  # Handle parts
-                cx_saved[gid].append(line)
-                for _ in range(2 * int(line)):  # each subtree has two lines
-                    cx_saved[gid].append(next(fp))
-                piece_count -= 1
-
-        return cx_saved
-
-    @staticmethod
-    def _write_msdat_dict(fp, cx_dict, gids=None):
-        """Write out selected gid cx lines from a cx_dict"""
-        if gids is None:
-            gids = cx_dict.keys()
-        fp.write(f"1\n{len(gids)}\n")
-        for gid in gids:
-            for line in cx_dict[gid]:
-                fp.write(line)  # raw lines, include \n
-
     def load_balance_info(self, target_spec):
         """Loads a load-balance info for a given target.
         NOTE: Please ensure the load balance exists or is derived before calling this function
@@ -916,6 +1228,10 @@ class LoadBalance:
         fname = self._lb_dir / (self._cx_filename_tpl % target_str)
         return str(fname)[:-4] if basename_str else fname
 
+    def _cx_data_filename(self, target_str, column) -> Path:
+        """Gets the filename of a binary cell complexity file (column) for a given target"""
+        return self._lb_dir / (self._cx_data_filename_tpl % (target_str, column))
+
     def _cpu_assign_filename(self, target_str) -> Path:
         """Gets the CPU assignment filename for a given target, according to target CPU count"""
         return self._lb_dir / (self._cpu_assign_filename_tpl % (target_str, self.target_cpu_count))
@@ -47,8 +47,18 @@ def neurodamus(args=None):
                                 - MultiSplit: Allows splitting cells into pieces for distribution.
                                     WARNING: This mode is incompatible with CoreNeuron
                                 - Memory: Load balance based on memory usage. By default, it uses
-                                    the "allocation_r#_c#.pkl.gz" file to load a pre-computed load
+                                    the "allocation_r#_c#" files to load a pre-computed load
                                     balance
+        --lb-cpu-assign=[mymetis3, lpt]
+                                The engine assigning cells/pieces to CPUs in WholeCell and
+                                MultiSplit load balance [default: mymetis3]
+                                - mymetis3: Neuron's (hoc) assignment
+                                - lpt: NumPy least processing time assignment, faster for large
+                                    circuits. Reports the achieved load imbalance
+        --lb-estimate-cx        When no complexity file covers the target, reuse the cell
+                                complexities of all targets and just re-assign CPUs. Missing
+                                cells are estimated from cells of the same metype, avoiding a
+                                full load balance [default: False]
         --save=<PATH>           Path to create a save point (at tstop) to enable restore. Only
                                 available for CoreNEURON.
         --restore=<PATH>        Restore and resume simulation from a save point. Only available
@@ -60,9 +70,29 @@ def neurodamus(args=None):
                                 If a list is provided, only the first GID will be used.
         --enable-shm=[ON, OFF]  Enables the use of /dev/shm for coreneuron_input (available
                                 only on linux) [default: OFF]
+        --shm-edge-index        Share the edge files index among the ranks of a node, via /dev/shm.
+                                Requires SHMDIR and mpi4py [default: False]
         --model-stats           Show model stats in CoreNEURON simulations [default: False]
         --dry-run               Dry-run simulation to estimate memory usage [default: False]
         --crash-test            Run the simulation with single section cells and single synapses
+        --synapse-prefetch=<number>  Read synapse data in bounded chunks of <number> cells,
+                                     instead of on a per cell basis. Default: disabled
+        --synapse-prefetch-async     Read the next synapse prefetch chunk in a background
+                                     thread, while the current one is instantiated
+        --synapse-cache=<PATH>       Directory of a persistent cache of the final synapse
+                                     parameters of each rank. Rebuilds with the same cell
+                                     partition skip reading and processing the edge files
+        --morphology-cache=<MB>      Memory budget of the per-rank cache of processed
+                                     morphologies, reused by cells sharing them.
+                                     Default: disabled
+        --morphology-prefetch=<threads>  Read the morphology files of the upcoming cells with
+                                     <threads> background threads, overlapping file system
+                                     latency with cell building. Default: disabled
+        --collective-node-read       Read node files with collective MPI-IO, like edge files.
+                                     Requires mpi4py [default: False]
+        --node-read-aggregators=<number>  Read node files from only <number> ranks, each a
+                                     contiguous block, then send every rank its cells.
+                                     Default: disabled
         --num-target-ranks=<number>  Number of ranks to target for dry-run load balancing
         --memory-tracker=[rss, heap] Memory tracker for dry run and memory load balancing
                                      [default: rss]
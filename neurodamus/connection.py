@@ -4,6 +4,7 @@ import contextlib
 import logging
 import re
 from enum import Enum
+from itertools import compress
 
 import numpy as np
 
@@ -266,16 +267,20 @@ class Connection(ConnectionBase):
         """
         n_synapses = len(synapses_params)
         synapse_ids = np.arange(base_id, base_id + n_synapses, dtype="uint64")
+        sections, locations = target_manager.locations_to_points(
+            self.tgid, synapses_params["isec"], synapses_params["ipt"], synapses_params["offset"]
+        )
+        synapses_params["location"] = locations
+
         # We may need to skip invalid synapses (e.g. on Axon)
+        section_exists = {}
         mask = np.full(n_synapses, fill_value=True)
-        for i, syn_params in enumerate(synapses_params):
-            syn_point = target_manager.location_to_point(
-                self.tgid, syn_params["isec"], syn_params["ipt"], syn_params["offset"]
-            )
-            syn_params["location"] = syn_point.x[0]
-            section = syn_point.sclst[0]
-
-            if section is None or not section.exists():
+        for i, section in enumerate(sections):
+            exists = section_exists.get(id(section))
+            if exists is None:
+                exists = section_exists[id(section)] = section is not None and section.exists()
+            if not exists:
+                syn_params = synapses_params[i]
                 target_point_str = (
                     f"({syn_params.isec:.0f} {syn_params.ipt:.0f} {syn_params.offset:.4f})"
                 )
@@ -287,11 +292,10 @@ class Connection(ConnectionBase):
                     target_point_str,
                 )
                 mask[i] = False
-                continue
 
-            # These are normal lists/arrays, so we cant use masks
-            self._synapse_sections.append(section)
-            self._synapse_points_x.append(syn_point.x[0])
+        # These are normal lists/arrays, so we cant use masks
+        self._synapse_sections.extend(compress(sections, mask))
+        self._synapse_points_x.extend(locations[mask])
 
         if not mask.all():
             synapses_params = synapses_params[mask]
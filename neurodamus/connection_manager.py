@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from bisect import bisect_left
 from collections import defaultdict
 from itertools import chain
 from os import path as ospath
@@ -19,7 +20,7 @@ from .io.synapse_reader import SonataReader
 from .target_manager import TargetManager, TargetSpec
 from .utils import compat
 from .utils.logging import VERBOSE_LOGLEVEL, log_all, log_verbose
-from .utils.pyutils import bin_search, gen_ranges
+from .utils.pyutils import gen_ranges
 from .utils.timeit import timeit
 
 if TYPE_CHECKING:
@@ -40,6 +41,9 @@ class ConnectionSet:
         self.virtual_source = False
         self._conn_factory = conn_factory
         self._connections_map = defaultdict(list)
+        # The sgids of each tgid connections, in the same order, for fast search
+        self._sgids_map = defaultdict(list)
+        self._sgids_arrays = {}  # The sgids as int64 arrays, dropped when a tgid gets a new conn
         self._conn_count = 0
 
     def __getitem__(self, item):
@@ -66,9 +70,7 @@ class ConnectionSet:
                 None if exact=True, otherwise the insertion index.
         """
         cell_conns = self._connections_map[tgid]
-        pos = 0
-        if cell_conns:
-            pos = bin_search(cell_conns, sgid, lambda x: x.sgid)
+        pos = bisect_left(self._sgids_map[tgid], sgid)
         if exact and (pos == len(cell_conns) or cell_conns[pos].sgid != sgid):
             # Not found
             return cell_conns, None
@@ -96,10 +98,13 @@ class ConnectionSet:
             return
         self._conn_count += 1
         cell_conns.insert(pos, conn)
+        self._sgids_map[conn.tgid].insert(pos, conn.sgid)
+        self._sgids_arrays.pop(conn.tgid, None)
 
     def get_or_create_connection(self, sgid, tgid, **kwargs):
         """Returns a connection by pre-post gid, creating if required."""
         conns = self._connections_map[tgid]
+        sgids = self._sgids_map[tgid]
         pos = 0
         if conns:
             # optimize for ordered insertion, and handle when sgid is not used
@@ -109,12 +114,14 @@ class ConnectionSet:
             if last_conn.sgid < sgid:
                 pos = len(conns)
             else:
-                pos = bin_search(conns, sgid, lambda x: x.sgid)
-                if conns[pos].sgid == sgid:
+                pos = bisect_left(sgids, sgid)
+                if sgids[pos] == sgid:
                     return conns[pos]
         # Not found. Create & insert
         cur_conn = self._conn_factory(sgid, tgid, self.src_pop_id, self.dst_pop_id, **kwargs)
         conns.insert(pos, cur_conn)
+        sgids.insert(pos, sgid)
+        self._sgids_arrays.pop(tgid, None)
         self._conn_count += 1
         return cur_conn
 
@@ -127,26 +134,47 @@ class ConnectionSet:
                 elem = self.get_connection(pre_gids, post_gids)
                 return (elem,) if elem is not None else ()
 
-        post_gid_conn_lists = (
-            self._connections_map.values()
+        post_gids = (
+            list(self._connections_map.keys())
             if post_gids is None
-            else (self._connections_map[post_gids],)
+            else (post_gids,)
             if isinstance(post_gids, int)
-            else (self._connections_map[tgid] for tgid in post_gids)
+            else post_gids
         )
         if pre_gids is None:
-            return chain.from_iterable(post_gid_conn_lists)
+            return chain.from_iterable(self._connections_map[tgid] for tgid in post_gids)
         if isinstance(pre_gids, int):
             # Return a generator which is employing bin search
             return (
-                conns[posi]
-                for conns in post_gid_conn_lists
-                for posi in (bin_search(conns, pre_gids, lambda x: x.sgid),)
-                if posi < len(conns) and conns[posi].sgid == pre_gids
+                conns[pos]
+                for tgid in post_gids
+                for conns, pos in (self._find_connection(pre_gids, tgid),)
+                if pos is not None
             )
-        # Generic case. Looks through all conns in selected tgids
-        pre_gids = set(pre_gids)
-        return (c for conns in post_gid_conn_lists for c in conns if c.sgid in pre_gids)
+        # Search the sgids of every tgid among the (sorted) pre_gids, vectorized
+        pre_gids = np.unique(np.fromiter(pre_gids, dtype="int64"))
+        if len(pre_gids) == 0:
+            return iter(())
+        return (
+            conns[conn_i]
+            for tgid in post_gids
+            for conns in (self._connections_map[tgid],)
+            for conn_i in self._find_sgids(tgid, pre_gids).tolist()
+        )
+
+    def _find_sgids(self, tgid, pre_gids):
+        """Return the indexes of the tgid connections whose sgid is in pre_gids,
+        a sorted unique array
+        """
+        sgids = self._sgids_arrays.get(tgid)
+        if sgids is None:
+            sgids = self._sgids_map.get(tgid, ())
+            if not sgids:
+                return np.empty(0, dtype=int)
+            sgids = self._sgids_arrays[tgid] = np.array(sgids, dtype="int64")
+        pos = np.searchsorted(pre_gids, sgids)
+        pos[pos == len(pre_gids)] = 0
+        return np.flatnonzero(pre_gids[pos] == sgids)
 
     def count(self):
         return self._conn_count
@@ -266,7 +294,11 @@ class ConnectionManagerBase:
     def _open_synapse_file(self, synapse_file, pop_name):
         logging.debug("Opening Synapse file %s, population: %s", synapse_file, pop_name)
         return self.SynapseReader(
-            synapse_file, pop_name, extracellular_calcium=SimConfig.extracellular_calcium
+            synapse_file,
+            pop_name,
+            extracellular_calcium=SimConfig.extracellular_calcium,
+            shared_index=SimConfig.cli_options.shm_edge_index,
+            params_cache_dir=SimConfig.cli_options.synapse_cache,
         )
 
     def _init_conn_population(self, src_pop_name):
@@ -472,7 +504,10 @@ class ConnectionManagerBase:
         pop = self._cur_population
 
         for sgid, tgid, syns_params, extra_params, offset in self._iterate_conn_params(
-            src_target=self._src_target_filter, dst_target=None, show_progress=True
+            src_target=self._src_target_filter,
+            dst_target=None,
+            show_progress=True,
+            release_consumed=True,
         ):
             if self._load_offsets:
                 conn_options["synapses_offset"] = extra_params["synapse_index"][0]
@@ -565,25 +600,31 @@ class ConnectionManagerBase:
                 log_all(logging.DEBUG, "Source GIDs for debug cell: %s", self.yielded_src_gids)
 
     @staticmethod
-    def _get_allowed_ranges(src_target, sgids, sgids_ranges, conn_count):
-        """Return n_yielded_conns and allowed_ranges, handling src_target=None.
+    def _get_allowed_ranges(src_gids, sgids, sgids_ranges):
+        """Return n_yielded_conns and the arrays of start and end of the allowed ranges.
+
+        Args:
+            src_gids: The sorted raw gids of the source target, or None to allow all
+            sgids: The source gids of the synapses
+            sgids_ranges: The offsets of the synapses of each connection, plus the end offset.
+                The connections must belong to a single tgid, n_yielded_conns being the
+                number of distinct sgids allowed.
 
         Helper function for _iterate_conn_params
         """
-        if src_target:
-            unique_sgids = sgids[sgids_ranges[:-1]]
-            allowed_sgids = set(unique_sgids[src_target.contains(unique_sgids, raw_gids=True)])
-            allowed_ranges = [
-                (sgids_ranges[i], sgids_ranges[i + 1])
-                for i in range(conn_count)
-                if sgids[sgids_ranges[i]] in allowed_sgids
-            ]
-            n_yielded_conns = len(allowed_sgids)
-        else:
-            n_yielded_conns = conn_count
-            allowed_ranges = [(sgids_ranges[i], sgids_ranges[i + 1]) for i in range(conn_count)]
-
-        return n_yielded_conns, allowed_ranges
+        range_starts = sgids_ranges[:-1]
+        range_ends = sgids_ranges[1:]
+        if src_gids is None:
+            return len(range_starts), range_starts, range_ends
+
+        range_sgids = sgids[range_starts]
+        # Vectorized membership, by binary search in the sorted src_gids
+        pos = np.searchsorted(src_gids, range_sgids)
+        allowed = np.zeros(len(range_sgids), dtype=bool)
+        in_bounds = pos < len(src_gids)
+        allowed[in_bounds] = src_gids[pos[in_bounds]] == range_sgids[in_bounds]
+        n_yielded_conns = len(np.unique(range_sgids[allowed]))
+        return n_yielded_conns, range_starts[allowed], range_ends[allowed]
 
     @staticmethod
     def _compute_sgids_ranges(syns_params):
@@ -606,12 +647,13 @@ class ConnectionManagerBase:
             return {"synapse_index": syn_index}
         return {}
 
-    def _iterate_conn_params(  # noqa: PLR0914
+    def _iterate_conn_params(  # noqa: C901, PLR0914
         self,
         src_target,
         dst_target,
         show_progress=None,
         mod_override=None,
+        release_consumed=False,
     ):
         """A generator which loads synapse data and yields tuples(sgid, tgid, synapses)
 
@@ -619,6 +661,9 @@ class ConnectionManagerBase:
             src_target: the target to filter the source cells, or None
             dst_target: the target to filter the destination cells, or None
             show_progress: Display a progress bar as tgids are processed
+            mod_override: The mod override to configure the reader with, if any
+            release_consumed: Drop the reader cached data of each tgid once all its
+                connections were yielded. Set when the gids are not iterated again
         """
         AUTO_PROGRESS_THRESHOLD = 50
         if (src_target and src_target.is_void()) or (dst_target and dst_target.is_void()):
@@ -632,9 +677,16 @@ class ConnectionManagerBase:
         created_conns_0 = self._cur_population.count()
         sgid_offset = self.src_pop_offset
         tgid_offset = self.target_pop_offset
+        # The source gids to filter connections, resolved once for all tgids
+        src_gids = np.unique(src_target.gids(raw_gids=True)) if src_target else None
 
         self._synapse_reader.configure_override(mod_override)
-        self._synapse_reader.preload_data(gids, minimal_mode=SimConfig.cli_options.crash_test)
+        self._synapse_reader.preload_data(
+            gids,
+            minimal_mode=SimConfig.cli_options.crash_test,
+            prefetch_chunk_size=SimConfig.synapse_prefetch,
+            prefetch_async=SimConfig.cli_options.synapse_prefetch_async,
+        )
 
         # NOTE: This routine is quite critical, sitting at the core of synapse processing
         # so it has been carefully optimized with numpy vectorized operations, even if
@@ -646,46 +698,57 @@ class ConnectionManagerBase:
 
         gids = ProgressBar.iter(gids, name="Loading") if show_progress else gids
 
-        for base_tgid in gids:
-            tgid = base_tgid + tgid_offset
-            syns_params = self._synapse_reader.get_synapse_parameters(base_tgid)
-            logging.debug("GID %d Syn count: %d", tgid, len(syns_params))
+        # All ranks must read the remaining prefetch chunks, even on errors or early exit
+        try:
+            for base_tgid in gids:
+                tgid = base_tgid + tgid_offset
+                syns_params = self._synapse_reader.get_synapse_parameters(base_tgid)
+                logging.debug("GID %d Syn count: %d", tgid, len(syns_params))
+
+                sgids, sgids_ranges, conn_count = self._compute_sgids_ranges(syns_params)
+                conn_debugger = self.ConnDebugger()
+                if conn_count == 0:
+                    logging.debug("No synapses for GID %d. Nothing to do.", tgid)
+                    if release_consumed:
+                        self._synapse_reader.release(base_tgid)
+                    continue
 
-            sgids, sgids_ranges, conn_count = self._compute_sgids_ranges(syns_params)
-            conn_debugger = self.ConnDebugger()
-            if conn_count == 0:
-                logging.debug("No synapses for GID %d. Nothing to do.", tgid)
-                continue
+                extra_fields = self._get_extra_fields(base_tgid)
 
-            extra_fields = self._get_extra_fields(base_tgid)
+                # We yield ranges of contiguous parameters belonging to the same connection,
+                # and given we have data for a single tgid, enough to group by sgid.
+                # The first row of a range is found by numpy.diff
 
-            # We yield ranges of contiguous parameters belonging to the same connection,
-            # and given we have data for a single tgid, enough to group by sgid.
-            # The first row of a range is found by numpy.diff
+                n_yielded_conns, range_starts, range_ends = self._get_allowed_ranges(
+                    src_gids, sgids, sgids_ranges
+                )
 
-            n_yielded_conns, allowed_ranges = self._get_allowed_ranges(
-                src_target, sgids, sgids_ranges, conn_count
-            )
+                for range_start, range_end in zip(
+                    range_starts.tolist(), range_ends.tolist(), strict=True
+                ):
+                    sgid = int(sgids[range_start])
+                    final_sgid = sgid + sgid_offset
+                    syn_params = syns_params[range_start:range_end]
+                    extra_params = (
+                        extra_fields
+                        and {  # reuse empty {}. Dont modify later!
+                            name: prop[range_start:range_end] for name, prop in extra_fields.items()
+                        }
+                    )
+                    conn_debugger.register(sgid, base_tgid, syn_params)
+                    yield final_sgid, tgid, syn_params, extra_params, range_start
+
+                if release_consumed:
+                    self._synapse_reader.release(base_tgid)
 
-            for range_start, range_end in allowed_ranges:
-                sgid = int(sgids[range_start])
-                final_sgid = sgid + sgid_offset
-                syn_params = syns_params[range_start:range_end]
-                extra_params = (
-                    extra_fields
-                    and {  # reuse empty {}. Dont modify later!
-                        name: prop[range_start:range_end] for name, prop in extra_fields.items()
-                    }
+                logging.debug(
+                    " > Yielded %d out of %d connections. (Filter by src Target: %s)",
+                    n_yielded_conns,
+                    conn_count,
+                    src_target and src_target.name,
                 )
-                conn_debugger.register(sgid, base_tgid, syn_params)
-                yield final_sgid, tgid, syn_params, extra_params, range_start
-
-            logging.debug(
-                " > Yielded %d out of %d connections. (Filter by src Target: %s)",
-                n_yielded_conns,
-                conn_count,
-                src_target and src_target.name,
-            )
+        finally:
+            self._synapse_reader.finish_prefetch()
 
         created_conns = self._cur_population.count() - created_conns_0
         self._total_connections += created_conns
@@ -828,8 +891,7 @@ class ConnectionManagerBase:
             (conn_population,) if conn_population is not None else self._populations.values()
         )
 
-        # temporary set for faster lookup
-        src_gids = src_target and set(src_target.gids(raw_gids=False))
+        src_gids = src_target.gids(raw_gids=False) if src_target else None
 
         for population in conn_populations:
             logging.debug("Connections from population %s", population)
@@ -837,9 +899,7 @@ class ConnectionManagerBase:
             tgids = np.intersect1d(tgids, dst_target.gids(raw_gids=False))
             if selected_gids:
                 tgids = np.intersect1d(tgids, selected_gids + tgid_offset)
-            for conn in population.get_connections(tgids):
-                if src_target is None or conn.sgid in src_gids:
-                    yield conn
+            yield from population.get_connections(tgids, src_gids)
 
     def configure_group(self, conn_config, gidvec=None):
         """Configure connections according to a config Connection block
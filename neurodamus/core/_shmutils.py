@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 
+import numpy as np
 import psutil
 
 from neurodamus.utils.pyutils import rmtree
@@ -13,6 +14,7 @@ class SHMUtil:
 
     node_id = -1
     nnodes = -1
+    _node_comm = None
 
     @staticmethod
     def _set_node_info():  # TODO: Replace with MPI SHM communicator
@@ -123,3 +125,56 @@ class SHMUtil:
     def get_shm_factor():
         factor = os.environ.get("NEURODAMUS_SHM_FACTOR")
         return 0.4 if not factor or not 0.0 <= float(factor) <= 1.0 else float(factor)
+
+    @staticmethod
+    def get_node_comm():
+        """The MPI communicator of the ranks in the same node, None if mpi4py is not available"""
+        if SHMUtil._node_comm is None:
+            try:
+                from mpi4py import MPI as MPI4PY
+            except ModuleNotFoundError:
+                return None
+            SHMUtil._node_comm = MPI4PY.COMM_WORLD.Split_type(MPI4PY.COMM_TYPE_SHARED)
+        return SHMUtil._node_comm
+
+    @staticmethod
+    def load_node_shared(datadir, loader):
+        """Load numpy arrays once per node and share them among the ranks of the node.
+
+        The first rank of every node calls `loader`, which returns a dict of arrays, and saves
+        them in SHM. All the ranks of the node then map them read-only, without copies.
+        If SHM (SHMDIR) or mpi4py are not available every rank calls `loader` instead.
+        All ranks must call this function.
+
+        Args:
+            datadir: A path identifying the data, to be created under SHMDIR
+            loader: The function loading the arrays, as a dict {name: array}
+        """
+        shmdir = SHMUtil.get_datadir_shm(datadir)
+        node_comm = SHMUtil.get_node_comm() if shmdir else None
+        if node_comm is None:
+            return loader()
+
+        names = None
+        if node_comm.rank == 0:
+            try:
+                os.makedirs(shmdir, exist_ok=True)
+                arrays = loader()
+                for name, array in arrays.items():
+                    np.save(os.path.join(shmdir, name + ".npy"), array)
+            except Exception:
+                node_comm.bcast(None, root=0)  # Other ranks must not wait forever
+                raise
+            names = list(arrays)
+        names = node_comm.bcast(names, root=0)
+        if names is None:
+            raise RuntimeError(f"Failed loading node shared data {datadir} in another rank")
+
+        arrays = {
+            name: np.load(os.path.join(shmdir, name + ".npy"), mmap_mode="r") for name in names
+        }
+        # Once mapped by all ranks the files can be removed. Memory is freed when unmapped
+        node_comm.Barrier()
+        if node_comm.rank == 0:
+            rmtree(shmdir)
+        return arrays
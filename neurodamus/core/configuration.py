@@ -91,6 +91,18 @@ class MemoryTracker(StrEnumBase):
     __default__ = RSS
 
 
+class CpuAssignEngine(StrEnumBase):
+    MYMETIS3 = 0  # Neuron (hoc)
+    LPT = 1  # NumPy, least processing time
+
+    __mapping__ = [
+        ("mymetis3", MYMETIS3),
+        ("lpt", LPT),
+    ]
+
+    __default__ = MYMETIS3
+
+
 class CliOptions(ConfigT):
     cell_permute = None
     report_buffer_size = None
@@ -99,11 +111,14 @@ class CliOptions(ConfigT):
     output_path = None
     keep_build = False
     lb_mode = None
+    lb_cpu_assign = None
+    lb_estimate_cx = False
     modelbuilding_steps = None
     enable_coord_mapping = False
     save = False
     restore = None
     enable_shm = False
+    shm_edge_index = False
     model_stats = False
     simulator = None
     dry_run = False
@@ -111,6 +126,13 @@ class CliOptions(ConfigT):
     keep_axon = False
     coreneuron_direct_mode = False
     crash_test = False
+    synapse_prefetch = None
+    synapse_prefetch_async = False
+    synapse_cache = None
+    morphology_cache = None
+    morphology_prefetch = None
+    collective_node_read = False
+    node_read_aggregators = None
     disable_reports = False
     memory_tracker = None
 
@@ -242,6 +264,8 @@ class _SimConfig:
     build_model = True
     simulate_model = True
     loadbal_mode = None
+    lb_cpu_assign = CpuAssignEngine.default()
+    lb_estimate_cx = False
     spike_location = libsonata.SimulationConfig.Conditions.SpikeLocation.soma
     spike_threshold = -30
     dry_run = False
@@ -249,6 +273,10 @@ class _SimConfig:
     memory_tracker = MemoryTracker.default()
     coreneuron_direct_mode = False
     crash_test_mode = False
+    synapse_prefetch = 0  # in number of cells, 0 to disable
+    morphology_cache = 0  # in MB, 0 to disable
+    morphology_prefetch = 0  # number of read-ahead threads, 0 to disable
+    node_read_aggregators = 0  # number of ranks reading node files for all, 0 to disable
     has_extracellular_stimulus = False
 
     _validators = []
@@ -296,6 +324,8 @@ class _SimConfig:
         cls.crash_test_mode = cls.cli_options.crash_test
         cls.num_target_ranks = cls.cli_options.num_target_ranks
         cls.memory_tracker = MemoryTracker.from_string(cls.cli_options.memory_tracker)
+        cls.lb_cpu_assign = CpuAssignEngine.from_string(cls.cli_options.lb_cpu_assign)
+        cls.lb_estimate_cx = cls.cli_options.lb_estimate_cx
         # change simulator by request before validator and init hoc config
         if cls.cli_options.simulator:
             try:
@@ -880,6 +910,59 @@ def _report_buffer_size(config: _SimConfig):
     config.report_buffer_size = report_buffer_size
 
 
+@SimConfig.validator
+def _synapse_prefetch(config: _SimConfig):
+    user_config = config.cli_options
+    if user_config.synapse_prefetch is None:
+        if user_config.synapse_prefetch_async:
+            logging.warning("IGNORING --synapse-prefetch-async since --synapse-prefetch not set")
+        return
+
+    synapse_prefetch = int(user_config.synapse_prefetch)
+    assert synapse_prefetch >= 0, "Synapse prefetch chunk size must be >= 0"
+    if synapse_prefetch and config.crash_test_mode:
+        logging.warning("IGNORING --synapse-prefetch since crash-test mode loads minimal data")
+        return
+    log_verbose("Synapse prefetch chunk size: %d cells", synapse_prefetch)
+    config.synapse_prefetch = synapse_prefetch
+
+
+@SimConfig.validator
+def _morphology_cache(config: _SimConfig):
+    user_config = config.cli_options
+    if user_config.morphology_cache is None:
+        return
+
+    morphology_cache = int(user_config.morphology_cache)
+    assert morphology_cache >= 0, "Morphology cache size must be >= 0"
+    log_verbose("Morphology cache size: %d MB", morphology_cache)
+    config.morphology_cache = morphology_cache
+
+
+@SimConfig.validator
+def _morphology_prefetch(config: _SimConfig):
+    user_config = config.cli_options
+    if user_config.morphology_prefetch is None:
+        return
+
+    morphology_prefetch = int(user_config.morphology_prefetch)
+    assert morphology_prefetch >= 0, "Morphology prefetch threads must be >= 0"
+    log_verbose("Morphology read-ahead threads: %d", morphology_prefetch)
+    config.morphology_prefetch = morphology_prefetch
+
+
+@SimConfig.validator
+def _node_read_aggregators(config: _SimConfig):
+    user_config = config.cli_options
+    if user_config.node_read_aggregators is None:
+        return
+
+    node_read_aggregators = int(user_config.node_read_aggregators)
+    assert node_read_aggregators >= 0, "Node read aggregators must be >= 0"
+    log_verbose("Node files read by %d aggregator ranks", node_read_aggregators)
+    config.node_read_aggregators = node_read_aggregators
+
+
 @SimConfig.validator
 def _model_building_steps(config: _SimConfig):
     user_config = config.cli_options
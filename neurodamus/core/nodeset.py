@@ -232,7 +232,10 @@ class SelectionNodeSet:
             # libsonata ranges are already 0-based
             self._max_gid = max(self.max_gid, np.max([i - 1 for _, i in self._selection.ranges]))
         if gid_info:
-            self._gid_info.update(gid_info)
+            if self._gid_info:
+                self._gid_info.update(gid_info)
+            else:
+                self._gid_info = gid_info  # keep as is, e.g. a column-wise METypeManager
         self._check_update_offsets()  # check offsets (uses reduce)
 
     def add_gids(self, gids: list[int], gid_info=None):
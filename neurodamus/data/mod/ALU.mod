@@ -39,6 +39,12 @@ extern int ifarg(int iarg);
 extern void nrn_register_recalc_ptr_callback(void (*f)());
 extern Point_process* ob2pntproc(Object*);
 extern double* nrn_recalc_ptr(double*);
+extern double* vector_vec();
+extern int vector_capacity();
+extern void* vector_arg(int);
+extern Object** hoc_objgetarg(int);
+extern void hoc_obj_ref(Object*);
+extern void hoc_obj_unref(Object*);
 #endif
 
 #ifdef NRN_MECHANISM_DATA_IS_SOA
@@ -55,6 +61,18 @@ typedef struct {
      */
     double * scalars_;
 
+    //! list of output slots of the variables, when summing into an output vector
+    int * slots_;
+
+    //! the output vector, one element per slot. See setoutputs
+    IvocVect* outputs_;
+
+    //! the hoc object of outputs_, referenced while in use
+    Object* outputs_obj_;
+
+    //! highest slot added so far, -1 if none
+    int max_slot_;
+
     //! number of elements stored in the vectors
     int np_;
 
@@ -141,6 +159,10 @@ VERBATIM {
     info->ptrs_ = (handle_to_double*)hoc_Ecalloc(info->psize_, sizeof(handle_to_double)); hoc_malchk();
 #endif
     info->scalars_ = (double*)hoc_Ecalloc(info->psize_, sizeof(double)); hoc_malchk();
+    info->slots_ = (int*)hoc_Ecalloc(info->psize_, sizeof(int)); hoc_malchk();
+    info->outputs_ = NULL;
+    info->outputs_obj_ = NULL;
+    info->max_slot_ = -1;
     info->np_ = 0;
     *ip = info;
 
@@ -160,11 +182,14 @@ VERBATIM {
 #ifndef CORENEURON_BUILD
     INFOCAST;
     Info* info = *ip;
+    hoc_obj_unref(info->outputs_obj_);
 #ifdef NRN_VERSION_GTEQ_9_0_0
     delete[] info->ptrs_;
 #else
     free(info->ptrs_);
 #endif
+    free(info->scalars_);
+    free(info->slots_);
     free(info);
 #endif
 }
@@ -198,6 +223,7 @@ COMMENT
  * Include another variable in the arithmetic operation
  * @param variable pointers
  * @param scalar (optional, 1 by default)
+ * @param slot (optional, 0 by default) output vector element to sum into, see setoutputs
  */
 ENDCOMMENT
 PROCEDURE addvar() { : double* pd
@@ -205,6 +231,13 @@ VERBATIM {
 #ifndef CORENEURON_BUILD
     INFOCAST;
     Info* info = *ip;
+    int slot = ifarg(3) ? (int)*getarg(3) : 0;
+    if (slot < 0) {
+        hoc_execerror("ALU addvar: negative output slot", 0);
+    }
+    if (info->outputs_ && slot >= vector_capacity(info->outputs_)) {
+        hoc_execerror("ALU addvar: output slot beyond the outputs vector", 0);
+    }
     if (info->np_ >= info->psize_) {
         info->psize_ += 10;
 #ifdef NRN_VERSION_GTEQ_9_0_0
@@ -216,6 +249,7 @@ VERBATIM {
         info->ptrs_ = (handle_to_double*)hoc_Erealloc(info->ptrs_, info->psize_*sizeof(handle_to_double)); hoc_malchk();
 #endif
         info->scalars_ = (double*) hoc_Erealloc(info->scalars_, info->psize_*sizeof(double)); hoc_malchk();
+        info->slots_ = (int*) hoc_Erealloc(info->slots_, info->psize_*sizeof(int)); hoc_malchk();
     }
 #ifdef NRN_MECHANISM_DATA_IS_SOA
     handle_to_double var = hoc_hgetarg<double>(1);
@@ -228,6 +262,10 @@ VERBATIM {
     } else {
         info->scalars_[info->np_] = 1;
     }
+    info->slots_[info->np_] = slot;
+    if (slot > info->max_slot_) {
+        info->max_slot_ = slot;
+    }
 
     ++info->np_;
     //printf("I have %d values.. (new = %g * %g)\n", info->np_, *(info->ptrs_[info->np_-1]), info->scalars_[info->np_-1] );
@@ -306,6 +344,61 @@ VERBATIM {
 ENDVERBATIM
 }
 
+COMMENT
+/*!
+ * Sum the variables into the elements of an output vector, according to their slots.
+ * Allows a single ALU to handle all the compartments of a cell
+ */
+ENDCOMMENT
+PROCEDURE slot_summation() {
+VERBATIM {
+#ifndef CORENEURON_BUILD
+    INFOCAST; Info* info = *ip;
+    int i;
+    double* outputs = vector_vec(info->outputs_);
+    int n_outputs = vector_capacity(info->outputs_);
+    if (info->max_slot_ >= n_outputs) {
+        hoc_execerror("ALU slot_summation: outputs vector smaller than its slots", 0);
+    }
+    for (i=0; i < n_outputs; ++i) {
+        outputs[i] = 0;
+    }
+    for (i=0; i < info->np_; ++i) {
+        outputs[info->slots_[i]] += (*info->ptrs_[i] * info->scalars_[i]);
+    }
+#endif
+}
+ENDVERBATIM
+}
+
+COMMENT
+/*!
+ * Sum into the elements of an output vector, one per slot (see addvar), instead of output.
+ * References to its elements (e.g. for reports) remain valid as long as it is not resized.
+ * The ALU keeps a reference to the Vector, and all slots must fit in it
+ *
+ * @param outputs The output Vector, sized to the number of slots
+ */
+ENDCOMMENT
+PROCEDURE setoutputs() {
+VERBATIM {
+#ifndef CORENEURON_BUILD
+    INFOCAST; Info* info = *ip;
+    IvocVect* outputs = vector_arg(1);
+    if (info->max_slot_ >= vector_capacity(outputs)) {
+        hoc_execerror("ALU setoutputs: outputs vector smaller than the added slots", 0);
+    }
+    Object* obj = *hoc_objgetarg(1);
+    hoc_obj_ref(obj);
+    hoc_obj_unref(info->outputs_obj_);
+    info->outputs_obj_ = obj;
+    info->outputs_ = outputs;
+    info->process = &slot_summation;
+#endif
+}
+ENDVERBATIM
+}
+
 COMMENT
 /*!
  * Set the operation performed when NET_RECEIVE block executes
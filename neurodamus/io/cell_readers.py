@@ -7,7 +7,7 @@ from os import path as ospath
 import libsonata
 import numpy as np
 
-from neurodamus.core import NeuronWrapper as Nd, run_only_rank0
+from neurodamus.core import MPI, NeuronWrapper as Nd, run_only_rank0
 from neurodamus.core.configuration import SimConfig
 from neurodamus.metype import METypeManager
 from neurodamus.utils.logging import log_verbose
@@ -68,7 +68,141 @@ def dry_run_distribution(gid_metype_bundle, stride=1, stride_offset=0):
     return np.concatenate(groups) if groups else EMPTY_GIDVEC
 
 
-def load_sonata(  # noqa: C901, PLR0915
+class _NodeAttributeReader:
+    """Reads a planned set of attributes of a node population, in bulk.
+
+    Attributes are registered up front with `require`, then `read` fetches all of them for
+    a selection of nodes at once: one libsonata read per column, over a sorted selection so
+    that the nodes are covered by as few ranges (HDF5 hyperslabs) as possible.
+    Enumerated (@library) columns are read as integer codes. These, and other columns
+    declared `categorical`, are decoded by indexing the array of their few distinct values,
+    so that no Python string is created per cell.
+
+    With `collective` the file is read with MPI-IO, like edge files. With `aggregators` only
+    that many ranks read the file, each a contiguous block of the population, and send every
+    rank the values of its nodes. In both modes all ranks must call `read` the same number of
+    times. Aggregators take precedence over collective reads.
+    """
+
+    def __init__(self, node_file, population, collective=False, aggregators=0):
+        self._aggregators = min(aggregators, MPI.size)
+        if collective and not self._aggregators:
+            from mpi4py import MPI as MPI4PY
+
+            hdf5_reader = libsonata.make_collective_reader(
+                MPI4PY.COMM_WORLD, collective_metadata=False, collective_transfer=True
+            )
+        else:
+            hdf5_reader = libsonata.Hdf5Reader()
+        storage = libsonata.NodeStorage(node_file, hdf5_reader=hdf5_reader)
+        self._population = storage.open_population(population)
+        self._enum_names = self._population.enumeration_names
+        self._plan = {}  # (name, dynamics) -> (categorical, convert)
+
+    def require(self, *names, dynamics=False, categorical=False, convert=None):
+        """Plan reading the given attributes, if they all exist. Returns whether they do.
+
+        Args:
+            names: the attribute names
+            dynamics: whether these are dynamics attributes
+            categorical: whether columns hold a few distinct values, e.g. strings like mtype
+            convert: a function applied to the distinct values of categorical columns
+        """
+        pop = self._population
+        if not set(names).issubset(
+            pop.dynamics_attribute_names if dynamics else pop.attribute_names
+        ):
+            return False
+        for name in names:
+            self._plan[name, dynamics] = (categorical, convert)
+        return True
+
+    def clear(self):
+        """Drop the planned attributes, so that the next reads only fetch newly required ones"""
+        self._plan.clear()
+
+    def read(self, gids):
+        """Read all the planned attributes of the given nodes.
+
+        Returns:
+            A dict {name: values}, values in the order of gids. Dynamics attributes are keyed
+            with the "@dynamics:" prefix.
+        """
+        if self._aggregators:
+            return self._read_aggregated(gids)
+        return self._read_local(gids)
+
+    def _read_local(self, gids):
+        gids = np.asarray(gids, dtype="int64")
+        order = np.argsort(gids, kind="stable")
+        selection = libsonata.Selection(gids[order])
+        columns = {}
+        for (name, dynamics), (categorical, convert) in self._plan.items():
+            values = self._read_column(name, dynamics, categorical, convert, selection)
+            columns["@dynamics:" + name if dynamics else name] = values[np.argsort(order)]
+        return columns
+
+    def _read_aggregated(self, gids):
+        """Read the nodes through the aggregator ranks, with two all-to-all exchanges.
+
+        The population is split in contiguous blocks, one per aggregator. Ranks send the gids
+        they need to the aggregators owning them, which read all requested nodes at once and
+        send back the values.
+        """
+        # Aggregators are evenly spread, so that they fall in different machine nodes
+        aggregator_ranks = np.arange(self._aggregators) * (MPI.size // self._aggregators)
+        block_starts = np.linspace(0, self._population.size, self._aggregators + 1)[:-1]
+        gids = np.asarray(gids, dtype="int64")
+        owners = np.searchsorted(block_starts.astype("int64"), gids, side="right") - 1
+        order = np.argsort(owners, kind="stable")
+        counts = np.bincount(owners, minlength=self._aggregators)
+        requests = [None] * MPI.size
+        for rank, block_gids in zip(
+            aggregator_ranks, np.split(gids[order], np.cumsum(counts)[:-1]), strict=True
+        ):
+            requests[rank] = block_gids
+        requests = MPI.py_alltoall(requests)
+
+        replies = [None] * MPI.size
+        if MPI.rank in aggregator_ranks:
+            # Several ranks may request the same nodes, e.g. in dry run. Read them once
+            requested, inverse = np.unique(np.concatenate(requests), return_inverse=True)
+            columns = self._read_local(requested)
+            offsets = np.cumsum([0] + [len(rank_gids) for rank_gids in requests])
+            for rank in range(MPI.size):
+                rows = inverse[offsets[rank] : offsets[rank + 1]]
+                replies[rank] = {name: values[rows] for name, values in columns.items()}
+        replies = MPI.py_alltoall(replies)
+
+        columns = {}
+        for name in replies[aggregator_ranks[0]]:
+            values = np.concatenate([replies[rank][name] for rank in aggregator_ranks])
+            columns[name] = values[np.argsort(order)]
+        return columns
+
+    def _read_column(self, name, dynamics, categorical, convert, selection):
+        pop = self._population
+        if dynamics:
+            values = np.asarray(pop.get_dynamics_attribute(name, selection))
+        elif name in self._enum_names:
+            codes = pop.get_enumeration(name, selection)
+            return self._decode(pop.enumeration_values(name), codes, convert)
+        else:
+            values = np.asarray(pop.get_attribute(name, selection))
+        if not categorical:
+            return values
+        categories, codes = np.unique(values, return_inverse=True)
+        return self._decode(categories, codes, convert)
+
+    @staticmethod
+    def _decode(categories, codes, convert):
+        categories = [str(value) for value in categories]
+        if convert is not None:
+            categories = [convert(value) for value in categories]
+        return np.array(categories, dtype=object)[codes]
+
+
+def load_sonata(  # noqa: C901, PLR0914, PLR0915
     circuit_conf,
     all_gids,
     stride=1,
@@ -80,7 +214,10 @@ def load_sonata(  # noqa: C901, PLR0915
     dry_run_stats=None,
     load_mode=None,
 ):
-    """A reader supporting additional dynamic properties from Sonata files."""
+    """A reader supporting additional dynamic properties from Sonata files.
+
+    All the node attributes are planned up front and read in a single bulk pass.
+    """
     import libsonata
 
     node_file = circuit_conf.CellLibraryFile
@@ -89,6 +226,47 @@ def load_sonata(  # noqa: C901, PLR0915
     attr_names = node_pop.attribute_names
     dynamics_attr_names = node_pop.dynamics_attribute_names
     total_cells = node_pop.size
+    load_dynamic_props = load_dynamic_props or ()
+
+    # Check properties exist, eventually removing prefix
+    def validate_property(prop_name):
+        if prop_name.startswith("@dynamics:"):
+            actual_prop_name = prop_name[len("@dynamics:") :]  # remove prefix
+            if actual_prop_name not in dynamics_attr_names:
+                raise Exception(f"Required Dynamics property {prop_name} not present")
+        elif prop_name not in attr_names:
+            raise Exception(f"Required extra property {prop_name} not present")
+
+    [validate_property(p) for p in load_dynamic_props]
+
+    cli_opts = SimConfig.cli_options
+    collective = cli_opts is not None and cli_opts.collective_node_read
+    reader = _NodeAttributeReader(
+        node_file,
+        node_population,
+        collective=collective,
+        aggregators=SimConfig.node_read_aggregators,
+    )
+
+    def require(*names, **kw):
+        if not reader.require(*names, **kw):
+            raise Exception(f"Required node attributes {names} not present in {node_population}")
+
+    require("morphology")
+    require("mtype", categorical=True)
+    if not reader.require("etype", categorical=True):
+        logging.warning("etype not found in node population, setting to None")
+    require("model_template", categorical=True, convert=lambda emodel: emodel.removeprefix("hoc:"))
+    for prop_name in load_dynamic_props:
+        if prop_name.startswith("@dynamics:"):
+            require(prop_name[len("@dynamics:") :], dynamics=True)
+        else:
+            require(prop_name)
+
+    def set_extra_attrs(meinfos, columns):
+        for prop_name in load_dynamic_props:
+            log_verbose("Loading extra property: %s ", prop_name)
+            meinfos.set_extra_attr(prop_name.removeprefix("@dynamics:"), columns[prop_name])
 
     def load_base_info_dry_run():
         CELL_NODE_INFO_LIMIT = 100
@@ -102,196 +280,138 @@ def load_sonata(  # noqa: C901, PLR0915
         gidvec = dry_run_distribution(list(metype_gids.values()), stride, stride_offset)
 
         log_verbose("Loading node attributes... (subset of cells from each metype)")
-        for gids in metype_gids.values():
-            if not len(gids):
-                continue
-            gids = gids[:CELL_NODE_INFO_LIMIT]
-            node_sel = libsonata.Selection(gids)
-            morpho_names = node_pop.get_attribute("morphology", node_sel)
-            mtypes = node_pop.get_attribute("mtype", node_sel)
-            etypes = node_pop.get_attribute("etype", node_sel)
-            model_templates = node_pop.get_attribute("model_template", node_sel)
-            emodel_templates = [emodel.removeprefix("hoc:") for emodel in model_templates]
-            meinfos.load_infoNP(gids, morpho_names, emodel_templates, mtypes, etypes)
-
-        return gidvec, meinfos, total_cells
-
-    def load_nodes_base_info():
-        if SimConfig.dry_run or load_mode == "load_nodes_metype":
-            return load_base_info_dry_run()
-
-        meinfos = METypeManager()
-        gidvec = split_round_robin(
-            all_gids,
-            stride,
-            stride_offset,
-            total_cells,
-        )
-
-        if not len(gidvec):
-            # Not enough cells to give this rank a few
-            return gidvec, meinfos, total_cells
-
-        log_verbose("Loading nodes info")
-        node_sel = libsonata.Selection(gidvec)
-        morpho_names = node_pop.get_attribute("morphology", node_sel)
-        mtypes = node_pop.get_attribute("mtype", node_sel)
-        try:
-            etypes = node_pop.get_attribute("etype", node_sel)
-        except libsonata.SonataError:
-            logging.warning("etype not found in node population, setting to None")
-            etypes = None
-        model_templates = node_pop.get_attribute("model_template", node_sel)
-        emodel_templates = [emodel.removeprefix("hoc:") for emodel in model_templates]
-        if {"exc_mini_frequency", "inh_mini_frequency"}.issubset(attr_names):
-            exc_mini_freqs = node_pop.get_attribute("exc_mini_frequency", node_sel)
-            inh_mini_freqs = node_pop.get_attribute("inh_mini_frequency", node_sel)
-        else:
-            exc_mini_freqs = None
-            inh_mini_freqs = None
-        if {"threshold_current", "holding_current"}.issubset(dynamics_attr_names):
-            threshold_currents = node_pop.get_dynamics_attribute("threshold_current", node_sel)
-            holding_currents = node_pop.get_dynamics_attribute("holding_current", node_sel)
-        else:
-            threshold_currents = None
-            holding_currents = None
-        positions = np.array(
-            [
-                node_pop.get_attribute("x", node_sel),
-                node_pop.get_attribute("y", node_sel),
-                node_pop.get_attribute("z", node_sel),
-            ]
-        ).T
-        rotations = _get_rotations(node_pop, node_sel)
-
-        # For Sonata and new emodel hoc template, we need additional attributes for building metype
-        # TODO: validate it's really the emodel_templates var we should pass here, or etype
-        add_params_list = (
-            None
-            if not has_extra_data
-            else _getNeededAttributes(node_pop, circuit_conf.METypePath, emodel_templates, gidvec)
-        )
-
+        subsets = [gids[:CELL_NODE_INFO_LIMIT] for gids in metype_gids.values() if len(gids)]
+        load_gids = np.concatenate(subsets) if subsets else EMPTY_GIDVEC
+        columns = reader.read(load_gids)
         meinfos.load_infoNP(
-            gidvec,
-            morpho_names,
-            emodel_templates,
-            mtypes,
-            etypes,
-            threshold_currents,
-            holding_currents,
-            exc_mini_freqs,
-            inh_mini_freqs,
-            positions,
-            rotations,
-            add_params_list,
+            load_gids,
+            columns["morphology"],
+            columns["model_template"],
+            columns["mtype"],
+            columns.get("etype"),
         )
+        set_extra_attrs(meinfos, columns)
         return gidvec, meinfos, total_cells
 
-    # If dynamic properties are not specified simply return early
-    if not load_dynamic_props:
-        return load_nodes_base_info()
-
-    # Check properties exist, eventually removing prefix
-    def validate_property(prop_name):
-        if prop_name.startswith("@dynamics:"):
-            actual_prop_name = prop_name[len("@dynamics:") :]  # remove prefix
-            if actual_prop_name not in dynamics_attr_names:
-                raise Exception(f"Required Dynamics property {prop_name} not present")
-        elif prop_name not in attr_names:
-            raise Exception(f"Required extra property {prop_name} not present")
-
-    [validate_property(p) for p in load_dynamic_props]
-
-    # All good. Lets start reading!
-    gidvec, meinfos, fullsize = load_nodes_base_info()
+    if SimConfig.dry_run or load_mode == "load_nodes_metype":
+        return load_base_info_dry_run()
 
-    if SimConfig.dry_run:
-        # TODO this is not tested!
-        load_nodes = np.fromiter(meinfos.keys(), dtype="uint32")
-        node_sel = libsonata.Selection(load_nodes)
-    else:
-        node_sel = libsonata.Selection(gidvec)
+    meinfos = METypeManager()
+    gidvec = split_round_robin(
+        all_gids,
+        stride,
+        stride_offset,
+        total_cells,
+    )
 
-    for prop_name in load_dynamic_props:
-        log_verbose("Loading extra property: %s ", prop_name)
-        if prop_name.startswith("@dynamics:"):
-            prop_name = prop_name[len("@dynamics:") :]
-            prop_data = node_pop.get_dynamics_attribute(prop_name, node_sel)
-        else:
-            prop_data = node_pop.get_attribute(prop_name, node_sel)
-        for gid, val in zip(meinfos.keys(), prop_data, strict=True):
-            meinfos[gid].extra_attrs[prop_name] = val
+    has_minis = reader.require("exc_mini_frequency", "inh_mini_frequency")
+    has_currents = reader.require("threshold_current", "holding_current", dynamics=True)
+    require("x", "y", "z")
+    has_rotations = _require_rotations(reader, attr_names)
+
+    log_verbose("Loading nodes info")
+    # NOTE: Read even if this rank has no cells, collective reads require all ranks
+    columns = reader.read(gidvec)
+    emodel_templates = columns["model_template"]
+
+    # For Sonata and new emodel hoc template, we need additional attributes for building metype
+    # TODO: validate it's really the emodel_templates var we should pass here, or etype
+    add_params_list = (
+        None
+        if not has_extra_data
+        else _getNeededAttributes(reader, circuit_conf.METypePath, emodel_templates, gidvec)
+    )
+    if not len(gidvec):
+        # Not enough cells to give this rank a few
+        return gidvec, meinfos, total_cells
 
-    return gidvec, meinfos, fullsize
+    exc_mini_freqs = columns["exc_mini_frequency"] if has_minis else None
+    inh_mini_freqs = columns["inh_mini_frequency"] if has_minis else None
+    threshold_currents = columns["@dynamics:threshold_current"] if has_currents else None
+    holding_currents = columns["@dynamics:holding_current"] if has_currents else None
+    positions = np.array([columns["x"], columns["y"], columns["z"]]).T
+    rotations = _get_rotations(columns, attr_names) if has_rotations else None
+
+    meinfos.load_infoNP(
+        gidvec,
+        columns["morphology"],
+        emodel_templates,
+        columns["mtype"],
+        columns.get("etype"),
+        threshold_currents,
+        holding_currents,
+        exc_mini_freqs,
+        inh_mini_freqs,
+        positions,
+        rotations,
+        add_params_list,
+    )
+    set_extra_attrs(meinfos, columns)
+    return gidvec, meinfos, total_cells
 
 
-def _getNeededAttributes(node_reader, etype_path, emodels, gidvec):
+def _getNeededAttributes(reader, etype_path, emodels, gidvec):
     """Read additional attributes required by emodel templates global var <emodel>__NeededAttributes
     Args:
-        node_reader: libsonata node population
+        reader: the _NodeAttributeReader of the node population. Its plan is replaced.
+            All ranks must call this, even without cells, since reads may be collective
         etype_path: Location of emodel hoc templates
         emodels: Array of emodel names
         gidvec: Array of 0-based cell gids
     """
-    add_params_list = []
-    for gid, emodel in zip(gidvec, emodels, strict=True):
+    emodels, emodel_idx = np.unique(np.asarray(emodels, dtype=object), return_inverse=True)
+    cell_attrs = [()] * len(emodels)  # attribute names of each emodel
+    for i, emodel in enumerate(emodels):
         Nd.h.load_file(ospath.join(etype_path, emodel) + ".hoc")  # hoc doesn't throw
         attr_names = getattr(Nd, emodel + "_NeededAttributes", None)  # format "attr1;attr2;attr3"
-        vals = []
         if attr_names is not None:
-            vals = [node_reader.get_dynamics_attribute(name, gid) for name in attr_names.split(";")]
-        add_params_list.append(vals)
-    return add_params_list
+            cell_attrs[i] = attr_names.split(";")
+
+    # Ranks plan the same attributes, the ones required by any of them, in the same order
+    local_names = set().union(*cell_attrs)
+    all_names = sorted(set().union(*MPI.py_allgather(sorted(local_names))))
+    attr_values = {}
+    if all_names:
+        reader.clear()
+        if not reader.require(*all_names, dynamics=True):
+            raise Exception(f"Dynamics attributes required by the emodels not present: {all_names}")
+        columns = reader.read(gidvec)
+        attr_values = {name: columns["@dynamics:" + name].tolist() for name in local_names}
 
+    return [[attr_values[name][row] for name in cell_attrs[i]] for row, i in enumerate(emodel_idx)]
 
-def _get_rotations(node_reader, selection):
+
+_QUATERNION_ATTRS = ("orientation_x", "orientation_y", "orientation_z", "orientation_w")
+_EULER_ANGLE_ATTRS = ("rotation_angle_xaxis", "rotation_angle_yaxis", "rotation_angle_zaxis")
+
+
+def _require_rotations(reader, attr_names):
+    """Plan reading the rotation attributes. Returns whether the cells have rotations"""
+    if reader.require(*_QUATERNION_ATTRS):
+        return True
+    euler_attrs = [name for name in _EULER_ANGLE_ATTRS if name in attr_names]
+    return reader.require(*euler_attrs) if euler_attrs else False
+
+
+def _get_rotations(columns, attr_names):
     """Get quaternions to rotate the cells
 
     Args:
-        node_reader: libsonata node population
-        selection: libsonata selection
+        columns: the node attributes read, see _NodeAttributeReader
+        attr_names: the attribute names of the node population
 
     Returns:
         double vector of size [N][4] with the rotation quaternions in the order (x,y,z,w)
     """
-    attr_names = node_reader.attribute_names
-    if {"orientation_x", "orientation_y", "orientation_z", "orientation_w"}.issubset(attr_names):
+    if set(_QUATERNION_ATTRS).issubset(attr_names):
         # Preferred way to present the rotation as quaternions
-        return np.array(
-            [
-                node_reader.get_attribute("orientation_x", selection),
-                node_reader.get_attribute("orientation_y", selection),
-                node_reader.get_attribute("orientation_z", selection),
-                node_reader.get_attribute("orientation_w", selection),
-            ]
-        ).T
-
-    if {"rotation_angle_xaxis", "rotation_angle_yaxis", "rotation_angle_zaxis"}.intersection(
-        attr_names
-    ):
-        # Some sonata nodes files use the Euler angle rotations, convert them to quaternions
-        from scipy.spatial.transform import Rotation
-
-        angle_x = (
-            node_reader.get_attribute("rotation_angle_xaxis", selection)
-            if "rotation_angle_xaxis" in attr_names
-            else 0
-        )
-        angle_y = (
-            node_reader.get_attribute("rotation_angle_yaxis", selection)
-            if "rotation_angle_yaxis" in attr_names
-            else 0
-        )
-        angle_z = (
-            node_reader.get_attribute("rotation_angle_zaxis", selection)
-            if "rotation_angle_yaxis" in attr_names
-            else 0
-        )
-        euler_rots = np.array([angle_x, angle_y, angle_z]).T
-        return Rotation.from_euler("xyz", euler_rots).as_quat()
+        return np.array([columns[name] for name in _QUATERNION_ATTRS]).T
+
+    # Some sonata nodes files use the Euler angle rotations, convert them to quaternions
+    from scipy.spatial.transform import Rotation
 
-    return None
+    euler_rots = np.array([columns.get(name, 0) for name in _EULER_ANGLE_ATTRS]).T
+    return Rotation.from_euler("xyz", euler_rots).as_quat()
 
 
 @run_only_rank0
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import pairwise
 
+import h5py
 import libsonata
 import numpy as np
 
-from neurodamus.core import NeuronWrapper as Nd, ProgressBarRank0 as ProgressBar
+from neurodamus.core import MPI, NeuronWrapper as Nd, ProgressBarRank0 as ProgressBar
+from neurodamus.core._shmutils import SHMUtil
 from neurodamus.utils.logging import log_verbose
 from neurodamus.utils.pyutils import gen_ranges
 
@@ -139,13 +146,52 @@ class SynapseParameters:
         return arr
 
 
+def _partition_by_gid(lookup_gids):
+    """Group the edges of a chunk by their lookup gid, in a CSR fashion.
+
+    Returns:
+        tuple: (gids, edge_order, gid_offsets) where gids is the list of unique sorted gids,
+            edge_order the permutation sorting edges by gid (None if they already are) and
+            gid_offsets the boundaries such that the edges of gids[i] are, after reordering,
+            in the range [gid_offsets[i], gid_offsets[i + 1]).
+    """
+    lookup_gids = np.asarray(lookup_gids)
+    edge_count = len(lookup_gids)
+    if edge_count == 0:
+        return [], None, np.zeros(1, dtype=np.intp)
+
+    edge_order = None
+    if np.any(lookup_gids[1:] < lookup_gids[:-1]):
+        edge_order = np.argsort(lookup_gids, kind="stable")
+        lookup_gids = lookup_gids[edge_order]
+
+    is_first = np.empty(edge_count, dtype=bool)
+    is_first[0] = True
+    np.not_equal(lookup_gids[1:], lookup_gids[:-1], out=is_first[1:])
+    gid_starts = np.flatnonzero(is_first)
+    gid_offsets = np.append(gid_starts, edge_count)
+    return lookup_gids[gid_starts].tolist(), edge_order, gid_offsets
+
+
+class _EdgeDataBlock:
+    """The edge data of a chunk of gids, stored as one array per field, sorted by gid.
+
+    The reader keeps an index of gid -> (block, start, end). The synapse parameters
+    record array is built (and patched) once for the whole block and gids get views of it.
+    """
+
+    __slots__ = ("columns", "syn_params")
+
+    def __init__(self):
+        self.columns = {}
+        self.syn_params = None
+
+
 class SonataReader:
     """Reader for SONATA edge files.
 
     Uses libsonata. It will read each attribute for multiple GIDs
-    at once and cache read data in a columnar fashion.
-
-    FIXME Remove the caching at the np.recarray level.
+    at once and cache read data in a columnar fashion, one block per chunk of gids.
     """
 
     SYNAPSE_INDEX_NAMES = ("synapse_index",)
@@ -159,6 +205,9 @@ class SonataReader:
     custom_parameters = {"isec", "ipt", "offset"}
     """Custom parameters are skipped from direct loading and trigger _load_params_custom()"""
 
+    PREFETCH_MAX_CHUNKS = 2
+    """Max number of prefetched chunks kept in memory (See preload_data)"""
+
     parameter_mapping = {
         "weight": "conductance",
         "U": "u_syn",
@@ -172,8 +221,12 @@ class SonataReader:
 
     def __init__(self, edge_file, population=None, *_, **kw):
         self._ca_concentration = kw.get("extracellular_calcium")
-        self._syn_params = {}  # Parameters cache by post-gid (previously loadedMap)
+        self._edge_file = edge_file
+        # The directory of the persistent synapse parameters cache, if enabled
+        self._params_cache_dir = kw.get("params_cache_dir")
         self._open_file(edge_file, population, kw.get("verbose", False))
+        # The edges index, shared among the ranks of a node (if requested)
+        self._edge_index = self._load_shared_index(edge_file) if kw.get("shared_index") else None
         # NOTE u_hill_coefficient and conductance_scale_factor are optional, BUT
         # while u_hill_coefficient can always be readif avail, conductance reader may not.
         self._uhill_property_avail = self.has_property("u_hill_coefficient")
@@ -205,22 +258,32 @@ class SonataReader:
     def get_synapse_parameters(self, gid) -> np.recarray:
         """Return the synapse parameters record array for the given gid,
         loading and caching it if needed.
-        """
-        syn_params = self._syn_params.get(gid)
-        if syn_params is None:
-            # prepare data for the gid
-            data = self._data.get(gid)
-            if data is None:  # not in _data
-                self._preload_data_chunk([gid])
-                data = self._data[gid]
 
+        The returned array is a view of the parameters of the whole chunk the gid was loaded in.
+        """
+        gid_range = self._gid_index.get(gid)
+        while gid_range is None and gid in self._prefetch_pending:
+            self._prefetch_next_chunk()
+            gid_range = self._gid_index.get(gid)
+        if gid_range is None:
+            self._preload_data_chunk([gid])
+            gid_range = self._gid_index[gid]
+
+        block, start, end = gid_range
+        if block.syn_params is None:
             # create the synapse parameters array, already patched
-            syn_params = self.Parameters.make_synapse_parameters_array(
-                data, self._extra_fields, self._ca_concentration, self._extra_scale_vars
+            block.syn_params = self.Parameters.make_synapse_parameters_array(
+                block.columns, self._extra_fields, self._ca_concentration, self._extra_scale_vars
             )
-            # cache the results
-            self._syn_params[gid] = syn_params
-        return syn_params
+        return block.syn_params[start:end]
+
+    def release(self, gid):
+        """Drop the cached data of a gid, typically once its connections were created.
+
+        A chunk is freed when all its gids were released. Views already handed out
+        remain valid, and the gid data is read again if requested later.
+        """
+        self._gid_index.pop(gid, None)
 
     def _open_file(self, src, population, _):
         """Initializes the reader, opens the synapse file"""
@@ -230,16 +293,28 @@ class SonataReader:
             hdf5_reader = libsonata.make_collective_reader(
                 MPI.COMM_WORLD, collective_metadata=False, collective_transfer=True
             )
+            collective = True
         except ModuleNotFoundError:
             hdf5_reader = libsonata.Hdf5Reader()
+            collective = False
 
         storage = libsonata.EdgeStorage(src, hdf5_reader=hdf5_reader)
         if not population:
             assert len(storage.population_names) == 1, f"Populations: {storage.population_names}"
             population = next(iter(storage.population_names))
         self._population = storage.open_population(population)
-        # A cache which stores all the fields for each gid. E.g. {1: {"sgid": property_numpy}}
-        self._data = {}
+        # The index to the cached data: {gid: (block, start, end)}. See _EdgeDataBlock
+        self._gid_index = {}
+        self._empty_block = _EdgeDataBlock()
+        # The chunks of gids to be prefetched (and all their gids), and those in memory
+        self._prefetch_plan = deque()
+        self._prefetch_pending = set()
+        self._prefetched = deque()
+        # With async prefetch, the background reader and the chunk being read:
+        # (chunk_gids, node_ids, future)
+        self._prefetch_executor = None
+        self._prefetch_inflight = None
+        self._collective = collective
         # A cache for connection counts, used mostly in dry run
         self._counts = {}
 
@@ -251,58 +326,290 @@ class SonataReader:
 
     def get_property(self, gid, field_name):
         """Retrieves a full pre-loaded property given a gid and the property name."""
-        return self._data[gid][field_name]
+        block, start, end = self._gid_index[gid]
+        data = block.columns[field_name]
+        return data if np.isscalar(data) else data[start:end]
 
-    def preload_data(self, gids, minimal_mode=False):
+    def preload_data(self, gids, minimal_mode=False, prefetch_chunk_size=0, prefetch_async=False):
         """Preload SONATA fields for the specified IDs.
         Set minimal_mode to True to read a single synapse per connection
+
+        With prefetch_chunk_size > 0 the data is read in chunks of that many gids, as they are
+        requested by get_synapse_parameters, in the order given. Only the last
+        PREFETCH_MAX_CHUNKS chunks are kept in memory. Since reads may be collective all ranks
+        are assigned the same number of chunks and must call finish_prefetch() at the end.
+        With prefetch_async the next chunk is read by a background thread while the current
+        one is being processed (double buffering).
+
+        If the reader was given a params_cache_dir the final synapse parameters are instead
+        loaded from the persistent cache (See _load_params_cache), and prefetch is not used.
         """
-        # TODO: limit the number of cells per chunk in production.
-        #       Ensuring the number of chunks must be the same in all ranks (collective)!
         CHUNK_SIZE = 1000
-        if not minimal_mode or len(gids) < CHUNK_SIZE:
+        if minimal_mode:
+            if len(gids) < CHUNK_SIZE:
+                return
+            ranges = list(gen_ranges(len(gids), CHUNK_SIZE))
+            for start, end in ProgressBar.iter(ranges, name="Prefetching"):
+                self._preload_data_chunk(gids[start:end], minimal_mode)
             return
 
-        ranges = list(gen_ranges(len(gids), CHUNK_SIZE))
-        for start, end in ProgressBar.iter(ranges, name="Prefetching"):
-            self._preload_data_chunk(gids[start:end], minimal_mode)
+        if self._params_cache_dir:
+            self._load_params_cache(gids)
+            return
+
+        if prefetch_chunk_size > 0:
+            n_chunks = MPI.allreduce(-(-len(gids) // prefetch_chunk_size), MPI.MAX)
+            self._prefetch_plan.extend(
+                set(gids[i * prefetch_chunk_size : (i + 1) * prefetch_chunk_size])
+                for i in range(int(n_chunks))
+            )
+            self._prefetch_pending.update(gids)
+            if prefetch_async and self._prefetch_executor is None and self._can_read_async():
+                self._prefetch_executor = ThreadPoolExecutor(1, thread_name_prefix="EdgeReader")
+                self._submit_prefetch()
+
+    def _can_read_async(self):
+        """Whether reads can be done from a background thread. Collective reads run while the
+        main thread keeps doing MPI calls, requiring MPI to be initialized with MPI_THREAD_MULTIPLE
+        """
+        if not self._collective:
+            return True
+        from mpi4py import MPI as MPI4PY
 
-    def _preload_data_chunk(self, gids, minimal_mode=False):  # noqa: C901
+        if MPI4PY.Query_thread() >= MPI4PY.THREAD_MULTIPLE:
+            return True
+        logging.warning("MPI has no multi-thread support. Synapse prefetch will be synchronous")
+        return False
+
+    def _submit_prefetch(self):
+        """Start reading the next chunk of the prefetch plan in the background"""
+        if not self._prefetch_plan:
+            return
+        chunk_gids = self._prefetch_plan[0]
+        node_ids = np.array(sorted(chunk_gids - self._gid_index.keys()), dtype="int64")
+        future = self._prefetch_executor.submit(self._read_data_chunk, node_ids)
+        self._prefetch_inflight = (chunk_gids, node_ids, future)
+
+    def _wait_prefetch(self):
+        """Wait for a background read, if any, so that the edge file can be accessed"""
+        if self._prefetch_inflight is not None:
+            self._prefetch_inflight[2].exception()
+
+    def _prefetch_next_chunk(self):
+        """Read the next chunk of the prefetch plan, evicting the oldest in memory if needed.
+
+        When reading in the background the chunk being read takes one of the
+        PREFETCH_MAX_CHUNKS slots, and reading the following chunk starts right away
+        """
+        chunk_gids = self._prefetch_plan.popleft()
+        self._prefetch_pending -= chunk_gids
+        max_loaded = self.PREFETCH_MAX_CHUNKS
+        if self._prefetch_executor is not None:
+            max_loaded -= 1
+        while self._prefetched and len(self._prefetched) >= max_loaded:
+            for gid in self._prefetched.popleft():
+                self.release(gid)
+
+        if self._prefetch_inflight is not None and self._prefetch_inflight[0] is chunk_gids:
+            _, node_ids, future = self._prefetch_inflight
+            self._prefetch_inflight = None
+            self._register_data_chunk(node_ids, *future.result())
+            self._submit_prefetch()
+        else:
+            self._preload_data_chunk(list(chunk_gids))
+        self._prefetched.append(chunk_gids)
+
+    def finish_prefetch(self):
+        """Read the chunks left in the prefetch plan, and drop all prefetched data.
+
+        Ranks with less gids will have empty chunks left, which must still be read so that
+        all ranks participate in the same number of collective reads.
+        """
+        while self._prefetch_plan:
+            self._prefetch_next_chunk()
+        while self._prefetched:
+            for gid in self._prefetched.popleft():
+                self.release(gid)
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown()
+            self._prefetch_executor = None
+
+    def _params_cache_file(self, gids):
+        """The path prefix of the cache files for the synapse parameters of the given gids.
+
+        Entries are keyed by the edge file (path, size and mtime), the population, the gids
+        and every setting affecting the final parameters: extracellular calcium,
+        mod override fields and dt (See SynapseParameters patches)
+        """
+        stat = os.stat(self._edge_file)
+        settings = (
+            os.path.realpath(self._edge_file),
+            stat.st_size,
+            stat.st_mtime_ns,
+            self._population.name,
+            type(self).__name__,
+            self._ca_concentration,
+            sorted(self._extra_fields),
+            self._extra_scale_vars,
+            Nd.dt,
+        )
+        key = hashlib.md5(repr(settings).encode())
+        key.update(gids.tobytes())
+        return os.path.join(self._params_cache_dir, f"synapse_params_{key.hexdigest()}")
+
+    def _load_params_cache(self, gids):
+        """Load the synapse parameters of the given gids from the persistent cache.
+
+        On a cache miss the data of all the gids is read at once and written to the cache.
+        Since reads may be collective, when any rank misses the cache all ranks do one read.
+        The cache is memory-mapped copy-on-write, so parameters can still be modified.
+        """
+        gids = np.asarray(gids, dtype="int64")
+        cache_file = self._params_cache_file(gids)
+        missing = not os.path.isfile(cache_file + ".params.npy")
+        if MPI.allreduce(int(missing), MPI.MAX):
+            if missing:  # read again gids loaded previously, e.g. with other settings
+                for gid in gids.tolist():
+                    self.release(gid)
+            self._preload_data_chunk(gids.tolist() if missing else [])
+            if missing:
+                self._write_params_cache(cache_file, gids)
+        else:
+            log_verbose("Loading cached synapse parameters: %s", cache_file)
+
+        block = _EdgeDataBlock()
+        block.syn_params = np.load(cache_file + ".params.npy", mmap_mode="c").view(np.recarray)
+        for name in self.SYNAPSE_INDEX_NAMES:
+            block.columns[name] = np.load(f"{cache_file}.{name}.npy", mmap_mode="r")
+        gid_offsets = np.load(cache_file + ".offsets.npy")
+        self._register_data_chunk(gids, gids.tolist(), block, gid_offsets)
+
+    def _write_params_cache(self, cache_file, gids):
+        """Write the synapse parameters of the given (loaded) gids to the cache, in gid order"""
+        syn_params = [self.get_synapse_parameters(gid) for gid in gids.tolist()]
+        gids_with_data = [
+            gid for gid, params in zip(gids.tolist(), syn_params, strict=True) if len(params)
+        ]
+        data = {"offsets": np.cumsum([0, *map(len, syn_params)])}
+        for name in self.SYNAPSE_INDEX_NAMES:
+            data[name] = np.concatenate(
+                [self.get_property(gid, name) for gid in gids_with_data] or [np.empty(0, "i8")]
+            )
+        # The params file goes last: it marks the cache entry as complete
+        data["params"] = np.concatenate(
+            [params for params in syn_params if len(params)]
+            or [np.empty(0, self.Parameters.dtype(self._extra_fields))]
+        )
+        os.makedirs(self._params_cache_dir, exist_ok=True)
+        for suffix, array in data.items():
+            tmp_file = f"{cache_file}.{suffix}.{MPI.rank}.tmp"
+            with open(tmp_file, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_file, f"{cache_file}.{suffix}.npy")
+        log_verbose("Written synapse parameters cache: %s", cache_file)
+
+    def _get_edge_and_lookup_gids(self, node_ids):
+        """Retrieve the edges of the given nodes and their corresponding lookup gid"""
+        if self.LOOKUP_BY_TARGET_IDS:
+            return self._get_afferent_edges(node_ids)
+        if self._edge_index is not None:
+            return self._lookup_shared_index(node_ids)
+        edge_ids = self._population.efferent_edges(node_ids)
+        return edge_ids, self._population.source_nodes(edge_ids)
+
+    def _get_afferent_edges(self, node_ids):
+        """Retrieve the afferent edges of the given nodes and their target node"""
+        if self._edge_index is not None and self.LOOKUP_BY_TARGET_IDS:
+            return self._lookup_shared_index(node_ids)
+        edge_ids = self._population.afferent_edges(node_ids)
+        return edge_ids, self._population.target_nodes(edge_ids)
+
+    def _load_shared_index(self, edge_file):
+        """Load the edges index in the lookup direction, once per node (See SHMUtil)"""
+        population = self._population.name
+        direction = "target_to_source" if self.LOOKUP_BY_TARGET_IDS else "source_to_target"
+
+        def _read_index():
+            with h5py.File(edge_file, "r") as h5:
+                index = h5["edges"][population]["indices"][direction]
+                return {
+                    "node_id_to_ranges": index["node_id_to_ranges"][:],
+                    "range_to_edge_id": index["range_to_edge_id"][:],
+                }
+
+        key = hashlib.md5(f"{edge_file}:{population}:{direction}".encode()).hexdigest()
+        log_verbose("Loading node shared edges index for %s", population)
+        return SHMUtil.load_node_shared(f"/.__pydamus_edge_index_{key}", _read_index)
+
+    def _lookup_shared_index(self, node_ids):
+        """Find the edges of the given nodes, and the node of each edge, in the edges index.
+
+        Edges are returned in increasing id order, like the libsonata queries.
+        """
+        node_to_ranges = self._edge_index["node_id_to_ranges"]
+        node_ids = np.asarray(node_ids, dtype="int64")
+        node_ids = node_ids[node_ids < len(node_to_ranges)]  # others have no edges
+        node_ranges = node_to_ranges[node_ids].astype("int64")
+        ranges_count = node_ranges[:, 1] - node_ranges[:, 0]
+        # The ids of all ranges of the nodes, concatenated
+        range_ids = np.arange(ranges_count.sum()) + np.repeat(
+            node_ranges[:, 0] - (np.cumsum(ranges_count) - ranges_count), ranges_count
+        )
+        edge_ranges = self._edge_index["range_to_edge_id"][range_ids].astype("int64")
+        range_nodes = np.repeat(node_ids, ranges_count)
+        order = np.argsort(edge_ranges[:, 0], kind="stable")
+        edge_ranges = edge_ranges[order]
+        lookup_gids = np.repeat(range_nodes[order], edge_ranges[:, 1] - edge_ranges[:, 0])
+        return libsonata.Selection(edge_ranges), lookup_gids
+
+    def _preload_data_chunk(self, gids, minimal_mode=False):
         """Preload all synapses for a number of gids, respecting Parameters and _extra_fields"""
+        self._wait_prefetch()  # the edge file must not be read concurrently
+        node_ids = np.array(sorted(set(gids) - self._gid_index.keys()), dtype="int64")
+        self._register_data_chunk(node_ids, *self._read_data_chunk(node_ids, minimal_mode))
+        if not (self.custom_parameters and minimal_mode):  # minimal mode skips extra fields
+            self._load_extra_fields(gids, self._get_extra_field_names())
+
+    def _get_extra_field_names(self):
+        compute_fields = {"sgid", "tgid", *self.SYNAPSE_INDEX_NAMES}
+        return self._extra_fields - (self.Parameters.all_fields() | compute_fields)
+
+    def _register_data_chunk(self, node_ids, needed_gids, block, gid_offsets):
+        """Add the data read by _read_data_chunk to the gid index"""
+        # Gids without data
+        for gid in set(node_ids.tolist()) - set(needed_gids):
+            self._gid_index[gid] = (self._empty_block, 0, 0)
+        for gid, (start, end) in zip(needed_gids, pairwise(gid_offsets), strict=True):
+            self._gid_index[gid] = (block, start, end)
+
+    def _read_data_chunk(self, node_ids, minimal_mode=False):  # noqa: C901
+        """Read all synapses of the given (sorted) node ids into a new _EdgeDataBlock.
+
+        The reader state is not modified, so that it can run in a background thread.
+
+        Returns:
+            A tuple (gids with data, block, gid offsets in the block)
+        """
         compute_fields = {"sgid", "tgid", *self.SYNAPSE_INDEX_NAMES}
-        orig_needed_gids_set = set(gids) - set(self._data.keys())
-        needed_gids = sorted(orig_needed_gids_set)
-
-        def get_edge_and_lookup_gids(needed_gids: libsonata.Selection):
-            """Retrieve edge and corresponding gid for"""
-            node_ids = np.array(needed_gids, dtype="int64")
-            if self.LOOKUP_BY_TARGET_IDS:
-                edge_ids = self._population.afferent_edges(node_ids)
-                return edge_ids, self._population.target_nodes(edge_ids)
-            edge_ids = self._population.efferent_edges(node_ids)
-            return edge_ids, self._population.source_nodes(edge_ids)
-
-        # NOTE: needed_edge_ids, lookup_gids are used in _populate and _read
-        needed_edge_ids, lookup_gids = get_edge_and_lookup_gids(needed_gids)
-
-        # Find and exclude gids without data
-        different_gids_edge_i = np.diff(lookup_gids, prepend=np.nan).nonzero()[0]
-        needed_gids = sorted(lookup_gids[different_gids_edge_i])
-        for gid in orig_needed_gids_set - set(needed_gids):
-            self._data.setdefault(gid, self.EMPTY_DATA)
+        block = _EdgeDataBlock()
+
+        # NOTE: needed_edge_ids, edge_order are used in _populate and _read
+        needed_edge_ids, lookup_gids = self._get_edge_and_lookup_gids(node_ids)
+        needed_gids, edge_order, gid_offsets = _partition_by_gid(lookup_gids)
 
         # In minimal mode read a single synapse (the first) of each target gid
         if minimal_mode:
-            needed_edge_ids = libsonata.Selection(needed_edge_ids.flatten()[different_gids_edge_i])
-            lookup_gids = lookup_gids[different_gids_edge_i]
+            first_edge_i = gid_offsets[:-1] if edge_order is None else edge_order[gid_offsets[:-1]]
+            needed_edge_ids = libsonata.Selection(needed_edge_ids.flatten()[first_edge_i])
+            edge_order, gid_offsets = None, np.arange(len(needed_gids) + 1)
 
         def _populate(field, data):
             # Populate cache. Unavailable entries are stored as a plain -1
             if data is None:
                 data = -1
-            for gid in needed_gids:
-                existing_gid_data = self._data.setdefault(gid, {})
-                existing_gid_data[field] = data if np.isscalar(data) else data[lookup_gids == gid]
+            elif edge_order is not None and not np.isscalar(data):
+                data = data[edge_order]  # sort by gid, so that each gid data is a range
+            block.columns[field] = data
 
         def _read(attribute, optional=False):
             if attribute in self._population.attribute_names:
@@ -334,27 +641,40 @@ class SonataReader:
                 _populate("isec", 0)
                 _populate("ipt", -1)
                 _populate("offset", 0)
-                return  # done! Skip extra fields
+                return needed_gids, block, gid_offsets  # minimal mode skips extra fields
             self._load_params_custom(_populate, _read)
 
-        # Extend Gids data with the additional requested fields
-        # This has to work for when we call preload() a second/third time
-        # so we are unsure about which gids were loaded what properties
-        # We nevertheless can skip any base fields
-        extra_fields = self._extra_fields - (self.Parameters.all_fields() | compute_fields)
-        for field in sorted(extra_fields):
-            now_needed_gids = sorted(
-                {
-                    gid
-                    for gid in gids
-                    if (data := self._data[gid]) is not self.EMPTY_DATA and field not in data
-                }
-            )
-            if needed_gids != now_needed_gids:
-                needed_gids = now_needed_gids
-                needed_edge_ids, lookup_gids = get_edge_and_lookup_gids(needed_gids)
-            sonata_attr = self.parameter_mapping.get(field, field)
-            _populate(field, _read(sonata_attr))
+        for field in sorted(self._get_extra_field_names()):
+            _populate(field, _read(self.parameter_mapping.get(field, field)))
+
+        return needed_gids, block, gid_offsets
+
+    def _load_extra_fields(self, gids, extra_fields):
+        """Extend the blocks of the given gids with the additional requested fields.
+
+        This has to work for when we call preload() a second/third time
+        so we are unsure about which blocks were loaded what properties
+        """
+        if not extra_fields:
+            return
+        blocks = {id(block): block for block, _, _ in map(self._gid_index.get, gids)}
+        blocks.pop(id(self._empty_block), None)
+        for block in blocks.values():
+            missing_fields = extra_fields - block.columns.keys()
+            if not missing_fields:
+                continue
+            # Edge ids are sorted by gid. Read them in file order and scatter back
+            edge_ids = block.columns[self.SYNAPSE_INDEX_NAMES[0]]
+            edge_order = np.argsort(edge_ids, kind="stable")
+            selection = libsonata.Selection(edge_ids[edge_order])
+            for field in sorted(missing_fields):
+                sonata_attr = self.parameter_mapping.get(field, field)
+                if sonata_attr not in self._population.attribute_names:
+                    raise AttributeError(f"Missing attribute {sonata_attr} in the SONATA edge file")
+                data = self._population.get_attribute(sonata_attr, selection)
+                block.columns[field] = np.empty_like(data)
+                block.columns[field][edge_order] = data
+            block.syn_params = None  # rebuild with the new fields
 
     def _load_params_custom(self, _populate, _read):
         # Position of the synapse
@@ -413,8 +733,9 @@ class SonataReader:
         Notes:
         -----
         The implementation queries the underlying libsonata population using
-        self._population.afferent_edges and self._population.target_nodes to
-        determine the edge-to-target mapping and then counts occurrences.
+        self._population.afferent_edges and self._population.target_nodes (or the
+        node shared edges index, if loaded) to determine the edge-to-target mapping
+        and then counts occurrences.
 
         Example:
         -------
@@ -422,8 +743,8 @@ class SonataReader:
         >>> counts = reader.get_counts(tgids)
         >>> # Possible result: {10: 5, 20: 0, 30: 2}
         """
-        edge_ids = self._population.afferent_edges(tgids)
-        target_nodes = self._population.target_nodes(edge_ids)
+        self._wait_prefetch()  # the edge file must not be read concurrently
+        _, target_nodes = self._get_afferent_edges(tgids)
         unique_nodes, counts = np.unique(target_nodes, return_counts=True)
         unique_gids = unique_nodes
         counts_dict = dict(zip(unique_gids, counts, strict=True))
@@ -449,9 +770,9 @@ class SonataReader:
         Notes:
         -----
         - The method queries the underlying libsonata population using
-        self._population.afferent_edges, self._population.target_nodes and
-        self._population.source_nodes, then counts unique (target, source)
-        pairs.
+        self._population.afferent_edges, self._population.target_nodes (or the
+        node shared edges index, if loaded) and self._population.source_nodes,
+        then counts unique (target, source) pairs.
         - Results are cached in self._counts; only missing tgids are read from
         the file on subsequent calls.
 
@@ -471,9 +792,8 @@ class SonataReader:
             missing_gids = np.fromiter(missing_gids, dtype="uint32")
             missing_gids.sort()
 
-            missing_nodes = missing_gids
-            edge_ids = self._population.afferent_edges(missing_nodes)
-            target_nodes = self._population.target_nodes(edge_ids)
+            self._wait_prefetch()  # the edge file must not be read concurrently
+            edge_ids, target_nodes = self._get_afferent_edges(missing_gids)
             source_nodes = self._population.source_nodes(edge_ids)
             connections = np.empty(len(target_nodes), dtype="uint64,uint64")
             connections["f0"] = target_nodes
@@ -2,6 +2,7 @@
 
 import logging
 from abc import abstractmethod
+from collections.abc import MutableMapping
 from os import path as ospath
 
 import libsonata
@@ -39,13 +40,14 @@ class BaseCell:
         ("myelin", "myelinated"),
     ]
 
-    __slots__ = ("_ccell", "_cellref", "_section_counts", "raw_gid")
+    __slots__ = ("_ccell", "_cellref", "_section_counts", "_section_tables", "raw_gid")
 
     def __init__(self):
         self._cellref = None
         self._ccell = None
         self.raw_gid = None
         self._section_counts = None
+        self._section_tables = None
 
     @property
     def CellRef(self):
@@ -117,6 +119,41 @@ class BaseCell:
 
         raise SectionIdError(f"Unknown section type in: {sec_type}")
 
+    def get_section_table(self, sec_list):
+        """The sections of a section list together with their section ids.
+
+        Section offsets are computed once for all sections. The table is cached per section
+        list, as it's reused by every report and stimulus over the cell.
+
+        :param sec_list: The name of the SectionList, e.g. "somatic" or "all"
+        :return: A tuple (sections, section_ids), the latter a numpy array. Sections whose
+            id can't be determined get -1, see get_section_id.
+        """
+        if self._section_tables is None:
+            self._section_tables = {}
+        table = self._section_tables.get(sec_list)
+        if table is not None:
+            return table
+
+        offsets = {}
+        offset = 0
+        for (sec_type, _), count in zip(
+            BaseCell.SECTION_TYPES, self.get_section_counts(), strict=True
+        ):
+            offsets[sec_type] = (offset, count)
+            offset += count
+
+        sections = list(getattr(self._cellref, sec_list))
+        section_ids = np.full(len(sections), -1, dtype="int64")
+        for i, sec in enumerate(sections):
+            sec_type, _, index_str = str(sec).rsplit(".", 1)[-1].rpartition("[")
+            type_offset, count = offsets.get(sec_type, (0, 0))
+            local_idx = index_str.rstrip("]")
+            if local_idx.isdigit() and int(local_idx) < count:
+                section_ids[i] = type_offset + int(local_idx)
+        table = self._section_tables[sec_list] = (sections, section_ids)
+        return table
+
     def get_sec(self, section_id):
         """Inverse of get_section_id. Given a global section_id, returns the section from the cell.
 
@@ -263,11 +300,21 @@ class Cell_V6(METype):  # noqa: N801
         self.segment_local_coords = {}  # {section_name: list of all segments local coordinates}
         super().__init__(gid, mepath, meinfo.emodel_tpl, morpho_path, meinfo, detailed_axon)
 
+    @classmethod
+    def morphology_name(cls, meinfo):
+        """The morphology file name handed to the EModel templates, with the extension"""
+        return f"{meinfo.morph_name}.{cls.morpho_extension}"
+
+    @classmethod
+    def morphology_file(cls, meinfo, circuit_conf):
+        """The path of the morphology file of a cell, as joined by the EModel templates"""
+        return ospath.join(circuit_conf.MorphologyPath, cls.morphology_name(meinfo))
+
     def _instantiate_cell(self, gid, etype_path, emodel, morpho_path, meinfos_v6, detailed_axon):
         """Instantiates a SSCx v6 cell"""
         Nd.load_hoc(ospath.join(etype_path, emodel))
         EModel = getattr(Nd, emodel)
-        morpho_file = meinfos_v6.morph_name + "." + self.morpho_extension
+        morpho_file = self.morphology_name(meinfos_v6)
         keep_axon = detailed_axon and self.KEEP_AXON_FLAG
         add_params = meinfos_v6.add_params or (keep_axon,)  # Keep axon incompatible with add_params
 
@@ -497,13 +544,131 @@ def vector_rotate_translate(points, transform_matrix):
     return np.einsum("ijk,ik->ij", rot_matrix, points) + translation
 
 
-class METypeManager(dict):  # noqa: FURB189
-    """Map to hold specific METype info and provide retrieval by gid"""
+class _METypeBlock:
+    """METype info of a batch of cells, held as one array per attribute (struct-of-arrays)
+
+    Rows follow the order of the gids given at load time. Items are only materialized on
+    lookup, which saves creating one object and one matrix per cell never looked up.
+    """
+
+    __slots__ = (
+        "add_params",
+        "emodel_tpl",
+        "etype",
+        "exc_mini_frequency",
+        "extra_attrs",
+        "gids",
+        "holding_current",
+        "inh_mini_frequency",
+        "local_to_global_matrix",
+        "morph_name",
+        "mtype",
+        "threshold_current",
+    )
+
+    def __init__(self, gids, **columns):
+        self.gids = gids
+        self.extra_attrs = {}
+        for name, values in columns.items():
+            setattr(self, name, values)
+
+    def __len__(self):
+        return len(self.gids)
+
+    def item(self, row):
+        """Materialize the METypeItem of a given row"""
+        item = METypeItem.__new__(METypeItem)
+        for name in ("morph_name", "etype", "emodel_tpl", "mtype", "add_params"):
+            values = getattr(self, name)
+            setattr(item, name, values[row] if values is not None else None)
+        for name in (
+            "threshold_current",
+            "holding_current",
+            "exc_mini_frequency",
+            "inh_mini_frequency",
+        ):
+            values = getattr(self, name)
+            setattr(item, name, float(values[row]) if values is not None else 0.0)
+        matrices = self.local_to_global_matrix
+        item.local_to_global_matrix = (
+            matrices[row] if isinstance(matrices, np.ndarray) else matrices
+        )
+        item.extra_attrs = {name: values[row] for name, values in self.extra_attrs.items()}
+        return item
+
+
+class METypeManager(MutableMapping):
+    """Map to hold specific METype info and provide retrieval by gid
+
+    Cells added in bulk with `load_infoNP` are stored column-wise and their METypeItem
+    objects are created on first access, then kept. Individually inserted items are kept as
+    such. Iteration follows the insertion order, like a dict.
+    """
+
+    def __init__(self):
+        self._segments = []  # dicts of individually inserted items and blocks, in order
+        self._item_segments = {}  # {gid: the dict segment holding its item}
+        self._blocks = []
+        self._block_items = {}  # {gid: METypeItem} materialized from blocks
+        # All block gids, sorted, with the block and row of each
+        self._index_gids = np.empty(0, dtype="int64")
+        self._index_blocks = np.empty(0, dtype="int32")
+        self._index_rows = np.empty(0, dtype="int64")
 
     def insert(self, gid, morph_name, *me_data, **kwargs):
         """Function to add an METypeItem to internal data structure"""
         self[int(gid)] = METypeItem(morph_name, *me_data, **kwargs)
 
+    def _find(self, gid):
+        """Return the block and row of a bulk-loaded gid, or (None, None)"""
+        pos = np.searchsorted(self._index_gids, gid)
+        if pos < len(self._index_gids) and self._index_gids[pos] == gid:
+            return self._blocks[self._index_blocks[pos]], self._index_rows[pos]
+        return None, None
+
+    def __getitem__(self, gid):
+        segment = self._item_segments.get(gid)
+        if segment is not None:
+            return segment[gid]
+        item = self._block_items.get(gid)
+        if item is None:
+            block, row = self._find(gid)
+            if block is None:
+                raise KeyError(gid)
+            item = self._block_items[gid] = block.item(row)
+        return item
+
+    def __setitem__(self, gid, item):
+        segment = self._item_segments.get(gid)
+        if segment is None:
+            if self._find(gid)[0] is not None:
+                raise KeyError(f"gid {gid} was bulk-loaded and can't be replaced")
+            if not self._segments or not isinstance(self._segments[-1], dict):
+                self._segments.append({})
+            segment = self._item_segments[gid] = self._segments[-1]
+        segment[gid] = item
+
+    def __delitem__(self, gid):
+        segment = self._item_segments.pop(gid, None)
+        if segment is None:
+            if self._find(gid)[0] is not None:
+                raise KeyError(f"gid {gid} was bulk-loaded and can't be deleted")
+            raise KeyError(gid)
+        del segment[gid]
+
+    def __contains__(self, gid):
+        return gid in self._item_segments or self._find(gid)[0] is not None
+
+    def __iter__(self):
+        for segment in self._segments:
+            if isinstance(segment, dict):
+                yield from segment
+            else:
+                yield from segment.gids.tolist()
+
+    def __len__(self):
+        return len(self._item_segments) + len(self._index_gids)
+
     def load_infoNP(
         self,
         gidvec,
@@ -519,29 +684,85 @@ class METypeManager(dict):  # noqa: FURB189
         rotations=None,
         add_params_list=None,
     ):
-        """Loads METype information in bulk from Numpy arrays"""
-        for idx, gid in enumerate(gidvec):
-            th_current = threshold_currents[idx] if threshold_currents is not None else 0.0
-            hd_current = holding_currents[idx] if holding_currents is not None else 0.0
-            exc_mini_freq = exc_mini_freqs[idx] if exc_mini_freqs is not None else 0.0
-            inh_mini_freq = inh_mini_freqs[idx] if inh_mini_freqs is not None else 0.0
-            position = positions[idx] if positions is not None else None
-            rotation = rotations[idx] if rotations is not None else None
-            mtype = mtypes[idx] if mtypes is not None else None
-            add_params = add_params_list[idx] if add_params_list is not None else None
-            self[int(gid)] = METypeItem(
-                morph_list[idx],
-                etype=etypes[idx] if etypes is not None else None,
-                emodel_tpl=model_templates and model_templates[idx],
-                mtype=mtype,  # TODO: check this
-                threshold_current=th_current,
-                holding_current=hd_current,
-                exc_mini_frequency=exc_mini_freq,
-                inh_mini_frequency=inh_mini_freq,
-                position=position,
-                rotation=rotation,
-                add_params=add_params,
-            )
+        """Loads METype information in bulk from Numpy arrays
+
+        Data is kept as columns and the coordinate mapping matrices of all cells are computed
+        in a single batched rotation. gids must not have been loaded before.
+        """
+        gids = np.asarray(gidvec, dtype="int64")
+        if not len(gids):
+            return
+        known = np.fromiter(self._item_segments, dtype="int64", count=len(self._item_segments))
+        if np.isin(gids, known).any() or np.isin(gids, self._index_gids).any():
+            raise KeyError("METype info of some gids was already loaded")
+
+        def as_floats(values):
+            return None if values is None else np.asarray(values, dtype=float)
+
+        cli_opts = SimConfig.cli_options
+        matrices = (
+            self._make_coord_map_matrices(positions, rotations)
+            if cli_opts is None
+            or cli_opts.enable_coord_mapping
+            or SimConfig.has_extracellular_stimulus
+            else False
+        )
+        block = _METypeBlock(
+            gids,
+            morph_name=morph_list,
+            etype=etypes,
+            emodel_tpl=model_templates,
+            mtype=mtypes,
+            threshold_current=as_floats(threshold_currents),
+            holding_current=as_floats(holding_currents),
+            exc_mini_frequency=as_floats(exc_mini_freqs),
+            inh_mini_frequency=as_floats(inh_mini_freqs),
+            add_params=add_params_list,
+            local_to_global_matrix=matrices,
+        )
+        self._segments.append(block)
+        self._blocks.append(block)
+        block_ids = np.full(len(gids), len(self._blocks) - 1, dtype="int32")
+        index_gids = np.concatenate((self._index_gids, gids))
+        order = np.argsort(index_gids, kind="stable")
+        self._index_gids = index_gids[order]
+        self._index_blocks = np.concatenate((self._index_blocks, block_ids))[order]
+        self._index_rows = np.concatenate((self._index_rows, np.arange(len(gids))))[order]
+
+    @staticmethod
+    def _make_coord_map_matrices(positions, rotations, scale=1.0):
+        """Build the local to global transformation matrices of many cells at once.
+
+        Equivalent to METypeItem._make_coord_map_matrix applied to every row.
+        """
+        if rotations is None:
+            return None
+        from scipy.spatial.transform import Rotation
+
+        m = np.empty((len(rotations), 3, 4), np.float32)
+        m[:, :, :3] = Rotation.from_quat(rotations).as_matrix()  # scipy auto-normalizes
+        m[:, :, 3] = positions
+        m[:, :, 3] *= scale
+        return m
+
+    def set_extra_attr(self, name, values):
+        """Set an extra attribute of all cells, values given in the iteration (keys) order"""
+        if len(values) != len(self):
+            raise ValueError(f"Got {len(values)} values of {name} for {len(self)} cells")
+        offset = 0
+        block_offsets = {}
+        for segment in self._segments:
+            if isinstance(segment, dict):
+                for item, value in zip(segment.values(), values[offset:], strict=False):
+                    item.extra_attrs[name] = value
+            else:
+                segment.extra_attrs[name] = values[offset : offset + len(segment)]
+                block_offsets[id(segment)] = offset
+            offset += len(segment)
+        # Items already materialized don't see the block columns
+        for gid, item in self._block_items.items():
+            block, row = self._find(gid)
+            item.extra_attrs[name] = values[block_offsets[id(block)] + row]
 
     @property
     def gids(self):
@@ -4,11 +4,16 @@ features on top of MorphIO basic morphology handling.
 
 import logging
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 
 import numpy as np
 from numpy.linalg import eigh, norm
 
+from .core import NeuronWrapper as Nd
+
 """
     [START] Implementations retrieved from nse/morph-tool (!= hpc/morpho-tool !!!)
     These functions are needed for soma points computation (a la import3d).
@@ -168,6 +173,32 @@ def single_point_sphere_to_circular_contour(neuron):
 """
 
 
+def round_significant_8(values):
+    """Round values to 8 significant digits, exactly as formatting them with '%.8g' and
+    parsing them back (as the hoc commands of MorphIOWrapper.morph_as_hoc do).
+
+    Float32 values with 1e-5 <= |x| < 1e8 are scaled by a power of 10 exactly, so that
+    rounding and the final (correctly rounded) division match the decimal conversion.
+    Other values, rare in morphologies, are converted through strings.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    abs_values = np.abs(values)
+    fast = (abs_values >= 1e-5) & (abs_values < 1e8)
+    with np.errstate(divide="ignore"):
+        digits = np.where(fast, 7 - np.floor(np.log10(abs_values)), 0).astype(int)
+    # log10 may be off by one close to powers of 10. Scaled values must have 8 digits
+    scaled = abs_values * 10.0**digits
+    digits += (scaled < 1e7).astype(int) - (scaled >= 1e8)
+    scale = 10.0**digits
+    result = np.round(values * scale) / scale
+    fast &= (digits >= 0) & (digits <= 12)  # float32 * 10**12 is exact
+    zero = values == 0
+    result[zero] = values[zero]
+    slow = ~(fast | zero)
+    result[slow] = [float(f"{v:.8g}") for v in values[slow]]
+    return result
+
+
 @dataclass
 class SectionName:
     """A simple container to uniquely identify a NEURON Section by name and ID.
@@ -211,6 +242,20 @@ class MorphIOWrapper:
         self._section_names = self._get_section_names()
         self._build_sec_typeid_distrib()
 
+    @property
+    def nbytes(self):
+        """An estimate of the memory taken by the morphology points and sections"""
+        morph = self._morph
+        return (
+            morph.points.nbytes
+            + morph.diameters.nbytes
+            + morph.soma.points.nbytes
+            + morph.soma.diameters.nbytes
+            + morph.section_offsets.nbytes
+            + morph.section_types.nbytes
+            + self._sec_typeid_distrib.nbytes
+        )
+
     def _build_morph(self):
         """Build immutable morphology, going trough mutable and applying neuron adjustemnts"""
         try:
@@ -366,6 +411,53 @@ class MorphIOWrapper:
 
         return cmds
 
+    def instantiate(self, cell):
+        """Create the morphology sections in a hoc cell, like executing the morph_as_hoc
+        commands, but connecting sections and adding their 3D points directly, in bulk.
+
+        Only the create / section list commands are still executed as hoc.
+        Points are rounded like in the hoc commands, so that geometry is identical.
+        """
+        for [(type_id, count)] in self._sec_typeid_distrib[["type_id", "count"]]:
+            tstr = self.type2name(type_id)
+            Nd.execute(f"create {tstr}[{count}]", cell)
+            Nd.execute(self.mksubset(type_id, tstr), cell)
+        Nd.execute("forall all.append", cell)
+
+        sec_arrays = {name: getattr(cell, name) for name in {sn.name for sn in self._section_names}}
+        sections = [sec_arrays[sn.name][sn.id] for sn in self._section_names]
+        soma = sections[0]
+
+        # Soma points. Order is reversed wrt NEURON's soma points.
+        self._pt3dadd(
+            soma,
+            round_significant_8(self._morph.soma.points[::-1]),
+            round_significant_8(self._morph.soma.diameters[::-1]),
+        )
+
+        points = round_significant_8(self._morph.points)
+        diameters = round_significant_8(self._morph.diameters)
+        offsets = self._morph.section_offsets
+        for i, sec in enumerate(self._morph.sections):
+            nrn_sec = sections[i + 1]
+            if not sec.is_root:
+                if sec.parent is not None:
+                    nrn_sec.connect(sections[sec.parent.id + 1](1), 0)
+            else:
+                nrn_sec.connect(soma(0.5), 0)
+            start, end = offsets[i], offsets[i + 1]
+            self._pt3dadd(nrn_sec, points[start:end], diameters[start:end])
+
+    @staticmethod
+    def _pt3dadd(sec, points, diameters):
+        Nd.pt3dadd(
+            Nd.Vector(points[:, 0]),
+            Nd.Vector(points[:, 1]),
+            Nd.Vector(points[:, 2]),
+            Nd.Vector(diameters),
+            sec=sec,
+        )
+
     """
          [START] Python versions of import3d_gui.hoc helper functions
          Note: nrn function names will be kept for reference
@@ -399,3 +491,105 @@ class MorphIOWrapper:
 
         tstr1 = f'forsec "{type_name}" {tstr}.append'
         return tstr1
+
+
+class MorphologyCache:
+    """A per-rank LRU cache of processed morphologies (MorphIOWrapper objects).
+
+    Entries are keyed by the morphology file path and the load options, and the least
+    recently used are evicted to keep the cache within max_bytes (See MorphIOWrapper.nbytes).
+    Cells sharing a morphology are then built without reading and processing the file again.
+    Morphologies are immutable so they can be safely shared. Disabled by default.
+    """
+
+    max_bytes = 0
+    _entries = OrderedDict()  # {(path, options): MorphIOWrapper}
+    _size = 0
+
+    @classmethod
+    def get(cls, input_file, options=0) -> MorphIOWrapper:
+        """Return the processed morphology, from the cache if available"""
+        key = (os.path.realpath(input_file), options)
+        morph = cls._entries.get(key)
+        if morph is not None:
+            cls._entries.move_to_end(key)
+            return morph
+
+        morph = MorphIOWrapper(input_file, options)
+        if morph.nbytes <= cls.max_bytes:
+            cls._entries[key] = morph
+            cls._size += morph.nbytes
+            while cls._size > cls.max_bytes:
+                _, evicted = cls._entries.popitem(last=False)
+                cls._size -= evicted.nbytes
+        return morph
+
+    @classmethod
+    def clear(cls):
+        cls._entries.clear()
+        cls._size = 0
+
+    @classmethod
+    @contextmanager
+    def enabled(cls, max_bytes):
+        """Enable the cache within a context, dropping all entries at the end"""
+        cls.max_bytes = max_bytes
+        try:
+            yield cls
+        finally:
+            cls.max_bytes = 0
+            cls.clear()
+
+
+class MorphologyReadAhead:
+    """Reads the morphology files of the upcoming cells in background threads, so that they
+    are in the OS page cache once loaded, overlapping the file system latency with the
+    construction of the previous cells.
+
+    Files are only read, not decoded: MorphIO holds the GIL while loading, whereas plain file
+    reads release it. At most `depth` files ahead of the current cell are read, each only once.
+    """
+
+    BLOCK_SIZE = 1 << 20
+
+    def __init__(self, files, workers, depth=32):
+        self._files = files
+        self._depth = depth
+        self._submitted = 0
+        self._seen = set()
+        self._executor = None
+        if workers > 0 and files:
+            self._executor = ThreadPoolExecutor(workers, thread_name_prefix="MorphReadAhead")
+
+    def advance(self, position):
+        """Start reading the files up to `position + depth`"""
+        if self._executor is None:
+            return
+        end = min(position + self._depth, len(self._files))
+        for path in self._files[self._submitted : end]:
+            if path not in self._seen:
+                self._seen.add(path)
+                self._executor.submit(self._read_file, path)
+        self._submitted = max(self._submitted, end)
+
+    @classmethod
+    def _read_file(cls, path):
+        """Read a file, discarding the data. Errors are raised later, by the actual load"""
+        buffer = bytearray(cls.BLOCK_SIZE)
+        try:
+            with open(path, "rb", buffering=0) as f:
+                while f.readinto(buffer):
+                    pass
+        except OSError as e:
+            logging.debug("Morphology read-ahead of %s failed: %s", path, e)
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
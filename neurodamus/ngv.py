@@ -44,7 +44,8 @@ class Astrocyte(BaseCell):
             Path(circuit_conf.MorphologyPath)
             / f"{meinfos.morph_name}.{circuit_conf.MorphologyType}"
         )
-        self._cellref.AddHocMorph(morph.morph_as_hoc())
+        morph.instantiate(self._cellref)
+        self._cellref.indexSections()
         # Recalculate number of segments and sections
         self._cellref.geom_nseg_fixed()
         self._cellref.geom_nsec()
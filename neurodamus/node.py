@@ -65,7 +65,7 @@ from .io.sonata_config import ConnectionTypes, RunConfig
 from .modification_manager import ModificationManager
 from .neuromodulation_manager import NeuroModulationManager
 from .replay import MissingSpikesPopulationError, SpikeManager
-from .report import ReportManager
+from .report import PointProcessIndex, ReportManager
 from .report_parameters import (
     check_report_parameters,
     create_report_parameters,
@@ -524,9 +524,11 @@ class Node:
         return load_balancer
 
     def _memory_mode_load_balancing(self):
-        filename = f"allocation_r{MPI.size}_c{SimConfig.modelbuilding_steps}.pkl.gz"
+        filename = f"allocation_r{MPI.size}_c{SimConfig.modelbuilding_steps}"
 
-        file_exists = ospath.exists(filename)
+        file_exists = ospath.exists(filename + ".index.npy")
+        if not file_exists and ospath.exists(filename + ".pkl.gz"):  # previous format
+            filename, file_exists = filename + ".pkl.gz", True
         MPI.barrier()
 
         self._dry_run_stats = DryRunStats()
@@ -949,78 +951,80 @@ class Node:
         # we can do it in one go later
         substitutions = defaultdict(dict)
         cumulative_error = CumulativeError()
-        for rep_name, rep_conf in reports_conf.items():
-            cumulative_error.is_error_appended = False
-            target_spec = TargetSpec(rep_conf.cells, None)
-            target = self._target_manager.get_target(target_spec)
-
-            # Build final config. On errors log, stop only after all reports processed
-            rep_params = create_report_parameters(
-                sim_end=self._run_conf.tstop,
-                nd_t=Nd.t,
-                output_root=SimConfig.output_root,
-                rep_name=rep_name,
-                rep_conf=rep_conf,
-                target=target,
-                buffer_size=SimConfig.report_buffer_size,
-                cumulative_error=cumulative_error,
-            )
-            if cumulative_error.is_error_appended:
-                continue
-            check_report_parameters(
-                rep_params,
-                Nd.dt,
-                lfp_active=bool(rep_conf.electrodes_file) and SimConfig.use_coreneuron,
-                cumulative_error=cumulative_error,
-            )
-            if cumulative_error.is_error_appended:
-                continue
-
-            if SimConfig.restore_coreneuron:
-                substitutions[rep_params.name]["end_time"] = rep_params.end
-                continue  # we dont even need to initialize reports
-
-            # With coreneuron direct mode, enable fast membrane current calculation
-            # for i_membrane
-            if (
-                SimConfig.coreneuron_direct_mode and "i_membrane" in rep_params.report_on
-            ) or rep_params.type == libsonata.SimulationConfig.Report.Type.lfp:
-                Nd.cvode.use_fast_imem(1)
+        # Point processes of the reported sections are indexed once, for all reports
+        with PointProcessIndex.enabled():
+            for rep_name, rep_conf in reports_conf.items():
+                cumulative_error.is_error_appended = False
+                target_spec = TargetSpec(rep_conf.cells, None)
+                target = self._target_manager.get_target(target_spec)
+
+                # Build final config. On errors log, stop only after all reports processed
+                rep_params = create_report_parameters(
+                    sim_end=self._run_conf.tstop,
+                    nd_t=Nd.t,
+                    output_root=SimConfig.output_root,
+                    rep_name=rep_name,
+                    rep_conf=rep_conf,
+                    target=target,
+                    buffer_size=SimConfig.report_buffer_size,
+                    cumulative_error=cumulative_error,
+                )
+                if cumulative_error.is_error_appended:
+                    continue
+                check_report_parameters(
+                    rep_params,
+                    Nd.dt,
+                    lfp_active=bool(rep_conf.electrodes_file) and SimConfig.use_coreneuron,
+                    cumulative_error=cumulative_error,
+                )
+                if cumulative_error.is_error_appended:
+                    continue
 
-            has_gids = len(self._circuits.global_manager.get_final_gids()) > 0
-            if not has_gids:
-                self._report_list.append(None)
-                continue
+                if SimConfig.restore_coreneuron:
+                    substitutions[rep_params.name]["end_time"] = rep_params.end
+                    continue  # we dont even need to initialize reports
 
-            report = ReportManager.create(
-                params=rep_params,
-                use_coreneuron=SimConfig.use_coreneuron,
-                cumulative_error=cumulative_error,
-            )
-            if cumulative_error.is_error_appended:
-                continue
-            self._set_point_list_in_rep_params(rep_params, cumulative_error=cumulative_error)
-            if cumulative_error.is_error_appended:
-                continue
+                # With coreneuron direct mode, enable fast membrane current calculation
+                # for i_membrane
+                if (
+                    SimConfig.coreneuron_direct_mode and "i_membrane" in rep_params.report_on
+                ) or rep_params.type == libsonata.SimulationConfig.Report.Type.lfp:
+                    Nd.cvode.use_fast_imem(1)
 
-            if SimConfig.use_coreneuron:
-                core_report_config.add_entry(
-                    CoreReportConfigEntry.from_report_params(rep_params=rep_params)
-                )
+                has_gids = len(self._circuits.global_manager.get_final_gids()) > 0
+                if not has_gids:
+                    self._report_list.append(None)
+                    continue
 
-            if (
-                not SimConfig.use_coreneuron
-                or rep_params.type == libsonata.SimulationConfig.Report.Type.synapse
-            ):
-                report.setup(
-                    rep_params=rep_params,
-                    global_manager=self._circuits.global_manager,
+                report = ReportManager.create(
+                    params=rep_params,
+                    use_coreneuron=SimConfig.use_coreneuron,
                     cumulative_error=cumulative_error,
                 )
                 if cumulative_error.is_error_appended:
                     continue
+                self._set_point_list_in_rep_params(rep_params, cumulative_error=cumulative_error)
+                if cumulative_error.is_error_appended:
+                    continue
+
+                if SimConfig.use_coreneuron:
+                    core_report_config.add_entry(
+                        CoreReportConfigEntry.from_report_params(rep_params=rep_params)
+                    )
+
+                if (
+                    not SimConfig.use_coreneuron
+                    or rep_params.type == libsonata.SimulationConfig.Report.Type.synapse
+                ):
+                    report.setup(
+                        rep_params=rep_params,
+                        global_manager=self._circuits.global_manager,
+                        cumulative_error=cumulative_error,
+                    )
+                    if cumulative_error.is_error_appended:
+                        continue
 
-            self._report_list.append(report)
+                self._report_list.append(report)
 
         if SimConfig.restore_coreneuron:
             CoreReportConfig.update_file(CoreConfig.report_config_file_save, substitutions)
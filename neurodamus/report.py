@@ -1,4 +1,5 @@
 import logging
+from contextlib import contextmanager
 
 import libsonata
 
@@ -46,6 +47,74 @@ class ReportManager:
         return report_cls(params, use_coreneuron)
 
 
+class _SectionPointProcesses:
+    """The point processes of a section, grouped per mechanism by compartment"""
+
+    __slots__ = ("_by_mechanism", "_nseg", "point_processes")
+
+    def __init__(self, section):
+        self._nseg = section.nseg
+        self.point_processes = [(pp.hname(), pp) for seg in section for pp in seg.point_processes()]
+        self._by_mechanism = {}
+
+    def by_compartment(self, mechanism):
+        """The point processes of a mechanism as {compartment_id: [pp, ...]}, in section order"""
+        index = self._by_mechanism.get(mechanism)
+        if index is None:
+            index = self._by_mechanism[mechanism] = {}
+            for name, pp in self.point_processes:
+                if mechanism is None or name.startswith(mechanism):
+                    # warning: get_loc pushes sec into neuron stack
+                    compartment_id = int(pp.get_loc() * self._nseg)
+                    Nd.pop_section()
+                    index.setdefault(compartment_id, []).append(pp)
+        return index
+
+
+class PointProcessIndex:
+    """Index of the point processes of the reported sections, by mechanism and compartment.
+
+    Reports look up the point processes at each of their (section, x) points. Rather than
+    scanning all the point processes of the section every time, which is quadratic in the
+    number of synapses per section, sections are indexed once on first use.
+
+    The index is kept, and shared by all reports, while `enabled`. Otherwise sections are
+    indexed on every lookup.
+    """
+
+    _sections = None  # {section: _SectionPointProcesses} while enabled
+
+    @classmethod
+    @contextmanager
+    def enabled(cls):
+        """Keep the index for the duration of the context, e.g. the setup of all reports"""
+        cls._sections = {}
+        try:
+            yield
+        finally:
+            cls._sections = None
+
+    @classmethod
+    def get(cls, section):
+        if cls._sections is None:
+            return _SectionPointProcesses(section)
+        entry = cls._sections.get(section)
+        if entry is None:
+            entry = cls._sections[section] = _SectionPointProcesses(section)
+        return entry
+
+    @classmethod
+    def at_location(cls, section, x, mechanism=None):
+        """The point processes of a mechanism located in the compartment of x"""
+        by_compartment = cls.get(section).by_compartment(mechanism)
+        return by_compartment.get(int(x * section.nseg), [])
+
+    @classmethod
+    def has_mechanism(cls, section, mechanism):
+        """Whether there are point processes of a given mechanism in the section"""
+        return bool(cls.get(section).by_compartment(mechanism))
+
+
 class Report:
     """Abstract base class for handling simulation reports in NEURON.
 
@@ -76,6 +145,7 @@ class Report:
         self.use_coreneuron = use_coreneuron
 
         self.alu_list = []
+        self.alu_outputs = []  # output vectors of ALUs summing several compartments
         self.report = Nd.SonataReport(
             0.5,
             params.name,
@@ -140,14 +210,10 @@ class Report:
         :param mechanism: The mechanism requested
         :return: A list of synapse objects attached to the section.
         """
-        if mechanism is None:
-            return [syn for seg in section for syn in seg.point_processes()]
-
         return [
             syn
-            for seg in section
-            for syn in seg.point_processes()
-            if syn.hname().startswith(mechanism)
+            for name, syn in PointProcessIndex.get(section).point_processes
+            if mechanism is None or name.startswith(mechanism)
         ]
 
     @staticmethod
@@ -197,10 +263,8 @@ class Report:
         list
             A list of variable references (typically hoc references) matching the query.
         """
-        point_processes = Report.get_point_processes(section, mechanism)
         # if not a point process, it is a current of voltage. Directly return the reference
-
-        if not point_processes:
+        if not PointProcessIndex.has_mechanism(section, mechanism):
             sec_x = section(x)
             var_name = "_ref_" + mechanism
             if hasattr(sec_x, var_name):
@@ -214,9 +278,8 @@ class Report:
         # search among the point processes the ones that at at position x and return the reference
         return [
             getattr(pp, "_ref_" + variable_name)
-            for pp in point_processes
-            if Report.is_point_process_at_location(pp, section, x)
-            and hasattr(pp, "_ref_" + variable_name)
+            for pp in PointProcessIndex.at_location(section, x, mechanism)
+            if hasattr(pp, "_ref_" + variable_name)
         ]
 
     def get_scaling_factor(self, section, x, mechanism):
@@ -278,8 +341,7 @@ class CompartmentReport(Report):
 
         mechanism, variable_name = self.variables[0]
         self.report.AddNode(gid, pop_name, pop_offset)
-        for i, sc in enumerate(point.sclst):
-            section = sc.sec
+        for i, section in enumerate(point.sections):
             x = point.x[i]
             var_refs = self.get_var_refs(section, x, mechanism, variable_name)
             if len(var_refs) == 0:
@@ -296,8 +358,7 @@ class CompartmentReport(Report):
                     "Probably many synapses attached to the soma. "
                     "Compartment reports require only one variable per segment."
                 )
-            section_id = cell_obj.get_section_id(section)
-            self.report.AddVar(var_refs[0], section_id, gid, pop_name)
+            self.report.AddVar(var_refs[0], point.sclst_ids[i], gid, pop_name)
 
 
 @ReportManager.register_type(libsonata.SimulationConfig.Report.Type.summation)
@@ -335,30 +396,29 @@ class SummationReport(Report):
         vgid = vgid or gid
 
         self.report.AddNode(gid, pop_name, pop_offset)
+        alu_helper = self.setup_alu_for_summation(0.5)
 
         if sections == libsonata.SimulationConfig.Report.Sections.soma:
-            alu_helper = self.setup_alu_for_summation(0.5)
-
-        for i, sc in enumerate(point.sclst):
-            section = sc.sec
-            x = point.x[i]
-            if sections == libsonata.SimulationConfig.Report.Sections.all:
-                alu_helper = self.setup_alu_for_summation(x)
-
-            self.process_mechanisms(section, x, alu_helper)
-
-            if sections == libsonata.SimulationConfig.Report.Sections.all:
-                section_index = cell_obj.get_section_id(section)
-                self.add_summation_var_and_commit_alu(alu_helper, section_index, gid, pop_name)
-        if sections == libsonata.SimulationConfig.Report.Sections.soma:
-            # soma
+            for i, section in enumerate(point.sections):
+                self.process_mechanisms(section, point.x[i], alu_helper)
             self.add_summation_var_and_commit_alu(alu_helper, 0, gid, pop_name)
+            return
+
+        # A single ALU sums the variables of all compartments, one output element each
+        outputs = Nd.Vector(len(point.x))
+        alu_helper.setoutputs(outputs)
+        for i, section in enumerate(point.sections):
+            self.process_mechanisms(section, point.x[i], alu_helper, slot=i)
+            self.report.AddVar(outputs._ref_x[i], point.sclst_ids[i], gid, pop_name)
+        self.alu_list.append(alu_helper)
+        self.alu_outputs.append(outputs)
 
-    def process_mechanisms(self, section, x, alu_helper):
+    def process_mechanisms(self, section, x, alu_helper, slot=None):
         """Add the ref variable identified by x, mechanism, and variable_name
         to alu_helper multiplied by the scaling_factor.
 
         Note: compartments without the variable are silently skipped.
+        If slot is given the variables are summed into that element of the ALU outputs.
         """
         for mechanism, variable in self.variables:
             scaling_factor = self.get_scaling_factor(section, x, mechanism)
@@ -370,7 +430,10 @@ class SummationReport(Report):
                 continue
             var_refs = Report.get_var_refs(section, x, mechanism, variable)
             for var_ref in var_refs:
-                alu_helper.addvar(var_ref, scaling_factor)
+                if slot is None:
+                    alu_helper.addvar(var_ref, scaling_factor)
+                else:
+                    alu_helper.addvar(var_ref, scaling_factor, slot)
 
     def setup_alu_for_summation(self, alu_x):
         """Setup ALU helper for summation."""
@@ -418,18 +481,14 @@ class SynapseReport(Report):
         synapse_list = []
         mechanism, variable = self.variables[0]
         # Evaluate which synapses to report on
-        for i, sc in enumerate(point.sclst):
-            section = sc.sec
+        for i, section in enumerate(point.sections):
             x = point.x[i]
-            # Iterate over point processes in the section
-
-            point_processes = self.get_point_processes(section, mechanism)
-            for synapse in point_processes:
-                if self.is_point_process_at_location(synapse, section, x):
-                    synapse_list.append(synapse)
-                    # Mark synapse as selected for report
-                    if hasattr(synapse, "selected_for_report"):
-                        synapse.selected_for_report = True
+            # Iterate over point processes at the location
+            for synapse in PointProcessIndex.at_location(section, x, mechanism):
+                synapse_list.append(synapse)
+                # Mark synapse as selected for report
+                if hasattr(synapse, "selected_for_report"):
+                    synapse.selected_for_report = True
 
         if not synapse_list:
             raise AttributeError(f"Synapse '{mechanism}' not found on any points on gid: {gid}. ")
@@ -38,14 +38,50 @@ class TargetPointList:
 
     Maintains parallel lists of section IDs, section references, and offsets,
     with methods to append, extend, validate, and iterate over the stored points.
+
+    Point lists built in bulk (`from_sections`) hold the plain sections and only create the
+    section references when `sclst` is first accessed, one per section.
     """
 
     def __init__(self, gid: int):
         self.gid: int = gid
         self.sclst_ids: list = []  # List of section ids
-        self.sclst: list = []  # List of section references
+        self._sclst: list | None = []  # List of section references
+        self._sections: list | None = None  # List of sections, when sclst is not created yet
         self.x: list = []  # List of point values
 
+    @classmethod
+    def from_sections(
+        cls, gid: int, section_ids: list, sections: list, x: list
+    ) -> "TargetPointList":
+        """Create a point list from parallel lists of section ids, sections and offsets"""
+        point_list = cls(gid)
+        point_list.sclst_ids = section_ids
+        point_list._sclst = None
+        point_list._sections = sections
+        point_list.x = x
+        return point_list
+
+    @property
+    def sclst(self) -> list:
+        """The section references of the points. Points on the same section share it"""
+        if self._sclst is None:
+            self._sclst = []
+            last_sec = sec_ref = None
+            for sec in self._sections:
+                if sec is not last_sec:
+                    last_sec, sec_ref = sec, Nd.SectionRef(sec)
+                self._sclst.append(sec_ref)
+            self._sections = None
+        return self._sclst
+
+    @property
+    def sections(self) -> list:
+        """The sections of the points, avoiding section references where possible"""
+        if self._sections is not None:
+            return self._sections
+        return [sc.sec for sc in self._sclst]
+
     def append(self, section_id: int, section: object, point: float) -> None:
         self.x.append(point)
         self.sclst.append(section)
@@ -60,18 +96,19 @@ class TargetPointList:
         self.sclst_ids.extend(other.sclst_ids)
 
     def validate(self) -> None:
-        if len(self.x) != len(self.sclst) != len(self.sclst_ids):
+        n_sections = len(self._sections if self._sclst is None else self._sclst)
+        if len(self.x) != n_sections != len(self.sclst_ids):
             raise RuntimeError(
                 f"TargetPointList invariant violated: "
                 f"x has {len(self.x)} elements, "
-                f"sclst has {len(self.sclst)} elements, "
+                f"sclst has {n_sections} elements, "
                 f"sclst_ids has {len(self.sclst_ids)} elements. "
                 f"Expected all lists to have equal length."
             )
 
     def __len__(self) -> int:
         self.validate()
-        return len(self.sclst)
+        return len(self.x)
 
     def __iter__(self) -> Iterator[tuple[int, object, float]]:
         self.validate()
@@ -316,46 +353,57 @@ class TargetManager:
         :param offset: Offset distance beyond the ipt (microns)
         :return: List with 1 item, where the synapse should go
         """
-        # Soma connection, just zero it
-        offset = max(offset, 0)
-
         result_point = TargetPointList(gid)
+        sections, distances = self.locations_to_points(gid, [isec], [ipt], [offset])
+        if sections[0] is None:  # Assume we are in LoadBalance mode
+            result_point.append(-1, None, -1)
+        else:
+            result_point.append(int(isec), sections[0], float(distances[0]))
+        return result_point
+
+    def locations_to_points(self, gid, isecs, ipts, offsets):
+        """Vectorized version of location_to_point, for many locations of the same cell,
+        e.g. the isec, ipt and offset fields of a synapse parameters array.
+
+        :param gid: GID of the cell
+        :param isecs: Array of section indexes
+        :param ipts: Array of 3d point indexes (-1 when offset is the section position)
+        :param offsets: Array of offsets beyond the ipt (microns) or section positions
+        :return: A tuple with the list of section references (None when the section is not
+            instantiated, e.g. in LoadBalance mode) and the array of their x position
+        """
         cell_sections = self.gid_to_sections(gid)
         if not cell_sections:
             raise Exception("Getting locations for non-bg sims is not implemented yet...")
 
-        if isec >= cell_sections.num_sections:
+        isecs = np.asarray(isecs, dtype="int64")
+        ipts = np.asarray(ipts, dtype="int64")
+        # Soma connection, just zero it
+        offsets = np.maximum(offsets, 0, dtype="float64")
+        n_locations = len(isecs)
+        distances = np.full(n_locations, -1.0)
+
+        if n_locations and isecs.max() >= cell_sections.num_sections:
             raise Exception(
-                f"Error: section {isec} out of bounds ({cell_sections.num_sections} "
+                f"Error: section {isecs.max()} out of bounds ({cell_sections.num_sections} "
                 "total). Morphology section count is low, is this a good morphology?"
             )
 
-        distance = 0.5
-        tmp_section = cell_sections.isec2sec[int(isec)]
+        sections = [cell_sections.isec2sec[isec] for isec in isecs.tolist()]
+        # Locations without section are assumed to be in LoadBalance mode
+        has_section = np.fromiter((sec is not None for sec in sections), bool, n_locations)
 
-        if tmp_section is None:  # Assume we are in LoadBalance mode
-            result_point.append(-1, None, -1)
-        elif ipt == -1:
-            # Sonata spec have a pre-calculated distance field.
-            # In such cases, segment (ipt) is -1 and offset is that distance.
-            offset = max(min(offset, 0.9999999), 0.0000001)
-            result_point.append(int(isec), tmp_section, offset)
-        else:
-            # Adjust for section orientation and calculate distance
-            section = tmp_section.sec
-            if section.orientation() == 1:
-                ipt = section.n3d() - 1 - ipt
-                offset = -offset
-
-            if ipt < section.n3d():
-                distance = (section.arc3d(int(ipt)) + offset) / section.L
-                distance = max(min(distance, 0.9999999), 0.0000001)
+        # Sonata spec have a pre-calculated distance field.
+        # In such cases, segment (ipt) is -1 and offset is that distance.
+        is_sonata_pos = (ipts == -1) & has_section
+        distances[is_sonata_pos] = np.clip(offsets[is_sonata_pos], 0.0000001, 0.9999999)
 
-            if section.orientation() == 1:
-                distance = 1 - distance
-
-            result_point.append(int(isec), tmp_section, distance)
-        return result_point
+        is_arc_pos = (ipts != -1) & has_section
+        if is_arc_pos.any():
+            distances[is_arc_pos] = cell_sections.geometry.arc_positions(
+                isecs[is_arc_pos], ipts[is_arc_pos], offsets[is_arc_pos]
+            )
+        return sections, distances
 
 
 class NodeSetReader:
@@ -607,31 +655,44 @@ class NodesetTarget:
             )
 
         section_type_str = section_type.name
+        center = compartment_type == libsonata.SimulationConfig.Report.Compartments.center
+        if section_local_ids is not None:
+            section_local_ids = np.asarray(section_local_ids, dtype="int64")
         point_lists = compat.List()
 
         for gid in self.get_local_gids():
-            point_list = TargetPointList(gid)
             cell = cell_manager.get_cell(gid)
-            secs = list(getattr(cell.CellRef, section_type_str))
-
-            nsecs = len(secs)
-            isecs = section_local_ids if section_local_ids is not None else range(nsecs)
-
-            for isec in isecs:
-                if isec >= nsecs:
-                    break
-                sec = secs[isec]
-
+            sections, section_ids = cell.get_section_table(section_type_str)
+            rows = (
+                np.arange(len(sections))
+                if section_local_ids is None
+                else section_local_ids[section_local_ids < len(sections)]
+            )
+            invalid = rows[section_ids[rows] < 0]
+            if len(invalid):
                 # Note: certain external mophology may contain only 1 axon
                 # and 2nd axon is added by our emodel without index v(0.0001), e.g. allen v1
-                # An error would be raised at get_section_id for compartment report including axons
-                section_id = cell.get_section_id(sec)
-                if compartment_type == libsonata.SimulationConfig.Report.Compartments.center:
-                    point_list.append(section_id, Nd.SectionRef(sec), 0.5)
-                else:
-                    for seg in sec:
-                        point_list.append(section_id, Nd.SectionRef(sec), seg.x)
-            point_lists.append(point_list)
+                # Raise the error of get_section_id, e.g. for compartment reports with axons
+                cell.get_section_id(sections[invalid[0]])
+
+            if center:
+                point_rows = rows
+                x = np.full(len(rows), 0.5)
+            else:
+                # All segments centers, as iterating over a section: (i + 0.5) / nseg
+                counts = np.fromiter((sections[row].nseg for row in rows), "int64", len(rows))
+                point_rows = np.repeat(rows, counts)
+                seg_starts = np.repeat(np.cumsum(counts) - counts, counts)
+                x = (np.arange(len(point_rows)) - seg_starts + 0.5) / np.repeat(counts, counts)
+
+            point_lists.append(
+                TargetPointList.from_sections(
+                    gid,
+                    section_ids[point_rows].tolist(),
+                    [sections[row] for row in point_rows],
+                    x.tolist(),
+                )
+            )
 
         return point_lists
 
@@ -703,6 +764,8 @@ class SerializedSections:
         self.isec2sec = [None] * self.num_sections
         # Flag to control warning message display
         self._serialized_sections_warned = False
+        # Geometry tables of all sections, built on first use. See geometry
+        self._geometry = None
 
         for index, sec in enumerate(cell.all):
             # Accessing the 'v' value at location 0.0001 of the section
@@ -721,3 +784,74 @@ class SerializedSections:
             else:
                 # Store a SectionRef to the section at the index specified by v_value
                 self.isec2sec[int(v_value)] = Nd.SectionRef(sec=sec)
+
+    @property
+    def geometry(self):
+        """The geometry tables of the cell sections, built on first access.
+
+        They reflect the sections at that time. Changes to the cell morphology or
+        discretization afterwards are not accounted for.
+        """
+        if self._geometry is None:
+            self._geometry = SectionsGeometry(self.isec2sec)
+        return self._geometry
+
+
+class SectionsGeometry:
+    """The geometry of the sections of a cell, as arrays indexed by section index (isec),
+    so that locations can be computed without querying hoc once per point.
+
+    The arc length of the 3d points of all sections is stored concatenated in arc3d, the
+    points of section isec being at arc3d[arc3d_offsets[isec]:arc3d_offsets[isec + 1]].
+    Sections not instantiated (None) have no 3d points and no segments.
+    """
+
+    __slots__ = ("arc3d", "arc3d_offsets", "length", "n3d", "nseg", "orientation")
+
+    def __init__(self, isec2sec):
+        n_sections = len(isec2sec)
+        self.n3d = np.zeros(n_sections, dtype="int64")
+        self.nseg = np.zeros(n_sections, dtype="int64")
+        self.length = np.ones(n_sections)
+        self.orientation = np.zeros(n_sections, dtype="int8")
+        arc3d = []
+
+        for isec, sec_ref in enumerate(isec2sec):
+            if sec_ref is None:
+                continue
+            sec = sec_ref.sec
+            self.n3d[isec] = sec.n3d()
+            self.nseg[isec] = sec.nseg
+            self.length[isec] = sec.L
+            self.orientation[isec] = sec.orientation()
+            arc3d.extend(sec.arc3d(i) for i in range(sec.n3d()))
+
+        self.arc3d = np.array(arc3d, dtype=float)
+        self.arc3d_offsets = np.zeros(n_sections + 1, dtype="int64")
+        np.cumsum(self.n3d, out=self.arc3d_offsets[1:])
+
+    def arc_positions(self, isecs, ipts, offsets):
+        """Compute the x of locations given as a 3d point (ipt) plus an offset in microns.
+
+        Points are counted from the section start, as in the morphology, regardless of the
+        section orientation. Locations with invalid ipt are placed at the section center.
+        """
+        isecs = np.asarray(isecs, dtype="int64")
+        n3d = self.n3d[isecs]
+        flipped = self.orientation[isecs] == 1
+        ipts = np.where(flipped, n3d - 1 - ipts, ipts)
+        offsets = np.where(flipped, -offsets, offsets)
+
+        distances = np.full(len(isecs), 0.5)
+        valid = (ipts >= 0) & (ipts < n3d)
+        isecs = isecs[valid]
+        arc = self.arc3d[self.arc3d_offsets[isecs] + ipts[valid]]
+        distances[valid] = np.clip(
+            (arc + offsets[valid]) / self.length[isecs], 0.0000001, 0.9999999
+        )
+        distances[flipped] = 1 - distances[flipped]
+        return distances
+
+    def segment_indexes(self, isecs, xs):
+        """Return the index of the segment (compartment) of each location (isec, x)"""
+        return (np.asarray(xs) * self.nseg[isecs]).astype("int64")
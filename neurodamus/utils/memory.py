@@ -13,7 +13,6 @@ import os
 import pickle  # noqa: S403
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from pathlib import Path
 
 import numpy as np
 import psutil
@@ -189,9 +188,58 @@ def print_allocation_stats(rank_memory):
 
 @run_only_rank0
 def export_allocation_stats(rank_allocation, filename, ranks, cycles=1):
-    """Export allocation dictionary to a serialized pickle file."""
-    compressed_data = gzip.compress(pickle.dumps(rank_allocation))
-    Path(f"{filename}_r{ranks}_c{cycles}.pkl.gz").write_bytes(compressed_data)
+    """Export allocation dictionary to indexed binary files, so that ranks read only their gids.
+
+    `{prefix}.gids.npy` holds the gids of all buckets in one uint32 array, contiguous per rank.
+    `{prefix}.index.npy` is the table of (population, rank, cycle) -> (offset, count) of every
+    bucket, sorted by rank. It is written last, marking the allocation complete.
+    """
+    prefix = f"{filename}_r{ranks}_c{cycles}"
+    populations = sorted(rank_allocation)
+    index = np.zeros(
+        len(populations) * ranks * cycles,
+        dtype=[
+            ("population", f"U{max(map(len, populations), default=1)}"),
+            ("rank", "u4"),
+            ("cycle", "u4"),
+            ("offset", "u8"),
+            ("count", "u8"),
+        ],
+    )
+    rank_ids, cycle_ids, pop_ids = np.unravel_index(
+        np.arange(len(index)), (ranks, cycles, len(populations))
+    )
+    index["population"] = np.array(populations or [""])[pop_ids]
+    index["rank"] = rank_ids
+    index["cycle"] = cycle_ids
+    bucket_gids = [
+        np.asarray(rank_allocation[populations[pop_i]].get((rank, cycle), ()), dtype="uint32")
+        for rank, cycle, pop_i in zip(
+            rank_ids.tolist(), cycle_ids.tolist(), pop_ids.tolist(), strict=True
+        )
+    ]
+    index["count"] = [len(gids) for gids in bucket_gids]
+    index["offset"] = np.cumsum(index["count"]) - index["count"]
+    np.save(prefix + ".gids.npy", np.concatenate(bucket_gids or [np.empty(0, "uint32")]))
+    np.save(prefix + ".index.npy", index)
+
+
+def read_rank_allocation(prefix, rank):
+    """Read the allocation of a rank from the files written by `export_allocation_stats`.
+    Only the index entries and gids of the rank are read, via memory mapping.
+
+    Returns: A dict {population: {(rank, cycle): gids}}, with all populations
+    """
+    index = np.load(prefix + ".index.npy", mmap_mode="r")
+    # All populations are in the entries of rank 0, even if this rank has none
+    first_rank_end, start, end = np.searchsorted(index["rank"], [1, rank, rank + 1])
+    rank_alloc = {population: {} for population in index["population"][:first_rank_end].tolist()}
+    gids = np.load(prefix + ".gids.npy", mmap_mode="r")
+    for entry in index[start:end].tolist():
+        population, _, cycle, offset, count = entry
+        if count:
+            rank_alloc[population][rank, cycle] = np.array(gids[offset : offset + count])
+    return rank_alloc
 
 
 class SynapseMemoryUsage:
@@ -261,6 +309,7 @@ class DryRunStats:
 
     _alloc_cache = None
 
+    # Referenced by the allocation pickle files of previous versions. Keep for loading them
     @staticmethod
     def defaultdict_vector():
         return defaultdict(Vector)
@@ -316,7 +365,9 @@ class DryRunStats:
         return s
 
     def import_allocation_stats(self, filename, cycle_i=0, ignore_cache=False) -> dict:
-        """Import allocation dictionary from serialized pickle file."""
+        """Import the allocation of this rank, given the allocation files prefix.
+        Allocation files in the previous format (serialized pickle) are accepted as well.
+        """
 
         def convert_to_standard_types(obj):
             """Converts an object containing defaultdicts of Vectors to standard Python types."""
@@ -329,9 +380,12 @@ class DryRunStats:
 
         if self._alloc_cache is None or ignore_cache:
             logging.warning("Loading allocation stats from %s...", filename)
-            with gzip.open(filename, "rb") as f:
-                data = pickle.load(f)  # noqa: S301
-            DryRunStats._alloc_cache = convert_to_standard_types(data)
+            if not str(filename).endswith(".pkl.gz"):
+                DryRunStats._alloc_cache = read_rank_allocation(filename, MPI.rank)
+            else:
+                with gzip.open(filename, "rb") as f:
+                    data = pickle.load(f)  # noqa: S301
+                DryRunStats._alloc_cache = convert_to_standard_types(data)
         else:
             logging.warning("Using cached allocation stats.")
 
@@ -537,15 +591,16 @@ class DryRunStats:
 
         Returns:
             bucket_allocation (dict): A dictionary where keys are tuples (pop, rank_id, cycle_id)
-                                    and values are lists of cell IDs assigned to each bucket.
+                                    and values are the uint32 arrays of cell IDs assigned
+                                    to each bucket.
             bucket_memory (dict): A dictionary where keys are tuples (pop, rank_id, cycle_id)
                                 and values are the total memory load on each bucket.
             metype_memory_usage (dict): A dictionary where keys are METype IDs
                                         and values are the memory load of each METype.
         """
         self.validate_inputs_distribute(num_ranks, batch_size)
-        bucket_allocation = defaultdict(DryRunStats.defaultdict_vector)
-        bucket_memory = defaultdict(DryRunStats.defaultdict_float)
+        bucket_allocation = {}
+        bucket_memory = {}
 
         # Prepare the memory usage for each METype
         metype_memory_usage = {}
@@ -553,52 +608,68 @@ class DryRunStats:
             syns_mem = SynapseMemoryUsage.get_memory_usage(self.metype_cell_syn_average[metype])
             metype_memory_usage[metype] = metype_mem + syns_mem
 
-        def assign_cells_to_bucket(rank_allocation, rank_memory, batch, batch_memory):
-            """Assigns a batch of cells to the bucket with the lowest total memory
-            via heapq.heappop and heapq.heappush
-            """
-            total_memory, (rank_id, cycle_id) = heapq.heappop(buckets)
-            logging.debug("Assigning batch to bucket (%d, %d)", rank_id, cycle_id)
-            rank_allocation[rank_id, cycle_id].extend(batch)
-            total_memory += batch_memory
-            rank_memory[rank_id, cycle_id] = total_memory
-            heapq.heappush(buckets, (total_memory, (rank_id, cycle_id)))
-
         # Sort metype by total memory
-        # Loop over ALL the gids which would be instantiated, per metype
+        # Lay out ALL the gids which would be instantiated, per metype
         # in the order from the most memory consumer to the least
         metype_memory_usage = dict(
             sorted(metype_memory_usage.items(), key=operator.itemgetter(1), reverse=True)
         )
         for pop, metype_gids in self.pop_metype_gids.items():
             logging.info("Distributing cells of population %s", pop)
-            rank_allocation = defaultdict(Vector)
-            rank_memory = {}
-            batch = []
-            batch_memory = 0
-
-            # (total_memory, (rank_id, cycle_id))
-            buckets = [(0, (i, j)) for i in range(num_ranks) for j in range(cycles)]
-            heapq.heapify(buckets)
-
-            for metype, total_mem_per_cell in metype_memory_usage.items():
-                gids = metype_gids.get(metype, [])
-
-                for cell_id in gids:
-                    batch.append(cell_id)
-                    batch_memory += total_mem_per_cell
-                    if len(batch) == batch_size[pop]:
-                        assign_cells_to_bucket(rank_allocation, rank_memory, batch, batch_memory)
-                        batch = []
-                        batch_memory = 0
-
-            if batch:
-                assign_cells_to_bucket(rank_allocation, rank_memory, batch, batch_memory)
-
-            bucket_allocation[pop] = rank_allocation
-            bucket_memory[pop] = rank_memory
+            pop_metypes = [
+                metype for metype in metype_memory_usage if len(metype_gids.get(metype, ()))
+            ]
+            if not pop_metypes:
+                bucket_allocation[pop] = {}
+                bucket_memory[pop] = {}
+                continue
+            gids = np.concatenate([np.asarray(metype_gids[metype]) for metype in pop_metypes])
+            cell_memory = np.repeat(
+                np.array([metype_memory_usage[metype] for metype in pop_metypes], dtype=float),
+                [len(metype_gids[metype]) for metype in pop_metypes],
+            )
+            bucket_allocation[pop], bucket_memory[pop] = self._assign_batches(
+                gids, cell_memory, batch_size[pop], num_ranks, cycles
+            )
         return bucket_allocation, bucket_memory, metype_memory_usage
 
+    @staticmethod
+    def _assign_batches(gids, cell_memory, batch_size, num_ranks, cycles):
+        """Assigns consecutive batches of gids to the (rank, cycle) buckets, each batch going to
+        the bucket with the lowest total memory (via heapq.heappop and heapq.heappush).
+
+        Returns:
+            The gids (uint32 arrays) and the total memory of the buckets which got any batch
+        """
+        # Consecutive batches of batch_size cells, the last one possibly partial
+        batch_starts = np.arange(0, len(gids), batch_size)
+        batch_memory = np.add.reduceat(cell_memory, batch_starts)
+
+        # (total_memory, bucket), where bucket = rank_id * cycles + cycle_id
+        buckets = [(0, bucket) for bucket in range(num_ranks * cycles)]
+        batch_bucket = np.empty(len(batch_starts), dtype=np.intp)
+        for i, memory in enumerate(batch_memory.tolist()):
+            total_memory, bucket = heapq.heappop(buckets)
+            batch_bucket[i] = bucket
+            heapq.heappush(buckets, (total_memory + memory, bucket))
+
+        # Group the gids per bucket. The stable sort keeps the assignment order
+        cell_bucket = np.repeat(batch_bucket, np.diff(batch_starts, append=len(gids)))
+        used_buckets, counts = np.unique(cell_bucket, return_counts=True)
+        bucket_gids = np.split(
+            gids[np.argsort(cell_bucket, kind="stable")].astype("uint32"), np.cumsum(counts)[:-1]
+        )
+        rank_allocation = {
+            divmod(bucket, cycles): cell_gids
+            for bucket, cell_gids in zip(used_buckets.tolist(), bucket_gids, strict=True)
+        }
+        rank_memory = {
+            divmod(bucket, cycles): total_memory
+            for total_memory, bucket in buckets
+            if divmod(bucket, cycles) in rank_allocation
+        }
+        return rank_allocation, rank_memory
+
     def validate_inputs_distribute(self, num_ranks, batch_size):
         assert isinstance(num_ranks, int), "num_ranks must be an integer"
         assert num_ranks > 0, "num_ranks must be a positive integer"
@@ -634,7 +705,7 @@ class DryRunStats:
         rank_allocation = bucket_allocation.get(population, {})
         for rank_id in range(num_ranks):
             for cycle_id in range(cycles):
-                if not rank_allocation.get((rank_id, cycle_id)):
+                if not len(rank_allocation.get((rank_id, cycle_id), ())):
                     logging.warning(
                         "Population %s is not allocated across the full size of ranks "
                         "and cycles. Consider reducing the number of ranks or cycles.",
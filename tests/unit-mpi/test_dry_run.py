@@ -68,7 +68,7 @@ def test_dry_run_distribute_cells(create_tmp_simulation_config_file, mpi_ranks):
     nd.run()
 
     rank_alloc = nd._dry_run_stats.import_allocation_stats(nd._dry_run_stats._ALLOCATION_FILENAME
-                                                            + "_r2_c1.pkl.gz", 0)
+                                                            + "_r2_c1", 0)
     rank_allocation_standard = defaultdict_to_standard_types(rank_alloc)
 
     # Test allocation
@@ -92,7 +92,7 @@ def test_dry_run_distribute_cells(create_tmp_simulation_config_file, mpi_ranks):
     assert rank_allocation_standard == expected_allocation
 
     rank_alloc = nd._dry_run_stats.import_allocation_stats(nd._dry_run_stats._ALLOCATION_FILENAME
-                                                            + "_r1_c1.pkl.gz", 0, True)
+                                                            + "_r1_c1", 0, True)
     rank_allocation_standard = defaultdict_to_standard_types(rank_alloc)
     expected_allocation = [
         {
@@ -118,7 +118,7 @@ def test_dry_run_dynamic_distribute(create_tmp_simulation_config_file, mpi_ranks
     nd.run()
 
     rank_alloc = nd._dry_run_stats.import_allocation_stats(nd._dry_run_stats._ALLOCATION_FILENAME
-                                                            + "_r2_c1.pkl.gz", 0)
+                                                            + "_r2_c1", 0)
     rank_allocation_standard = defaultdict_to_standard_types(rank_alloc)
 
     # Test allocation
@@ -140,7 +140,7 @@ def test_lb_mode_memory_from_scratch(create_tmp_simulation_config_file, mpi_rank
 
     # delete allocation file first
     Path("cell_memory_usage.json").unlink(missing_ok=True)
-    Path("allocation_r2_c1.pkl.gz").unlink(missing_ok=True)
+    Path("allocation_r2_c1.index.npy").unlink(missing_ok=True)
 
     nd = Neurodamus(create_tmp_simulation_config_file, lb_mode="Memory", memory_tracker="heap")
 
@@ -150,7 +150,7 @@ def test_lb_mode_memory_from_scratch(create_tmp_simulation_config_file, mpi_rank
     }
     assert nd._dry_run_stats.metype_counts == expected_metypes_count
     assert not nd._dry_run_stats.cell_memory_usage.preloaded
-    assert Path("allocation_r2_c1.pkl.gz").exists()
+    assert Path("allocation_r2_c1.index.npy").exists()
     assert Path("cell_memory_usage.json").exists()
 
     # These attributes are gathered on rank0 only, check on rank 0 cell_memory_usage.json
@@ -159,7 +159,7 @@ def test_lb_mode_memory_from_scratch(create_tmp_simulation_config_file, mpi_rank
         assert dryrun_data == nd._dry_run_stats.cell_memory_usage
 
     rank_alloc = nd._dry_run_stats.import_allocation_stats(nd._dry_run_stats._ALLOCATION_FILENAME
-                                                            + "_r2_c1.pkl.gz", 0)
+                                                            + "_r2_c1", 0)
     rank_allocation_standard = defaultdict_to_standard_types(rank_alloc)
 
     # Test allocation
@@ -0,0 +1,97 @@
+import libsonata
+import numpy as np
+import numpy.testing as npt
+
+from tests.conftest import SIM_DIR
+
+from neurodamus.io.cell_readers import _getNeededAttributes, _NodeAttributeReader
+
+NODES_FILE = str(SIM_DIR / "neuromodulation" / "minimal_circuit" / "nodes.h5")
+
+
+def test_node_attribute_reader():
+    reader = _NodeAttributeReader(NODES_FILE, "All")
+    assert reader.require("x", "morphology")
+    assert reader.require("etype", "mtype", categorical=True)  # etype is a @library enum
+    assert reader.require("model_template", categorical=True,
+                          convert=lambda emodel: emodel.removeprefix("hoc:"))
+    assert reader.require("threshold_current", dynamics=True)
+    assert not reader.require("x", "no_such_attr")
+    assert not reader.require("x", dynamics=True)
+
+    gids = np.array([2, 0, 1])
+    columns = reader.read(gids)
+    pop = libsonata.NodeStorage(NODES_FILE).open_population("All")
+    selection = libsonata.Selection(gids)
+    assert set(columns) == {"x", "morphology", "etype", "mtype", "model_template",
+                            "@dynamics:threshold_current"}
+    for name in ("x", "morphology", "etype", "mtype"):
+        npt.assert_array_equal(columns[name], pop.get_attribute(name, selection))
+    npt.assert_array_equal(columns["model_template"],
+                           [t.removeprefix("hoc:")
+                            for t in pop.get_attribute("model_template", selection)])
+    npt.assert_array_equal(columns["@dynamics:threshold_current"],
+                           pop.get_dynamics_attribute("threshold_current", selection))
+    # Categorical columns share their string objects and hold no numpy strings
+    assert columns["etype"].dtype == object
+    assert all(type(value) is str for value in columns["mtype"])
+    assert columns["etype"][0] is columns["etype"][1]
+
+    empty = reader.read([])
+    assert all(len(values) == 0 for values in empty.values())
+
+
+def test_node_attribute_reader_aggregated():
+    local = _NodeAttributeReader(NODES_FILE, "All")
+    aggregated = _NodeAttributeReader(NODES_FILE, "All", aggregators=4)  # capped to MPI size
+    for reader in (local, aggregated):
+        reader.require("x", "morphology")
+        reader.require("etype", categorical=True)
+
+    for gids in ([2, 0, 2, 1], []):
+        expected = local.read(gids)
+        columns = aggregated.read(gids)
+        assert columns.keys() == expected.keys()
+        for name, values in expected.items():
+            npt.assert_array_equal(columns[name], values)
+
+
+def test_get_needed_attributes(tmp_path):
+    for emodel, needed in (("emodelA", "threshold_current;holding_current"),
+                           ("emodelB", "holding_current")):
+        (tmp_path / f"{emodel}.hoc").write_text(
+            f'strdef {emodel}_NeededAttributes\n{emodel}_NeededAttributes = "{needed}"\n')
+    (tmp_path / "emodelC.hoc").write_text("")
+
+    reader = _NodeAttributeReader(NODES_FILE, "All")
+    reader.require("morphology")
+    gids = np.array([2, 0, 1])
+    add_params = _getNeededAttributes(reader, str(tmp_path), ["emodelB", "emodelA", "emodelC"],
+                                      gids)
+    pop = libsonata.NodeStorage(NODES_FILE).open_population("All")
+    threshold = pop.get_dynamics_attribute("threshold_current", libsonata.Selection(gids))
+    holding = pop.get_dynamics_attribute("holding_current", libsonata.Selection(gids))
+    assert add_params == [[holding[0]], [threshold[1], holding[1]], []]
+
+
+def test_get_needed_attributes_grouped(tmp_path):
+    # Cells sharing an emodel are interleaved, and attributes keep the order each template lists
+    for emodel, needed in (("emodelD", "holding_current;threshold_current"),
+                           ("emodelE", "threshold_current")):
+        (tmp_path / f"{emodel}.hoc").write_text(
+            f'strdef {emodel}_NeededAttributes\n{emodel}_NeededAttributes = "{needed}"\n')
+
+    reader = _NodeAttributeReader(NODES_FILE, "All")
+    gids = np.array([1, 2, 0, 2, 1])
+    emodels = ["emodelD", "emodelE", "emodelE", "emodelD", "emodelD"]
+    add_params = _getNeededAttributes(reader, str(tmp_path), emodels, gids)
+    pop = libsonata.NodeStorage(NODES_FILE).open_population("All")
+    threshold = pop.get_dynamics_attribute("threshold_current", libsonata.Selection([0, 1, 2]))
+    holding = pop.get_dynamics_attribute("holding_current", libsonata.Selection([0, 1, 2]))
+    assert add_params == [
+        [holding[1], threshold[1]],
+        [threshold[2]],
+        [threshold[0]],
+        [holding[2], threshold[2]],
+        [holding[1], threshold[1]],
+    ]
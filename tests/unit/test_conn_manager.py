@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from unittest import mock
 
@@ -63,6 +64,7 @@ def test_population_get_create_conn(population):
     expected_types = [_FakeConn, mock.Mock, _FakeConn, _FakeConn]
     checks = [isinstance(c, expected_types[i]) for i, c in enumerate(conns2)]
     assert all(checks)
+    assert population._sgids_map[2] == [1, 2, 3, 4]
 
 
 def test_population_all_conns():
@@ -84,6 +86,9 @@ def test_population_all_conns():
     (([1, 2], [1]), [(1, 1), (1, 2)]),
     (([1], [0, 1]), [(0, 1), (1, 1)]),
     (([0, 1], [0, 1]), [(0, 0), (1, 0), (0, 1), (1, 1)]),
+    (([0, 1, 2], {1, 5}), [(1, 0), (1, 1), (1, 2)]),
+    ((None, np.array([0])), [(0, 0), (0, 1)]),
+    ((None, []), []),
 ])
 def test_population_get_connections(test_input, expected):
     pop = _create_population([(1, 0), (1, 2), (1, 1), (0, 0), (0, 1)])
@@ -93,6 +98,16 @@ def test_population_get_connections(test_input, expected):
         assert expected[i] == (conn.sgid, conn.tgid)
 
 
+def test_population_get_connections_new_conns():
+    pop = _create_population([(1, 0), (3, 0)])
+    assert [c.sgid for c in pop.get_connections([0], [2, 3])] == [3]
+    assert pop._sgids_arrays[0].dtype == np.int64
+    pop.store_connection(_FakeConn(2, 0))
+    pop.get_or_create_connection(0, 0)
+    assert 0 not in pop._sgids_arrays
+    assert [c.sgid for c in pop.get_connections([0], [0, 2, 3])] == [0, 2, 3]
+
+
 def test_population_ids_match():
     pop = _create_population([])
     assert pop.ids_match(0)
@@ -109,3 +124,25 @@ def test_population_ids_match():
     assert not pop.ids_match(1, 1)
     assert not pop.ids_match(1, None)
     assert not pop.ids_match(None, 1)
+
+
+def test_get_allowed_ranges():
+    from neurodamus.connection_manager import ConnectionManagerBase
+
+    # The synapses of a tgid, sgid 5 showing up in two ranges
+    sgids = np.array([5, 5, 7, 3, 5, 9, 9])
+    ranges = np.array([0, 2, 3, 4, 5, 7])
+    n_conns, starts, ends = ConnectionManagerBase._get_allowed_ranges(None, sgids, ranges)
+    assert n_conns == 5
+    np.testing.assert_array_equal(starts, [0, 2, 3, 4, 5])
+    np.testing.assert_array_equal(ends, [2, 3, 4, 5, 7])
+
+    src_gids = np.array([1, 5, 9])
+    n_conns, starts, ends = ConnectionManagerBase._get_allowed_ranges(src_gids, sgids, ranges)
+    assert n_conns == 2  # distinct sgids
+    np.testing.assert_array_equal(starts, [0, 4, 5])
+    np.testing.assert_array_equal(ends, [2, 5, 7])
+
+    n_conns, starts, _ = ConnectionManagerBase._get_allowed_ranges(np.array([]), sgids, ranges)
+    assert n_conns == 0
+    assert len(starts) == 0
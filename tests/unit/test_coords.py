@@ -1,5 +1,6 @@
 import numpy as np
 import numpy.testing as npt
+import pytest
 
 from neurodamus import metype
 
@@ -28,3 +29,51 @@ def test_coord_mapping2():
     y = ty.local_to_global_coord_mapping(np.array([[6.98622, 12.17931, 17.53813]]))[0]
     npt.assert_allclose(x, [1., 0.5, 0.25])
     npt.assert_allclose(y, [20.62011524, 1.62385762, -10.63654619])
+
+
+def test_load_infoNP_columns():
+    rng = np.random.default_rng(0)
+    gids = np.array([7, 3, 11, 5])
+    positions = rng.uniform(-100, 100, (4, 3))
+    rotations = rng.normal(size=(4, 4))
+    thresholds = np.array([0.1, 0.2, 0.3, 0.4], dtype="float32")
+    meinfos = metype.METypeManager()
+    meinfos.load_infoNP(gids, ["m7", "m3", "m11", "m5"], ["e7", "e3", "e11", "e5"],
+                        None, None, threshold_currents=thresholds,
+                        positions=positions, rotations=rotations)
+    meinfos.insert(1, "m1")
+    cached = meinfos[3]
+    meinfos.set_extra_attr("x", np.arange(5))
+
+    assert list(meinfos.keys()) == [7, 3, 11, 5, 1]  # insertion order
+    assert len(meinfos) == 5
+    assert 11 in meinfos and 4 not in meinfos
+    assert meinfos.get(4) is None
+    assert meinfos[1].extra_attrs == {"x": 4}
+    assert meinfos[3] is cached  # items are materialized once
+    for i, gid in enumerate(gids):
+        item = meinfos[gid]
+        ref = metype.METypeItem(f"m{gid}", emodel_tpl=f"e{gid}",
+                                threshold_current=thresholds[i],
+                                position=positions[i], rotation=rotations[i])
+        assert item.morph_name == ref.morph_name
+        assert item.emodel_tpl == ref.emodel_tpl
+        assert item.mtype is None and item.etype is None
+        assert item.threshold_current == ref.threshold_current
+        assert item.holding_current == 0.0
+        assert item.extra_attrs == {"x": i}
+        npt.assert_array_equal(item.local_to_global_matrix, ref.local_to_global_matrix)
+
+    with pytest.raises(KeyError):
+        meinfos.load_infoNP([3], ["m3"], None, None, None)
+
+    # Later loads keep the insertion order and are found through the gid index
+    meinfos.load_infoNP([4, 0], ["m4", "m0"], None, None, None)
+    meinfos.insert(2, "m2")
+    meinfos.insert(1, "m1b")  # replacing keeps the position
+    assert list(meinfos) == [7, 3, 11, 5, 1, 4, 0, 2]
+    assert meinfos[0].morph_name == "m0" and meinfos[1].morph_name == "m1b"
+    del meinfos[1]
+    assert list(meinfos) == [7, 3, 11, 5, 4, 0, 2]
+    with pytest.raises(KeyError):
+        del meinfos[4]
@@ -52,7 +52,7 @@ def test_dry_run_memory_use(create_tmp_simulation_config_file):
     assert nd._dry_run_stats.metype_counts == expected_metypes_count
     assert nd._dry_run_stats.suggested_nodes > 0
 
-    assert Path(nd._dry_run_stats._ALLOCATION_FILENAME +"_r2_c1.pkl.gz").exists()
+    assert Path(nd._dry_run_stats._ALLOCATION_FILENAME +"_r2_c1.index.npy").exists()
     assert Path(nd._dry_run_stats._MEMORY_USAGE_FILENAME).exists()
     assert not nd._dry_run_stats.cell_memory_usage.preloaded
 
@@ -72,7 +72,7 @@ def test_dry_run_distribute_cells(create_tmp_simulation_config_file):
 
     # Test allocation
     rank_alloc = nd._dry_run_stats.import_allocation_stats(nd._dry_run_stats._ALLOCATION_FILENAME +
-                                                           "_r2_c1.pkl.gz", 0)
+                                                           "_r2_c1", 0)
     rank_allocation_standard = defaultdict_to_standard_types(rank_alloc)
     expected_allocation = {
         'RingA': {(0, 0): [0]},
@@ -90,7 +90,7 @@ def test_dry_run_distribute_cells(create_tmp_simulation_config_file):
     assert rank_allocation_standard == expected_allocation
 
     rank_alloc = nd._dry_run_stats.import_allocation_stats(nd._dry_run_stats._ALLOCATION_FILENAME +
-                                                           "_r1_c1.pkl.gz", 0, True)
+                                                           "_r1_c1", 0, True)
     rank_allocation_standard = defaultdict_to_standard_types(rank_alloc)
     expected_allocation = {
         'RingA': {(0, 0): [0, 1, 2]},
@@ -196,6 +196,30 @@ def test_retrieve_unique_metypes():
     expected_metype_counts = {'mtype1-emodel1': 3, 'mtype2-emodel2': 2}
     assert metype_counts == expected_metype_counts
 
+@pytest.mark.parametrize("create_tmp_simulation_config_file", [
+    {
+        "simconfig_fixture": "ringtest_baseconfig",
+    },
+], indirect=True)
+@pytest.mark.forked
+def test_lb_mode_memory_legacy_allocation(create_tmp_simulation_config_file, change_test_dir):
+    """Ensure the Memory load balance uses an allocation pickle of previous versions"""
+    import gzip
+    import pickle
+    from collections import defaultdict
+    from neurodamus.utils.memory import DryRunStats
+
+    allocation = defaultdict(DryRunStats.defaultdict_vector)
+    allocation["RingA"][0, 0].extend([0, 2])
+    allocation["RingB"][0, 0].extend([1])
+    Path("allocation_r1_c1.pkl.gz").write_bytes(gzip.compress(pickle.dumps(allocation)))
+
+    nd = Neurodamus(create_tmp_simulation_config_file, lb_mode="Memory")
+    assert not Path("allocation_r1_c1.index.npy").exists()  # not generated on-the-fly
+    assert nd.circuits.get_node_manager("RingA").local_nodes.gids(raw_gids=True).tolist() == [0, 2]
+    assert nd.circuits.get_node_manager("RingB").local_nodes.gids(raw_gids=True).tolist() == [1]
+
+
 def test_distribute_cells_multi_pop_multi_cycle(fixed_memory_measurements):
     from neurodamus.utils.memory import DryRunStats
     """
@@ -270,3 +294,95 @@ def test_distribute_cells_multi_pop_multi_cycle(fixed_memory_measurements):
     # Assert that the results match the expected values
     assert rank_allocation_standard == expected_allocation
     assert bucket_memory == expected_memory
+
+
+def test_allocation_files():
+    """Ensure ranks read their own buckets from the allocation files, keeping all populations"""
+    from neurodamus.utils.memory import export_allocation_stats, read_rank_allocation
+
+    allocation = {
+        "NodeB": {(0, 0): [9], (2, 1): [10, 12], (0, 1): [14]},
+        "NodeA": {(0, 0): [1, 4], (1, 0): [3, 6], (1, 1): [7, 8, 2], (2, 0): [5]},
+    }
+    export_allocation_stats(allocation, "allocation", 3, 2)
+    assert Path("allocation_r3_c2.index.npy").exists()
+    assert np.load("allocation_r3_c2.gids.npy").dtype == np.uint32
+
+    for rank in range(3):
+        rank_alloc = read_rank_allocation("allocation_r3_c2", rank)
+        expected = {
+            pop: {key: gids for key, gids in buckets.items() if key[0] == rank}
+            for pop, buckets in allocation.items()
+        }
+        assert defaultdict_to_standard_types(rank_alloc) == expected
+
+    # Ranks beyond the allocation get no gids, still for all populations
+    assert read_rank_allocation("allocation_r3_c2", 3) == {"NodeA": {}, "NodeB": {}}
+
+
+def test_import_legacy_allocation_pickle():
+    """Ensure allocation pickles of previous versions, holding hoc Vectors, can still be read"""
+    import gzip
+    import pickle
+    from collections import defaultdict
+    from neurodamus.utils.memory import DryRunStats
+
+    # The format written by previous versions
+    allocation = defaultdict(DryRunStats.defaultdict_vector)
+    allocation["NodeA"][0, 0].extend([1, 4])
+    allocation["NodeA"][1, 0].extend([3])
+    allocation["NodeA"][0, 1].extend([2])
+    allocation["NodeB"][0, 1].extend([9])
+    data = pickle.dumps(allocation)
+    assert b"DryRunStats.defaultdict_vector" in data
+    Path("allocation_r2_c2.pkl.gz").write_bytes(gzip.compress(data))
+
+    stats = DryRunStats()
+    rank_alloc = stats.import_allocation_stats("allocation_r2_c2.pkl.gz", 0, ignore_cache=True)
+    assert defaultdict_to_standard_types(rank_alloc) == {
+        "NodeA": {(0, 0): [1, 4]},
+        "NodeB": {},
+    }
+    rank_alloc = stats.import_allocation_stats("allocation_r2_c2.pkl.gz", 1)
+    assert defaultdict_to_standard_types(rank_alloc) == {
+        "NodeA": {(0, 1): [2]},
+        "NodeB": {(0, 1): [9]},
+    }
+
+
+def test_distribute_cells_large_population(fixed_memory_measurements):
+    """Ensure the batched distribution matches the cell by cell greedy assignment"""
+    import heapq
+    from neurodamus.utils.memory import DryRunStats
+
+    rng = np.random.default_rng(0)
+    stats = DryRunStats()
+    metypes = [f"mtype{i}-emodel{i}" for i in range(20)]
+    stats.metype_memory = dict(zip(metypes, rng.integers(10, 100, len(metypes)).tolist()))
+    stats.metype_cell_syn_average = dict.fromkeys(metypes, 1)
+    gids = rng.permutation(1000)
+    stats.pop_metype_gids = {"NodeA": {
+        metype: np.sort(gids[i::len(metypes)]) for i, metype in enumerate(metypes)
+    }}
+    num_ranks, cycles, batch_size = 7, 3, 5
+    bucket_allocation, bucket_memory, metype_memory_usage = stats.distribute_cells(
+        num_ranks, cycles, {"NodeA": batch_size})
+
+    # Reference: walk the cells in metype order, filling batches
+    cells = [(gid, mem) for metype, mem in metype_memory_usage.items()
+             for gid in stats.pop_metype_gids["NodeA"][metype]]
+    buckets = [(0, (i, j)) for i in range(num_ranks) for j in range(cycles)]
+    expected_allocation = {}
+    expected_memory = {}
+    for start in range(0, len(cells), batch_size):
+        batch = cells[start:start + batch_size]
+        total_memory, key = heapq.heappop(buckets)
+        total_memory += sum(mem for _, mem in batch)
+        expected_allocation.setdefault(key, []).extend(gid for gid, _ in batch)
+        expected_memory[key] = total_memory
+        heapq.heappush(buckets, (total_memory, key))
+
+    allocation = bucket_allocation["NodeA"]
+    assert all(gids.dtype == np.uint32 for gids in allocation.values())
+    assert defaultdict_to_standard_types(allocation) == expected_allocation
+    assert bucket_memory["NodeA"] == pytest.approx(expected_memory)
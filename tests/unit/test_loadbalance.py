@@ -67,6 +67,93 @@ def test_loadbal_subtarget(target_manager, caplog):
         assert "Attempt reusing cx files from other targets..." in caplog.records[-2].message
         assert "Target VerySmall is a subset of the target RingA_All." in caplog.records[-1].message
 
+
+def test_loadbal_cx_data(target_manager):
+    """Ensure text cx files are converted to binary data, read by gid and exported back"""
+    from neurodamus.cell_distributor import LoadBalance, TargetSpec
+
+    nodes_file = "/gpfs/fake_node_path_cx_data"
+    lbdir, _ = LoadBalance._get_circuit_loadbal_dir(nodes_file, "RingA")
+    cell0_lines = "0 201.322 2\n  1\n   91.3479 1\n     1\n  1\n   102.174 1\n     5\n"
+    cx_text = "1\n3\n" + cell0_lines + "1 42.7085 0\n2 42.7085 0\n"
+    (lbdir / "cx_RingA_All#.dat").write_text(cx_text)
+
+    lbal = LoadBalance(LoadBalanceMode.MultiSplit, nodes_file, "RingA", target_manager, 2)
+    assert lbal._cx_valid(TargetSpec("All", "RingA"))
+    cx_data = lbal._load_cx_data("RingA_All")
+    assert cx_data["gids"].tolist() == [0, 1, 2]
+    assert cx_data["complexities"].tolist() == [201.322, 42.7085, 42.7085]
+    assert cx_data["offsets"].tolist() == [0, 11, 14, 17]
+    assert lbal._cx_gid_rows("RingA_All", [2, 0]).tolist() == [2, 0]
+    assert lbal._cx_gid_rows("RingA_All", [0, 3]) is None
+
+    assert lbal._reuse_cell_complexity(TargetSpec("VerySmall", "RingA"))
+    assert (lbdir / "cx_RingA_VerySmall#.offsets.npy").is_file()
+    lbal._export_msdat("RingA_VerySmall")
+    assert (lbdir / "cx_RingA_VerySmall#.dat").read_text() == "1\n1\n" + cell0_lines
+
+
+def test_cpu_assign_lpt(target_manager, monkeypatch):
+    """Ensure the LPT engine assigns cells/pieces to CPUs exactly like mymetis3"""
+    from neurodamus.cell_distributor import LoadBalance
+    from neurodamus.core import NeuronWrapper as Nd
+    from neurodamus.core.configuration import CpuAssignEngine, SimConfig
+
+    Nd.init()
+    nodes_file = "/gpfs/fake_node_path_cpu_assign"
+    lbdir, _ = LoadBalance._get_circuit_loadbal_dir(nodes_file, "RingA")
+    cells = []
+    for gid in range(40):  # complexities with ties. Every 3rd cell split in 2 or 3 pieces
+        cx = float(gid % 7 + 1)
+        pieces = [(cx / 2, [1]), (cx / 2, [2, 3])][: 2 + (gid % 2)] if gid % 3 == 0 else []
+        if len(pieces) == 2 and gid % 2:
+            pieces.append((cx / 4, [4]))
+        cell = f"{gid} {cx:g} {len(pieces)}\n"
+        for piece_cx, children in pieces:
+            cell += f"  1\n   {piece_cx:g} {len(children)}\n     {' '.join(map(str, children))}\n"
+        cells.append(cell)
+    (lbdir / "cx_RingA_All#.dat").write_text(f"1\n{len(cells)}\n" + "".join(cells))
+
+    lbal = LoadBalance(LoadBalanceMode.MultiSplit, nodes_file, "RingA", target_manager, 6)
+    cpu_assign_file = lbal._cpu_assign_filename("RingA_All")
+    lbal._cpu_assign("RingA_All")
+    expected = cpu_assign_file.read_text()
+    cpu_assign_file.unlink()
+    monkeypatch.setattr(SimConfig, "lb_cpu_assign", CpuAssignEngine.LPT)
+    lbal._cpu_assign("RingA_All")
+    assert cpu_assign_file.read_text() == expected
+
+
+def test_estimate_cell_complexity(monkeypatch):
+    """Ensure complexities are reused from all cx files, estimating the missing cells"""
+    from neurodamus.cell_distributor import LoadBalance, TargetSpec
+    from neurodamus.core import NeuronWrapper as Nd
+    from neurodamus.core.configuration import SimConfig
+    from neurodamus.core.nodeset import SelectionNodeSet
+    from neurodamus.target_manager import NodesetTarget
+
+    Nd.init()
+    nodes_file = str(RINGTEST_DIR / "nodes_C.h5")  # 3 cells with the same metype
+    lbdir, _ = LoadBalance._get_circuit_loadbal_dir(nodes_file, "RingC")
+    cell0_lines = "0 10 2\n  1\n   6 1\n     1\n  1\n   4 1\n     5\n"
+    (lbdir / "cx_RingC_VerySmall#.dat").write_text("1\n1\n" + cell0_lines)
+    (lbdir / "cx_RingC_Other#.dat").write_text("1\n1\n1 20 0\n")
+
+    nodes = SelectionNodeSet([0, 1, 2]).register_global("RingC")
+    target_manager = MockedTargetManager(NodesetTarget("All", [nodes], [nodes]))
+    lbal = LoadBalance(LoadBalanceMode.MultiSplit, nodes_file, "RingC", target_manager, 2)
+    target_spec = TargetSpec("All", "RingC")
+    assert not lbal.valid_load_distribution(target_spec)  # not enabled
+
+    monkeypatch.setattr(SimConfig, "lb_estimate_cx", True)
+    assert lbal.valid_load_distribution(target_spec)
+    assert "RingC_All" in lbal._valid_loadbalance
+    cx_data = lbal._load_cx_data("RingC_All")
+    assert cx_data["gids"].tolist() == [0, 1, 2]
+    assert cx_data["complexities"].tolist() == [10.0, 20.0, 15.0]  # gid 2 estimated
+    assert cx_data["ms"].tolist() == [0, 10, 2, 1, 6, 1, 1, 1, 4, 1, 5, 1, 20, 0, 2, 15, 0]
+    assert lbal._cpu_assign_filename("RingC_All").is_file()
+
 @pytest.fixture
 def circuit_conf_bigcell():
     """Test nodes file contains 1 big cell with 10 dendrites + 2 small cells with 2 dendrites"""
@@ -153,7 +240,7 @@ def test_MultiSplit_bigcell(target_manager, circuit_conf_bigcell, capsys):
     cx_filename = next(Path(".").glob(str(base_dir / pattern / "cx_RingA_All#.dat")))
     assert cx_filename.exists()
     with open(cx_filename) as cx_file:
-        cx_saved = lbal._read_msdat(cx_file)
+        cx_saved = _read_msdat(cx_file)
     assert list(cx_saved.keys()) == [0, 1, 2]
     assert float(cx_saved[0][0].split()[1]) > float(cx_saved[1][0].split()[1]) == float(
         cx_saved[2][0].split()[1]), (
@@ -197,7 +284,7 @@ def test_MultiSplit(target_manager, circuit_conf, capsys):
     cx_filename = next(Path(".").glob(str(base_dir / pattern / "cx_RingA_All#.dat")))
     assert cx_filename.exists()
     with open(cx_filename) as cx_file:
-        cx_saved = lbal._read_msdat(cx_file)
+        cx_saved = _read_msdat(cx_file)
     assert list(cx_saved.keys()) == [0, 1, 2]
     assert float(cx_saved[0][0].split()[1]) == float(cx_saved[1][0].split()[1]) == float(
         cx_saved[2][0].split()[1]), (
@@ -276,3 +363,23 @@ class MockedTargetManager:
     def register_local_nodes(*_):
         pass
 
+
+def _read_msdat(fp):
+    """Read a text cx file, returning a dict {gid: lines of the cell}"""
+    cx_saved = {}
+    piece_count = 0
+    gid = None
+    next(fp)  # first line has 1. skip
+    next(fp)  # ncells. skip
+
+    for line in fp:
+        if piece_count == 0:
+            gid, _cx, piece_count = [int(float(x)) for x in line.split()]
+            cx_saved[gid] = [line]
+        else:  # Handle parts
+            cx_saved[gid].append(line)
+            for _ in range(2 * int(line)):  # each subtree has two lines
+                cx_saved[gid].append(next(fp))
+            piece_count -= 1
+
+    return cx_saved
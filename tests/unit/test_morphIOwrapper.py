@@ -1,5 +1,14 @@
-from neurodamus.morphio_wrapper import MorphIOWrapper
-from tests.conftest import NGV_DIR
+import logging
+
+import numpy as np
+
+from neurodamus.morphio_wrapper import (
+    MorphIOWrapper,
+    MorphologyCache,
+    MorphologyReadAhead,
+    round_significant_8,
+)
+from tests.conftest import NGV_DIR, USECASE3
 
 
 def test_section_names():
@@ -18,3 +27,120 @@ def test_section_names():
     nrn_section_names = [i.name() for i in cell.all]
 
     assert morph_section_names == nrn_section_names
+
+
+def test_morphology_cache():
+    morph_file = NGV_DIR / "morphologies" / "h5" / "glia.h5"
+    morph_dir = USECASE3 / "CircuitB" / "morphologies" / "asc"
+    other_files = sorted(morph_dir.glob("*.asc"))
+    big_file = USECASE3 / "CircuitA" / "morphologies" / "asc" / "rr110330_C3_idA.asc"
+
+    # Disabled by default
+    assert MorphologyCache.get(morph_file) is not MorphologyCache.get(morph_file)
+
+    with MorphologyCache.enabled(10 * 1024**2):
+        morph = MorphologyCache.get(morph_file)
+        assert MorphologyCache.get(str(morph_file)) is morph
+        assert morph.morph_as_hoc() == MorphIOWrapper(morph_file).morph_as_hoc()
+
+        # The least recently used morphologies are evicted to stay within budget
+        sizes = [MorphologyCache.get(f).nbytes for f in other_files]
+        MorphologyCache.clear()
+        MorphologyCache.max_bytes = morph.nbytes + max(sizes)
+        MorphologyCache.get(morph_file)
+        MorphologyCache.get(other_files[0])
+        MorphologyCache.get(morph_file)
+        MorphologyCache.get(other_files[1])
+        assert [path for path, _ in MorphologyCache._entries] == [
+            str(morph_file),
+            str(other_files[1]),
+        ]
+        assert MorphologyCache._size <= MorphologyCache.max_bytes
+        # Morphologies over the budget are not cached
+        MorphologyCache.get(big_file)
+        assert len(MorphologyCache._entries) == 2
+
+    assert not MorphologyCache._entries
+    assert MorphologyCache.max_bytes == 0
+
+
+def _cell_geometry(cell):
+    return [
+        (
+            sec.name().split(".", 1)[1],
+            [(sec.x3d(i), sec.y3d(i), sec.z3d(i), sec.diam3d(i)) for i in range(sec.n3d())],
+            sec.parentseg() and (sec.parentseg().sec.name().split(".", 1)[1], sec.parentseg().x),
+            sec.orientation(),
+            sec.nseg,
+        )
+        for sec in cell.all
+    ]
+
+
+def test_instantiate():
+    """Check that sections built directly from the MorphIO arrays are identical to those
+    created by the hoc commands
+    """
+    from neurodamus.core import NeuronWrapper as Nd
+
+    morph_file = NGV_DIR / "morphologies" / "h5" / "glia.h5"
+    asc_file = USECASE3 / "CircuitA" / "morphologies" / "asc" / "C210401C.asc"
+
+    for i, file in enumerate((morph_file, asc_file)):
+        morph = MorphIOWrapper(file)
+        hoc_cell = Nd.Cell(i)
+        hoc_cell.AddHocMorph(morph.morph_as_hoc())
+        cell = Nd.Cell(i)
+        morph.instantiate(cell)
+        cell.indexSections()
+        cell.geom_nsec()
+        assert _cell_geometry(cell) == _cell_geometry(hoc_cell)
+        assert len(cell.basal) == len(hoc_cell.basal)
+
+    # As loaded by the emodel templates
+    hoc_cell = Nd.Cell(0)
+    hoc_cell.AddHocMorph(MorphIOWrapper(morph_file).morph_as_hoc())
+    cell = Nd.Cell(0)
+    Nd.morphio_read(cell, str(morph_file))
+    cell.indexSections()
+    cell.geom_nsec()
+    assert _cell_geometry(cell) == _cell_geometry(hoc_cell)
+
+
+def test_round_significant_8():
+    values = np.float32([0, -0.0, 1e-6, 1e-5, 0.1, 12.345678, -1234.40625, 99999999.5, 3e9])
+    expected = [float(f"{v:.8g}") for v in values.tolist()]
+    assert round_significant_8(values).tolist() == expected
+
+
+def test_morphology_read_ahead(monkeypatch):
+    read_files = []
+    monkeypatch.setattr(MorphologyReadAhead, "_read_file", read_files.append)
+    files = ["a.h5", "b.h5", "a.h5", "c.h5", "d.h5"]
+
+    with MorphologyReadAhead(files, workers=0, depth=2) as read_ahead:
+        read_ahead.advance(0)
+    assert not read_files
+
+    with MorphologyReadAhead(files, workers=1, depth=2) as read_ahead:
+        read_ahead.advance(0)
+        read_ahead._executor.submit(lambda: None).result()  # wait previous reads
+        assert read_files == ["a.h5", "b.h5"]
+        read_ahead.advance(1)
+        read_ahead.advance(2)
+        read_ahead._executor.submit(lambda: None).result()
+    assert read_files == ["a.h5", "b.h5", "c.h5"]
+
+    # Files are actually read
+    morph_file = NGV_DIR / "morphologies" / "h5" / "glia.h5"
+    monkeypatch.undo()
+    with MorphologyReadAhead([morph_file], workers=1) as read_ahead:
+        read_ahead.advance(0)
+        assert read_ahead._executor.submit(lambda: None).result() is None
+
+
+def test_morphology_read_ahead_missing_file(caplog, tmp_path):
+    missing_file = tmp_path / "missing.h5"
+    with caplog.at_level(logging.DEBUG), MorphologyReadAhead([missing_file], workers=1) as ra:
+        ra.advance(0)
+    assert f"read-ahead of {missing_file} failed" in caplog.text
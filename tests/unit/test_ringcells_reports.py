@@ -1,3 +1,4 @@
+import contextlib
 from pathlib import Path
 
 import pytest
@@ -11,6 +12,7 @@ from tests.utils import (read_ascii_report,
                          record_compartment_reports, write_ascii_reports)
 
 import numpy as np
+import numpy.testing as npt
 from scipy.signal import find_peaks
 
 
@@ -453,3 +455,63 @@ def test_enable_coreneuron_report(create_tmp_simulation_config_file):
     n = Neurodamus(create_tmp_simulation_config_file)
     assert len(n.reports) == 1
     assert Path(CoreConfig.report_config_file_save).exists()
+
+
+def test_point_process_index():
+    from neurodamus.core import NeuronWrapper as Nd
+    from neurodamus.report import PointProcessIndex, Report
+
+    sec = Nd.h.Section(name="pp_index_sec")
+    sec.nseg = 3
+    pps = [Nd.h.ExpSyn(sec(x)) for x in (0.9, 0.5, 0.1, 0.5)] + [Nd.h.IClamp(sec(0.5))]
+
+    def scan(x, mechanism):
+        return [pp for pp in Report.get_point_processes(sec, mechanism)
+                if Report.is_point_process_at_location(pp, sec, x)]
+
+    for enabled in (False, True):
+        ctx = PointProcessIndex.enabled() if enabled else contextlib.nullcontext()
+        with ctx:
+            for x in (0.1, 0.5, 0.9):
+                for mechanism in ("ExpSyn", "IClamp", None):
+                    assert PointProcessIndex.at_location(sec, x, mechanism) == scan(x, mechanism)
+            at_center = PointProcessIndex.at_location(sec, 0.5, "ExpSyn")
+            assert {pp.hname() for pp in at_center} == {pps[1].hname(), pps[3].hname()}
+            assert PointProcessIndex.has_mechanism(sec, "IClamp")
+            assert not PointProcessIndex.has_mechanism(sec, "pas")
+            assert len(Report.get_var_refs(sec, 0.5, "ExpSyn", "i")) == 2
+            assert len(Report.get_var_refs(sec, 0.5, "v", "v")) == 1
+    assert PointProcessIndex._sections is None
+
+
+def test_alu_slot_summation():
+    """A single ALU summing into an output vector matches one ALU per compartment"""
+    from neurodamus.core import NeuronWrapper as Nd
+
+    Nd.init()
+    sec = Nd.h.Section(name="alu_sec")
+    sec.nseg = 3
+    clamps = []
+    for x, amp in ((0.1, 0.1), (0.5, 0.2), (0.5, 0.3), (0.9, 0.4)):
+        clamp = Nd.h.IClamp(sec(x))
+        clamp.dur = 1e9
+        clamp.amp = amp
+        clamps.append((int(x * sec.nseg), clamp))
+
+    alu = Nd.ALU(sec(0.5), 0.1)
+    outputs = Nd.Vector(sec.nseg)
+    alu.setoutputs(outputs)
+    single_alus = []
+    for slot in range(sec.nseg):
+        single_alu = Nd.ALU(sec(0.5), 0.1)
+        single_alu.setop("summation")
+        single_alus.append(single_alu)
+        for compartment, clamp in clamps:
+            if compartment == slot:
+                alu.addvar(clamp._ref_i, -1.0, slot)
+                single_alu.addvar(clamp._ref_i, -1.0)
+
+    Nd.h.finitialize(-65)
+    Nd.h.continuerun(1)
+    npt.assert_allclose(outputs.as_numpy(), [-0.1, -0.5, -0.4])
+    npt.assert_array_equal(outputs.as_numpy(), [a.output for a in single_alus])
@@ -1,3 +1,4 @@
+import shutil
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -104,3 +105,189 @@ def test_conn_manager_syn_stats():
     assert total_synapses == total_synapses_metype_x + additional_synapses
     assert stats.metype_cell_syn_average["metype-x"] == 2
     assert stats.metype_cell_syn_average["metype-y"] == 2
+
+
+def test_partition_by_gid():
+    from neurodamus.io.synapse_reader import _partition_by_gid
+
+    gids, order, offsets = _partition_by_gid(np.array([3, 3, 5, 7, 7, 7]))
+    assert gids == [3, 5, 7]
+    assert order is None
+    npt.assert_array_equal(offsets, [0, 2, 3, 6])
+
+    lookup_gids = np.array([1, 0, 1, 0, 2], dtype="uint64")
+    gids, order, offsets = _partition_by_gid(lookup_gids)
+    assert gids == [0, 1, 2]
+    npt.assert_array_equal(order, [1, 3, 0, 2, 4])  # stable: keeps edge order within a gid
+    npt.assert_array_equal(offsets, [0, 2, 4, 5])
+
+    gids, order, offsets = _partition_by_gid(np.array([], dtype="uint64"))
+    assert gids == []
+    npt.assert_array_equal(offsets, [0])
+
+
+def test_preload_unsorted_edges():
+    """Edges are not sorted by target gid: (src->tgt) 0->0, 1->1, 1->0, 1->1"""
+    sonata_file = SIM_DIR / "usecase3/edges_AB.h5"
+    reader = SonataReader(sonata_file, "NodeA__NodeB__chemical")
+    reader._preload_data_chunk([0, 1, 6])
+    npt.assert_array_equal(reader.get_property(0, "synapse_index"), [0, 2])
+    npt.assert_array_equal(reader.get_property(1, "synapse_index"), [1, 3])
+    npt.assert_array_equal(reader.get_property(0, "sgid"), [0, 1])
+    npt.assert_array_equal(reader.get_property(1, "sgid"), [1, 1])
+    assert len(reader.get_synapse_parameters(6)) == 0
+
+    # minimal mode reads the first synapse of every gid
+    reader = SonataReader(sonata_file, "NodeA__NodeB__chemical")
+    reader._preload_data_chunk([0, 1], minimal_mode=True)
+    npt.assert_array_equal(reader.get_property(0, "synapse_index"), [0])
+    npt.assert_array_equal(reader.get_property(1, "synapse_index"), [1])
+
+
+def test_synapse_parameters_views_and_release():
+    sonata_file = SIM_DIR / "usecase3/edges_AB.h5"
+    reader = SonataReader(sonata_file, "NodeA__NodeB__chemical")
+    reader._preload_data_chunk([0, 1])
+    params_0 = reader.get_synapse_parameters(0)
+    params_1 = reader.get_synapse_parameters(1)
+    # Both gids were loaded in the same chunk: their parameters share the same buffer
+    assert params_0.base is params_1.base
+    npt.assert_array_equal(params_0.sgid, [0, 1])
+    npt.assert_allclose(params_0.offset, [0.05009833, 0.44632703])
+    npt.assert_allclose(params_1.offset, [0.4517869, 0.8473429])
+
+    reader.release(0)
+    assert 0 not in reader._gid_index
+    npt.assert_array_equal(params_0.sgid, [0, 1])  # views remain valid
+    reloaded = reader.get_synapse_parameters(0)  # read again from the file
+    npt.assert_array_equal(reloaded, params_0)
+    assert reloaded.base is not params_0.base
+
+
+def test_preload_extra_fields_existing_chunk():
+    sonata_file = SIM_DIR / "usecase3/edges_AB.h5"
+    reader = SonataReader(sonata_file, "NodeA__NodeB__chemical")
+    reader._preload_data_chunk([0, 1])
+    assert "spine_length" not in reader.get_synapse_parameters(0).dtype.names
+
+    # Extra fields are added to the data of gids loaded previously
+    reader._extra_fields = {"spine_length", "efferent_section_pos"}
+    reader._preload_data_chunk([0, 1])
+    population = reader._population
+    for gid in (0, 1):
+        params = reader.get_synapse_parameters(gid)
+        edge_ids = reader.get_property(gid, "synapse_index")
+        for field in ("spine_length", "efferent_section_pos"):
+            expected = [population.get_attribute(field, [int(i)])[0] for i in edge_ids]
+            npt.assert_allclose(params[field], expected)
+
+
+def test_prefetch_bounded_chunks():
+    sonata_file = SIM_DIR / "usecase3/edges_AB.h5"
+    expected = SonataReader(sonata_file, "NodeA__NodeB__chemical")
+    expected._preload_data_chunk([0, 1, 6])
+
+    reader = SonataReader(sonata_file, "NodeA__NodeB__chemical")
+    reader.preload_data([6, 1, 0], prefetch_chunk_size=1)
+    assert len(reader._prefetch_plan) == 3
+    assert not reader._gid_index  # chunks are only read when requested
+
+    for gid in (6, 1, 0):
+        npt.assert_array_equal(
+            reader.get_synapse_parameters(gid), expected.get_synapse_parameters(gid)
+        )
+        assert gid in reader._gid_index
+        assert len(reader._prefetched) <= reader.PREFETCH_MAX_CHUNKS
+    assert 6 not in reader._gid_index  # oldest chunk was evicted
+
+    reader.finish_prefetch()
+    assert not reader._prefetch_plan
+    assert not reader._gid_index
+
+    # gids loaded beforehand don't stall the prefetching of the following chunks
+    reader.preload_data([0, 1, 6], prefetch_chunk_size=1)
+    reader.get_synapse_parameters(1)
+    assert len(reader._prefetch_plan) == 1
+    reader.finish_prefetch()
+    assert not reader._prefetch_pending
+
+
+def test_prefetch_async():
+    sonata_file = SIM_DIR / "usecase3/edges_AB.h5"
+    expected = SonataReader(sonata_file, "NodeA__NodeB__chemical")
+    expected._preload_data_chunk([0, 1, 6])
+
+    reader = SonataReader(sonata_file, "NodeA__NodeB__chemical")
+    reader.preload_data([0, 6, 1], prefetch_chunk_size=1, prefetch_async=True)
+    assert reader._prefetch_inflight[0] == {0}  # the first chunk is being read
+    assert reader.get_counts([0, 1]) == expected.get_counts([0, 1])  # waits for the read
+    assert reader._prefetch_inflight[2].done()
+
+    for gid in (0, 6, 1):
+        npt.assert_array_equal(
+            reader.get_synapse_parameters(gid), expected.get_synapse_parameters(gid)
+        )
+        # The chunk in memory plus the one being read
+        assert len(reader._prefetched) < reader.PREFETCH_MAX_CHUNKS
+
+    reader.finish_prefetch()
+    assert reader._prefetch_inflight is None
+    assert reader._prefetch_executor is None
+    assert not reader._gid_index
+
+
+def test_shared_edge_index(monkeypatch, tmp_path):
+    sonata_file = SIM_DIR / "usecase3/edges_AB.h5"
+    expected = SonataReader(sonata_file, "NodeA__NodeB__chemical")
+    expected._preload_data_chunk([0, 1, 6])
+
+    shmdir = Path("/dev/shm") / tmp_path.name
+    monkeypatch.setenv("SHMDIR", str(shmdir))
+    reader = SonataReader(sonata_file, "NodeA__NodeB__chemical", shared_index=True)
+    assert isinstance(reader._edge_index["node_id_to_ranges"], np.memmap)
+    assert not list(shmdir.glob("**/*.npy"))  # files are removed once mapped
+
+    # Edges are not sorted by target: both ranges of each node are found
+    edge_ids, lookup_gids = reader._get_edge_and_lookup_gids(np.array([0, 1]))
+    npt.assert_array_equal(edge_ids.flatten(), [0, 1, 2, 3])
+    npt.assert_array_equal(lookup_gids, [0, 1, 0, 1])
+
+    reader._preload_data_chunk([0, 1, 6])
+    for gid in (0, 1, 6):
+        npt.assert_array_equal(
+            reader.get_synapse_parameters(gid), expected.get_synapse_parameters(gid)
+        )
+    assert reader.get_conn_counts([0, 1]) == expected.get_conn_counts([0, 1])
+    shutil.rmtree(shmdir)
+
+
+def test_synapse_params_cache(tmp_path):
+    sonata_file = SIM_DIR / "usecase3/edges_AB.h5"
+    gids = [6, 1, 0, 100]  # 100 has no edges
+    expected = SonataReader(sonata_file, "NodeA__NodeB__chemical")
+    expected._preload_data_chunk(gids)
+
+    # First load writes the cache, next ones are memory-mapped from it
+    for _ in range(2):
+        reader = SonataReader(
+            sonata_file, "NodeA__NodeB__chemical", params_cache_dir=str(tmp_path)
+        )
+        reader.preload_data(gids)
+        assert len(list(tmp_path.glob("*.npy"))) == 3
+        for gid in gids:
+            syn_params = reader.get_synapse_parameters(gid)
+            npt.assert_array_equal(syn_params, expected.get_synapse_parameters(gid))
+            assert isinstance(syn_params, np.recarray)
+            if len(syn_params):
+                npt.assert_array_equal(
+                    reader.get_property(gid, "synapse_index"),
+                    expected.get_property(gid, "synapse_index"),
+                )
+        assert isinstance(reader._gid_index[0][0].syn_params.base, np.memmap)
+
+    # A different gid partition or settings make a new cache entry
+    reader.preload_data(gids[:2])
+    reader._ca_concentration = 1.2
+    reader.preload_data(gids)
+    assert len(list(tmp_path.glob("*.npy"))) == 9
+    assert reader.get_synapse_parameters(0).U[0] != expected.get_synapse_parameters(0).U[0]
@@ -1,6 +1,7 @@
 import pytest
 import libsonata
 import numpy as np
+import numpy.testing as npt
 Sections = libsonata.SimulationConfig.Report.Sections
 Compartments = libsonata.SimulationConfig.Report.Compartments
 
@@ -106,3 +107,92 @@ def test_get_point_list_invalid_section_local_ids(create_tmp_simulation_config_f
             section_type=Sections.all,
             section_local_ids=[0],
         )
+
+
+@pytest.mark.parametrize(
+    "create_tmp_simulation_config_file",
+    [{"simconfig_fixture": "ringtest_baseconfig"}],
+    indirect=True,
+)
+def test_locations_to_points(create_tmp_simulation_config_file):
+    from neurodamus import Neurodamus
+
+    n = Neurodamus(create_tmp_simulation_config_file, disable_reports=True)
+    target_manager = n.target_manager
+
+    def ref_location(sec, ipt, offset):
+        # point + offset location, computed by hand
+        offset = max(offset, 0)
+        if sec.orientation() == 1:
+            ipt = sec.n3d() - 1 - ipt
+            offset = -offset
+        distance = 0.5
+        if ipt < sec.n3d():
+            distance = min(max((sec.arc3d(ipt) + offset) / sec.L, 0.0000001), 0.9999999)
+        return 1 - distance if sec.orientation() == 1 else distance
+
+    isecs = np.array([0, 1, 2, 1, 2, 1, 0])
+    ipts = np.array([-1, -1, 0, 1, 1, 100, -1])
+    offsets = np.array([0.3, 2.0, 1.5, 0.2, -1.0, 0.0, 0.7])
+    sections, xs = target_manager.locations_to_points(0, isecs, ipts, offsets)
+    cell_sections = target_manager.gid_to_sections(0)
+    assert [sec.sec.name() for sec in sections] == [
+        cell_sections.isec2sec[isec].sec.name() for isec in isecs
+    ]
+    npt.assert_allclose(xs[[0, 1, 6]], [0.3, 0.9999999, 0.7])
+    for i in (2, 3, 4, 5):
+        sec = sections[i].sec
+        assert sec.n3d() > 1
+        assert xs[i] == ref_location(sec, ipts[i], offsets[i])
+
+    # The single location api gives the same results
+    for isec, ipt, offset, x in zip(isecs, ipts, offsets, xs, strict=True):
+        point = target_manager.location_to_point(0, isec, ipt, offset)
+        assert point.sclst_ids == [isec]
+        assert point.x == [x]
+
+    with pytest.raises(Exception, match="out of bounds"):
+        target_manager.locations_to_points(0, [100], [-1], [0.5])
+
+    # Geometry tables match hoc
+    geometry = cell_sections.geometry
+    for isec, sec_ref in enumerate(cell_sections.isec2sec):
+        sec = sec_ref.sec
+        assert geometry.n3d[isec] == sec.n3d()
+        assert geometry.nseg[isec] == sec.nseg
+        assert geometry.length[isec] == sec.L
+        start, end = geometry.arc3d_offsets[isec : isec + 2]
+        npt.assert_array_equal(geometry.arc3d[start:end], [sec.arc3d(i) for i in range(sec.n3d())])
+    expected_segments = [int(x * geometry.nseg[i]) for i, x in zip(isecs, xs, strict=True)]
+    npt.assert_array_equal(geometry.segment_indexes(isecs, xs), expected_segments)
+
+
+@pytest.mark.parametrize(
+    "create_tmp_simulation_config_file",
+    [{"simconfig_fixture": "ringtest_baseconfig"}],
+    indirect=True,
+)
+def test_get_point_list_all_segments(create_tmp_simulation_config_file):
+    """Points built in bulk match iterating over the cell segments"""
+    from neurodamus import Neurodamus
+
+    n = Neurodamus(create_tmp_simulation_config_file, disable_reports=True)
+    tgt = n.target_manager.get_target("RingA")
+    cell_manager = n.circuits.get_node_manager("RingA")
+    for sec in cell_manager.get_cell(1).CellRef.all:
+        sec.nseg = 7
+
+    pts = tgt.get_point_list(cell_manager, Sections.all, Compartments.all)
+    for pt in pts:
+        cell = cell_manager.get_cell(pt.gid)
+        expected = [(cell.get_section_id(sec), sec.name(), seg.x)
+                    for sec in cell.CellRef.all for seg in sec]
+        assert len(pt) == len(expected)
+        assert [(i, sec.name(), x) for i, sec, x in zip(pt.sclst_ids, pt.sections, pt.x)] \
+            == expected
+        # section references are only created on demand, one per section
+        assert [sc.sec.name() for sc in pt.sclst] == [name for _, name, _ in expected]
+        assert pt.sclst[1] is pt.sclst[2]
+        pt.append(0, pt.sclst[0], 0.1)
+        assert len(pt) == len(expected) + 1
+        assert pt.sections[-1].name() == expected[0][1]